@@ -0,0 +1,40 @@
+import argparse
+import json
+import sys
+from dlgo import benchmark
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the board engines, and compare against a baseline.')
+    parser.add_argument('--engines', nargs='+', default=list(benchmark.ENGINES), choices=list(benchmark.ENGINES))
+    parser.add_argument('--sizes', nargs='+', type=int, default=list(benchmark.BOARD_SIZES))
+    parser.add_argument('--suites', nargs='+', default=list(benchmark.SUITES), choices=list(benchmark.SUITES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write the results to this JSON file instead of stdout')
+    parser.add_argument('--baseline', help='JSON file of an earlier run to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.1, help='allowed slowdown as a fraction, default 0.1')
+    parser.add_argument('--instrument', action='store_true', help='also report hot-path counters of a random game')
+    args = parser.parse_args()
+
+    run = benchmark.run_suite(
+        args.engines, tuple(args.sizes), args.repeat, args.seed,
+        progress=lambda name: print(f'running {name}', file=sys.stderr), instrumented=args.instrument,
+        suites=args.suites,
+    )
+    if args.output:
+        benchmark.dump(run, args.output)
+    else:
+        print(json.dumps(run, indent=2, sort_keys=True))
+
+    if args.baseline:
+        regressions = benchmark.compare(run, benchmark.load(args.baseline), args.tolerance)
+        for regression in regressions:
+            print(f'REGRESSION {regression.benchmark} {regression.metric}: {regression.baseline:.2f} -> '
+                  f'{regression.value:.2f} ({regression.change:+.1%})', file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
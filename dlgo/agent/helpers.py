@@ -1,5 +1,7 @@
+import numpy as np
 from dlgo.gotypes import Point
 from dlgo.goboard_slow import Board, Point, Player
+from dlgo.patterns import EMPTY, OFF_BOARD
 
 """
 In the context of Go, an eye can be defined as a single unoccupied space in a GoString where it is impossible
@@ -12,24 +14,55 @@ at least one liberty, and it is impossible to place a stone to remove that liber
 
 def is_point_an_eye(board: Board, point: Point, color: Player) -> bool:
     # if occupied, trivially not an eye.
-    if board.get_go_string(point) is not None:
+    if board.is_point_occupied(point):
         return False
 
     # all immediate neighbors of the point must contain friendly stones
-    for neighbor in point.neighbors():
-        if board.is_on_grid(neighbor) and board.get_player(neighbor) != color:
+    for neighbor in board.neighbors(point):
+        if board.get_player(neighbor) != color:
             return False
 
+    # the on-board corners, from the board's table. Every other corner is off the board.
+    corners = board.corners(point)
     friendly_corners = 0
-    off_board_corners = 0
-
-    for corner in point.corners():
-        if board.is_on_grid(corner):
-            if board.get_player(corner) == color:
-                friendly_corners += 1
-        else:
-            off_board_corners += 1
-
-        if off_board_corners > 0:
-            return off_board_corners + friendly_corners == 4
-        return friendly_corners >= 3
+    for corner in corners:
+        if board.get_player(corner) == color:
+            friendly_corners += 1
+    off_board_corners = 4 - len(corners)
+
+    if off_board_corners > 0:
+        return off_board_corners + friendly_corners == 4
+    return friendly_corners >= 3
+
+
+def _stone_plane(board: Board) -> np.ndarray:
+    # the board as a (num_rows + 2, num_cols + 2) array of Player values, EMPTY for empty points and OFF_BOARD around
+    # it, straight from the board's colors() (see gotypes.color_table)
+    return np.frombuffer(board.colors(), dtype=np.uint8).reshape(board.num_rows + 2, board.num_cols + 2)
+
+
+def eye_mask(board: Board, color: Player) -> np.ndarray:
+    """
+    is_point_an_eye for every point of the board at once: a (num_rows, num_cols) boolean array, where
+    mask[row - 1, col - 1] says whether Point(row, col) is an eye of color. The stones are read once, and the neighbor
+    and corner checks are done on shifted views of the padded stone plane, so off-board points need no special casing.
+    """
+    plane = _stone_plane(board)
+    friendly = plane == color.value
+    off_board = plane == OFF_BOARD
+
+    def shifted(array: np.ndarray, d_row: int, d_col: int) -> np.ndarray:
+        # the value of the point at (row + d_row, col + d_col) for every on-board point
+        return array[1 + d_row:array.shape[0] - 1 + d_row, 1 + d_col:array.shape[1] - 1 + d_col]
+
+    mask = shifted(plane, 0, 0) == EMPTY
+    for d_row, d_col in ((-1, 0), (1, 0), (0, -1), (0, 1)):
+        mask &= shifted(friendly | off_board, d_row, d_col)
+
+    diagonals = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+    friendly_corners = sum(shifted(friendly, d_row, d_col).astype(np.int8) for d_row, d_col in diagonals)
+    off_board_corners = sum(shifted(off_board, d_row, d_col).astype(np.int8) for d_row, d_col in diagonals)
+
+    # on the edge every on-board corner must be friendly, in the middle one of the four may be taken by the opponent
+    mask &= np.where(off_board_corners > 0, friendly_corners + off_board_corners == 4, friendly_corners >= 3)
+    return mask
@@ -0,0 +1,214 @@
+from __future__ import annotations
+import math
+import time
+from array import array
+from dlgo.agent.base import Agent
+from dlgo.agent.naive import NaiveAgent
+from dlgo.goboard import GameState, Move
+from dlgo.gotypes import Player
+from dlgo.scoring import compute_game_result
+
+"""
+A Monte Carlo tree search agent. Every call to select_move grows a search tree from the current GameState: a node is
+selected by walking down the tree with the UCT formula, one untried move of it is expanded into a new node, a random
+game is played out from there and the winner is recorded in every node on the path back to the root. The move played
+is the root's most visited child.
+
+Node statistics live in parallel arrays indexed by node number (visit counts, wins and parent links); the GameState,
+move, children and untried moves of each node are kept in plain lists next to them. The subtree under the move that
+was played and the opponent's reply is kept for the next call, compacted to the front of the arrays.
+
+Random playouts use NaiveAgent, so they go through GameState.apply_move and GameState.is_valid_move like any other
+game. Playouts that run too long are cut off and scored as they stand, with dlgo.scoring's area scoring.
+"""
+
+_ROOT = 0
+_NO_PARENT = -1
+
+
+def _state_key(game_state: GameState) -> tuple[int, int]:
+    # identifies a position well enough to recognize it when it is passed to select_move again
+    return game_state.situation_hash(include_ko=True, include_passes=True), len(game_state.previous_states)
+
+
+class MCTSAgent(Agent):
+    def __init__(self, num_playouts: int = 1000, time_budget: float | None = None, exploration: float = 1.4,
+                 komi: float = 7.5, reuse_tree: bool = True, max_playout_moves: int | None = None) -> None:
+        """
+        Every move runs num_playouts playouts or, if time_budget is given, as many as fit into time_budget seconds.
+        Playouts are cut off after max_playout_moves moves, twice the number of points on the board by default.
+        """
+        super().__init__()
+        self.num_playouts = num_playouts
+        self.time_budget = time_budget
+        self.exploration = exploration
+        self.komi = komi
+        self.reuse_tree = reuse_tree
+        self.max_playout_moves = max_playout_moves
+        self._rollout_agent = NaiveAgent(sample=True)
+
+        # statistics of the last call to select_move
+        self.playouts = 0
+        self.seconds = 0.0
+        self.reused_nodes = 0
+
+        self._clear()
+
+    def _clear(self) -> None:
+        self._visits = array('l')
+        # wins of the player who made the move leading to the node
+        self._wins = array('d')
+        self._parents = array('l')
+        self._states: list[GameState] = []
+        self._moves: list[Move | None] = []
+        self._children: list[list[int]] = []
+        self._untried: list[list[Move]] = []
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self._visits)
+
+    @property
+    def playouts_per_second(self) -> float:
+        return self.playouts / self.seconds if self.seconds > 0 else 0.0
+
+    def _add_node(self, game_state: GameState, move: Move | None, parent: int) -> int:
+        node = len(self._visits)
+        self._visits.append(0)
+        self._wins.append(0.0)
+        self._parents.append(parent)
+        self._states.append(game_state)
+        self._moves.append(move)
+        self._children.append([])
+        # resigning is never worth searching
+        self._untried.append([legal_move for legal_move in game_state.legal_moves() if not legal_move.is_resign])
+        if parent != _NO_PARENT:
+            self._children[parent].append(node)
+        return node
+
+    def _find_reusable(self, game_state: GameState) -> int | None:
+        # the node for game_state among the root's children and grandchildren, i.e. after our move and a reply
+        if not self._visits:
+            return None
+        key = _state_key(game_state)
+        candidates = [_ROOT]
+        for child in self._children[_ROOT]:
+            candidates.append(child)
+            candidates.extend(self._children[child])
+        for node in candidates:
+            if _state_key(self._states[node]) == key:
+                return node
+        return None
+
+    def _keep_subtree(self, root: int) -> None:
+        # compacts the subtree under root to the front of the node arrays, with root as the new root
+        visits, wins, parents = self._visits, self._wins, self._parents
+        states, children, untried = self._states, self._children, self._untried
+        moves = self._moves
+        self._clear()
+
+        order = [root]
+        for node in order:
+            order.extend(children[node])
+        new_index = {node: index for index, node in enumerate(order)}
+
+        for node in order:
+            self._visits.append(visits[node])
+            self._wins.append(wins[node])
+            self._parents.append(_NO_PARENT if node == root else new_index[parents[node]])
+            self._states.append(states[node])
+            self._moves.append(None if node == root else moves[node])
+            self._children.append([new_index[child] for child in children[node]])
+            self._untried.append(untried[node])
+
+    def _select_child(self, node: int) -> int:
+        visits, wins = self._visits, self._wins
+        log_visits = math.log(visits[node])
+        best_child = -1
+        best_score = -1.0
+        for child in self._children[node]:
+            child_visits = visits[child]
+            score = wins[child] / child_visits + self.exploration * math.sqrt(log_visits / child_visits)
+            if score > best_score:
+                best_child = child
+                best_score = score
+        return best_child
+
+    def _playout(self, game_state: GameState) -> Player | None:
+        board = game_state.board
+        max_moves = self.max_playout_moves
+        if max_moves is None:
+            max_moves = 2 * board.num_rows * board.num_cols
+
+        num_moves = 0
+        while not game_state.is_over() and num_moves < max_moves:
+            game_state = game_state.apply_move(self._rollout_agent.select_move(game_state))
+            num_moves += 1
+        return compute_game_result(game_state, self.komi).winner
+
+    def _run_playout(self) -> None:
+        # selection
+        node = _ROOT
+        while not self._untried[node] and self._children[node]:
+            node = self._select_child(node)
+
+        # expansion
+        if self._untried[node]:
+            moves = self._untried[node]
+            move = moves.pop()
+            node = self._add_node(self._states[node].apply_move(move), move, node)
+
+        # simulation
+        winner = self._playout(self._states[node])
+
+        # backpropagation
+        while node != _NO_PARENT:
+            self._visits[node] += 1
+            if winner is None:
+                # a draw is half a win for both sides
+                self._wins[node] += 0.5
+            elif self._states[node].next_player != winner:
+                self._wins[node] += 1
+            node = self._parents[node]
+
+    def select_move(self, game_state: GameState) -> Move:
+        start = time.perf_counter()
+
+        reusable = self._find_reusable(game_state) if self.reuse_tree else None
+        if reusable is None:
+            self._clear()
+            self._add_node(game_state, None, _NO_PARENT)
+            self.reused_nodes = 0
+        else:
+            self._keep_subtree(reusable)
+            self.reused_nodes = self.num_nodes
+
+        self.playouts = 0
+        if self.time_budget is None:
+            while self.playouts < self.num_playouts:
+                self._run_playout()
+                self.playouts += 1
+        else:
+            deadline = start + self.time_budget
+            while self.playouts == 0 or time.perf_counter() < deadline:
+                self._run_playout()
+                self.playouts += 1
+        self.seconds = time.perf_counter() - start
+
+        children = self._children[_ROOT]
+        if not children:
+            return Move.pass_turn()
+        best_child = max(children, key=lambda child: self._visits[child])
+        best_move = self._moves[best_child]
+        if not self.reuse_tree:
+            self._clear()
+        return best_move
+
+    def stats(self) -> dict[str, float]:
+        return {
+            'playouts': self.playouts,
+            'seconds': self.seconds,
+            'playouts_per_second': self.playouts_per_second,
+            'nodes': self.num_nodes,
+            'reused_nodes': self.reused_nodes,
+        }
@@ -1,29 +1,72 @@
 from dlgo.agent.base import Agent
 from dlgo.goboard import GameState, Move, Point
-from dlgo.agent.helpers import is_point_an_eye
-from random import choice
+from dlgo.agent.helpers import eye_mask, is_point_an_eye
+from random import choice, randrange
 
 """
 The absolute worst GoAI imaginable. It selects random valid moves from the GoBoard that don't
 fill in an eye, and plays these moves. If there are no available moves, it passes.
+
+By default, moves are picked by sampling: a random empty point is drawn and checked, and only if it is not a valid
+non-eye move is it discarded and another point drawn. A move usually costs a single legality check instead of one per
+point of the board, which is what makes random playouts cheap. The result is the same uniform choice among all
+valid non-eye points that NaiveAgent(sample=False) makes by checking every legal move first.
+
+Points are drawn straight from the board's empty point list, without copying it. Only after _MAX_DRAWS rejections, as
+happens late in a game when most empty points are eyes, are the remaining candidates copied and drawn without
+replacement, so that every point is checked at most once more.
 """
 
+_MAX_DRAWS = 8
+
 
 class NaiveAgent(Agent):
-    def __init__(self) -> None:
+    def __init__(self, sample: bool = True) -> None:
         super().__init__()
+        self.sample = sample
 
     def select_move(self, game_state: GameState) -> Move:
+        if self.sample:
+            return self._sample_move(game_state)
+
+        eyes = eye_mask(game_state.board, game_state.next_player)
         potential_moves: list[Point] = []
-        for row in range(1, game_state.board.num_rows + 1):
-            for col in range(1, game_state.board.num_cols + 1):
-                move = Move.play(Point(row, col))
-                if not game_state.is_valid_move(move):
-                    continue
-                if not is_point_an_eye(game_state.board, Point(row, col), game_state.next_player):
-                    potential_moves.append(move.point)
+        for move in game_state.legal_moves():
+            if not move.is_play:
+                continue
+            if not eyes[move.point.row - 1, move.point.col - 1]:
+                potential_moves.append(move.point)
 
         if len(potential_moves) > 0:
             return Move.play(choice(potential_moves))
         else:
             return Move.pass_turn()
+
+    def _sample_move(self, game_state: GameState) -> Move:
+        board = game_state.board
+        player = game_state.next_player
+        empty_points = board.empty_points()
+        num_empty = len(empty_points)
+
+        # drawing with replacement and rejecting invalid points keeps the choice uniform among valid points
+        for _ in range(min(num_empty, _MAX_DRAWS)):
+            point = empty_points[randrange(num_empty)]
+            move = Move.play(point)
+            if game_state.is_valid_move(move) and not is_point_an_eye(board, point, player):
+                return move
+
+        # rejected candidates are swapped to the end of the copy and never drawn again
+        candidates = list(empty_points)
+        num_candidates = len(candidates)
+
+        while num_candidates > 0:
+            position = randrange(num_candidates)
+            point = candidates[position]
+            move = Move.play(point)
+            if game_state.is_valid_move(move) and not is_point_an_eye(board, point, player):
+                return move
+
+            num_candidates -= 1
+            candidates[position] = candidates[num_candidates]
+
+        return Move.pass_turn()
@@ -0,0 +1,263 @@
+from __future__ import annotations
+import mmap
+import os
+import struct
+from collections import namedtuple
+from typing import Iterable, Iterator
+import numpy as np
+from dlgo import goboard, sgf
+from dlgo.goboard import Move
+from dlgo.gotypes import Player, Point
+
+__all__ = ['GameArchive', 'ArchiveWriter', 'ArchiveGame', 'convert_sgf', 'INDEX_DTYPE', 'PASS', 'RESIGN']
+
+"""
+A compact binary format for large game collections, read through mmap so that opening an archive costs nothing and
+any game can be reached directly.
+
+Layout, all little-endian:
+
+    header      64 bytes: magic, version, number of games, offset of the index
+    moves       per game: its black setup stones, its white setup stones and its moves, back to back
+    index       one INDEX_DTYPE record per game: where its data starts, how many setup stones and moves it has, board
+                size, bytes per move, winner, first player and komi
+
+Every point is stored as its index on its own board, (row - 1) * board_size + (col - 1), in one byte on boards up to
+15x15 and in two bytes on larger boards. The largest values of each width stand for a pass and a resignation. Moves
+alternate between the players starting with the first player, so a move by the player who is not to move (as SGF
+allows) is stored with a pass in front of it.
+
+GameArchive.moves(k) and the index are NumPy arrays that look straight into the mapped file without copying it.
+"""
+
+MAGIC = b'DLGOARC1'
+VERSION = 1
+
+# magic, version, number of games, offset of the index
+_HEADER = struct.Struct('<8sHxxxxxxQQ')
+HEADER_SIZE = 64
+
+INDEX_DTYPE = np.dtype([
+    ('offset', '<u8'),
+    ('num_moves', '<u4'),
+    ('num_black_setup', '<u2'),
+    ('num_white_setup', '<u2'),
+    ('board_size', 'u1'),
+    ('width', 'u1'),
+    ('winner', 'u1'),
+    ('first_player', 'u1'),
+    ('komi', '<f4'),
+])
+
+_DTYPES = {1: np.dtype('u1'), 2: np.dtype('<u2')}
+# move codes, relative to the largest value of the width: pass is the largest, resign the one below
+PASS = -1
+RESIGN = -2
+
+_NO_WINNER = 0
+
+ArchiveGame = namedtuple('ArchiveGame', 'board_size komi winner first_player setup moves')
+
+
+def _width(board_size: int) -> int:
+    return 1 if board_size * board_size <= 0xff + RESIGN else 2
+
+
+def _point_code(point: Point | None, board_size: int) -> int:
+    # the index of a point on its board. SGF reads an empty setup value, or tt, as None.
+    if point is None or not (1 <= point.row <= board_size and 1 <= point.col <= board_size):
+        raise ValueError(f'{point} is not a point on a {board_size}x{board_size} board')
+    return (point.row - 1) * board_size + point.col - 1
+
+
+def _special_codes(width: int) -> tuple[int, int]:
+    largest = (1 << (8 * width)) - 1
+    return largest + PASS + 1, largest + RESIGN + 1
+
+
+class ArchiveWriter:
+    def __init__(self, path: str | os.PathLike) -> None:
+        self._file = open(path, 'wb')
+        self._file.write(bytes(HEADER_SIZE))
+        self._offset = HEADER_SIZE
+        self._index: list[tuple] = []
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def add_game(self, moves: Iterable[Move | tuple[Player, Move]], board_size: int, komi: float = 7.5,
+                 winner: Player | None = None, setup: dict[Player, list[Point]] | None = None,
+                 first_player: Player = Player.BLACK) -> None:
+        """
+        Adds a game given as Moves in turn order starting with first_player, or as (Player, Move) pairs.
+        """
+        width = _width(board_size)
+        pass_code, resign_code = _special_codes(width)
+        setup = setup or {}
+        black_setup = setup.get(Player.BLACK, [])
+        white_setup = setup.get(Player.WHITE, [])
+
+        codes = [_point_code(point, board_size) for point in black_setup + white_setup]
+        next_player = first_player
+        num_moves = 0
+        for move in moves:
+            if isinstance(move, tuple):
+                player, move = move
+                if player != next_player:
+                    codes.append(pass_code)
+                    num_moves += 1
+                    next_player = next_player.other
+            if move.is_pass:
+                codes.append(pass_code)
+            elif move.is_resign:
+                codes.append(resign_code)
+            else:
+                codes.append(_point_code(move.point, board_size))
+            num_moves += 1
+            next_player = next_player.other
+
+        data = np.array(codes, dtype=_DTYPES[width]).tobytes()
+        self._file.write(data)
+        self._index.append((
+            self._offset, num_moves, len(black_setup), len(white_setup), board_size, width,
+            _NO_WINNER if winner is None else winner.value, first_player.value, komi,
+        ))
+        self._offset += len(data)
+
+    def add_game_state(self, game_state: goboard.GameState, komi: float = 7.5, winner: Player | None = None) -> None:
+        # the moves that led to game_state, found by following its previous_state chain
+        moves = []
+        while game_state.previous_state is not None:
+            moves.append(game_state.last_move)
+            game_state = game_state.previous_state
+        moves.reverse()
+        self.add_game(moves, game_state.board.num_rows, komi, winner, first_player=game_state.next_player)
+
+    def add_sgf_game(self, game: sgf.SGFGame) -> None:
+        result = (game.result or '').upper()
+        winner = Player.BLACK if result.startswith('B+') else Player.WHITE if result.startswith('W+') else None
+        first_player = Player.WHITE if game.setup[Player.BLACK] and not game.setup[Player.WHITE] else Player.BLACK
+        self.add_game(game.moves, game.board_size, game.komi, winner, game.setup, first_player)
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        index = np.array(self._index, dtype=INDEX_DTYPE)
+        self._file.write(index.tobytes())
+        self._file.seek(0)
+        self._file.write(_HEADER.pack(MAGIC, VERSION, len(self._index), self._offset))
+        self._file.close()
+
+    def __enter__(self) -> ArchiveWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class GameArchive:
+    def __init__(self, path: str | os.PathLike) -> None:
+        with open(path, 'rb') as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, num_games, index_offset = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f'{path} is not a game archive')
+        if version != VERSION:
+            raise ValueError(f'unsupported game archive version {version}')
+        self.index = np.frombuffer(self._mmap, dtype=INDEX_DTYPE, count=num_games, offset=index_offset)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def _codes(self, game: int) -> np.ndarray:
+        entry = self.index[game]
+        count = int(entry['num_black_setup']) + int(entry['num_white_setup']) + int(entry['num_moves'])
+        return np.frombuffer(self._mmap, dtype=_DTYPES[int(entry['width'])], count=count, offset=int(entry['offset']))
+
+    def moves(self, game: int) -> np.ndarray:
+        """
+        The move codes of a game, without its setup stones, as a read-only array backed by the file: board indices of
+        the points played, or the pass and resign codes of the game's width (see special_codes).
+        """
+        entry = self.index[game]
+        num_setup = int(entry['num_black_setup']) + int(entry['num_white_setup'])
+        return self._codes(game)[num_setup:]
+
+    def special_codes(self, game: int) -> tuple[int, int]:
+        # the pass and resign codes of a game
+        return _special_codes(int(self.index[game]['width']))
+
+    def iter_moves(self) -> Iterator[np.ndarray]:
+        for game in range(len(self)):
+            yield self.moves(game)
+
+    def game(self, game: int) -> ArchiveGame:
+        entry = self.index[game]
+        board_size = int(entry['board_size'])
+        num_black_setup = int(entry['num_black_setup'])
+        num_white_setup = int(entry['num_white_setup'])
+        pass_code, resign_code = _special_codes(int(entry['width']))
+
+        def point(code: int) -> Point:
+            return Point(code // board_size + 1, code % board_size + 1)
+
+        codes = self._codes(game).tolist()
+        setup = {
+            Player.BLACK: [point(code) for code in codes[:num_black_setup]],
+            Player.WHITE: [point(code) for code in codes[num_black_setup:num_black_setup + num_white_setup]],
+        }
+        moves = []
+        for code in codes[num_black_setup + num_white_setup:]:
+            if code == pass_code:
+                moves.append(Move.pass_turn())
+            elif code == resign_code:
+                moves.append(Move.resign_turn())
+            else:
+                moves.append(Move.play(point(code)))
+
+        winner = int(entry['winner'])
+        return ArchiveGame(
+            board_size, float(entry['komi']), None if winner == _NO_WINNER else Player(winner),
+            Player(int(entry['first_player'])), setup, moves,
+        )
+
+    def replay(self, game: int, game_state_class: type = goboard.GameState) -> goboard.GameState:
+        # the final GameState of a game
+        archived = self.game(game)
+        game_state = game_state_class.new_game(archived.board_size)
+        for player, points in archived.setup.items():
+            for point in points:
+                game_state.board.place_stone(player, point)
+        if archived.first_player != game_state.next_player:
+            game_state = game_state_class(game_state.board, archived.first_player, None, None)
+        for move in archived.moves:
+            game_state = game_state.apply_move(move)
+        return game_state
+
+    def close(self) -> None:
+        # the archive can not be used any more. Arrays returned by moves() stay valid, they keep the file mapped until
+        # they are gone.
+        self.index = None
+        if self._mmap is None:
+            return
+        try:
+            self._mmap.close()
+        except BufferError:
+            # views of the mapping are still alive, it is unmapped once the last of them is freed
+            pass
+        self._mmap = None
+
+    def __enter__(self) -> GameArchive:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def convert_sgf(sgf_path: str | os.PathLike, archive_path: str | os.PathLike) -> int:
+    # streams every game of an SGF file into a new archive, and returns the number of games
+    with ArchiveWriter(archive_path) as writer:
+        for game in sgf.read_games(sgf_path):
+            writer.add_sgf_game(game)
+        return len(writer)
@@ -0,0 +1,258 @@
+from __future__ import annotations
+import numpy as np
+from dlgo.gotypes import Player, Point
+from dlgo import goboard, zobrist
+
+__all__ = ['BatchBoard', 'PASS']
+
+"""
+Many games of Go simulated in lockstep. A BatchBoard holds N games in NumPy arrays, and every call to play() applies
+one move to each game at once. Captures, liberties, legality and ko are computed for all games together with
+whole-array operations, so thousands of random playouts cost a few dozen NumPy calls per move instead of a Python loop
+per game and per point.
+
+Internally every board is stored flat, with a one-point border, like dlgo.goboard_fast:
+
+    index = row * (num_cols + 2) + col
+
+so the neighbors of all points in all games are four slices of the same array, offset by -stride, +stride, -1 and +1.
+Moves are given and returned as flat indices of the playing area, (row - 1) * num_cols + (col - 1).
+
+Every stone carries the label of its string. Strings never split (they only merge, or are captured as a whole), so
+labels are kept up to date incrementally: a new stone is its own label, and the strings it joins are relabeled to it
+with one gather over the label array. Liberties are counted per label after every move, counting each empty point
+once per distinct string next to it.
+
+Ko is simple ko only: a single stone that just captured a single stone can not be recaptured immediately. Longer
+cycles (triple ko, sending two returning one) are caught with a zobrist hash of every game's stones, which is kept up
+to date with every stone played and captured and looked up in a set of the hashes of all earlier positions of that
+game, so the check costs the same on the last step as on the first. A game whose move repeats an earlier position ends
+right there, and is flagged in repeated, so that random playouts do not cycle until max_steps. All games share the side
+to move, since every game advances by exactly one move (possibly a pass) per step.
+"""
+
+PASS = -1
+
+EMPTY = 0
+BORDER = -1
+
+
+class BatchBoard:
+    def __init__(self, num_games: int, num_rows: int, num_cols: int) -> None:
+        self.num_games = num_games
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+        self.num_points = num_rows * num_cols
+
+        stride = num_cols + 2
+        self._size = (num_rows + 2) * stride
+        self._offsets = (-stride, stride, -1, 1)
+        # the window [first, last) covers every on-board index; neighbors of the window are the shifted windows
+        self._first = stride + 1
+        self._last = num_rows * stride + num_cols + 1
+        # flat playing-area index -> padded index
+        self._padded = np.array([row * stride + col for row in range(1, num_rows + 1)
+                                 for col in range(1, num_cols + 1)], dtype=np.int64)
+
+        self._stones = np.full((num_games, num_rows + 2, stride), BORDER, dtype=np.int8)
+        self._stones[:, 1:-1, 1:-1] = EMPTY
+        self._flat = self._stones.reshape(num_games, self._size)
+        # every stone is labeled with the global index (game * size + point) of one stone of its string, see play()
+        self._identity = np.arange(num_games * self._size, dtype=np.int64)
+        self._labels = self._identity.reshape(num_games, self._size).copy()
+        self._remap = self._identity.copy()
+
+        # zobrist codes by stone value and padded index, and for every game the set of hashes of the positions it has
+        # been in
+        table = zobrist.hash_table(num_rows, num_cols)
+        indices = [Point(row, col).index for row in range(1, num_rows + 1) for col in range(1, num_cols + 1)]
+        self._codes = np.zeros((3, self._size), dtype=np.int64)
+        for player in Player:
+            self._codes[player.value, self._padded] = [table[player][index] for index in indices]
+        self._hash = np.zeros(num_games, dtype=np.int64)
+        self._positions: list[set[int]] = [{0} for _ in range(num_games)]
+
+        self.next_player = Player.BLACK
+        # flat playing-area index of the point the next player may not play on because of ko, or -1
+        self.ko = np.full(num_games, -1, dtype=np.int64)
+        self.passes = np.zeros(num_games, dtype=np.int8)
+        self.done = np.zeros(num_games, dtype=bool)
+        # games that ended because a move repeated an earlier position
+        self.repeated = np.zeros(num_games, dtype=bool)
+        self.num_steps = 0
+
+        self._count_liberties()
+        self._update_legal()
+
+    @property
+    def stones(self) -> np.ndarray:
+        # (num_games, rows, cols) view of the playing area: EMPTY or a Player's value per point
+        return self._stones[:, 1:-1, 1:-1]
+
+    def _window(self, array: np.ndarray, offset: int = 0) -> np.ndarray:
+        return array[:, self._first + offset:self._last + offset]
+
+    def _count_liberties(self) -> None:
+        # the liberty count of the string at every point, from the current labels
+        flat = self._flat
+        labels = self._labels
+
+        empty = self._window(flat) == EMPTY
+        keys = []
+        seen = []
+        for offset in self._offsets:
+            neighbor_labels = self._window(labels, offset)
+            counted = empty & (self._window(flat, offset) > EMPTY)
+            # an empty point is one liberty of each distinct string next to it
+            for earlier_labels, earlier_counted in seen:
+                counted &= ~(earlier_counted & (earlier_labels == neighbor_labels))
+            seen.append((neighbor_labels, counted))
+            keys.append(neighbor_labels[counted])
+        liberties = np.bincount(np.concatenate(keys), minlength=self.num_games * self._size)
+
+        # 0 on empty and border points
+        self._liberties = np.where(flat > EMPTY, liberties[labels], 0)
+
+    def _any_neighbor(self, mask: np.ndarray) -> np.ndarray:
+        # true in the window where at least one neighbor is set in mask
+        result = np.zeros((self.num_games, self._last - self._first), dtype=bool)
+        for offset in self._offsets:
+            result |= self._window(mask, offset)
+        return result
+
+    def _update_legal(self) -> None:
+        # a point is legal if it has an empty neighbor, joins a friendly string with a liberty to spare, or captures
+        flat = self._flat
+        empty = flat == EMPTY
+        own = flat == self.next_player.value
+        opposite = flat == self.next_player.other.value
+        legal = self._window(empty) & (
+            self._any_neighbor(empty) |
+            self._any_neighbor(own & (self._liberties >= 2)) |
+            self._any_neighbor(opposite & (self._liberties == 1))
+        )
+
+        legal = legal[:, self._padded - self._first]
+        has_ko = self.ko >= 0
+        legal[has_ko, self.ko[has_ko]] = False
+        legal[self.done] = False
+        self._legal = legal
+
+    def legal_mask(self) -> np.ndarray:
+        """
+        A (num_games, rows, cols) boolean array of the points the next player can play on in each game. Finished games
+        have no legal points. The array is owned by the board and must not be modified.
+        """
+        return self._legal.reshape(self.num_games, self.num_rows, self.num_cols)
+
+    def play(self, moves: np.ndarray) -> None:
+        """
+        Applies one move to every game: moves[game] is the flat index (row - 1) * num_cols + (col - 1) of the point to
+        play on, or PASS. Moves of finished games are ignored.
+        """
+        moves = np.asarray(moves, dtype=np.int64)
+        player = self.next_player.value
+        other = self.next_player.other.value
+
+        plays = (moves != PASS) & ~self.done
+        games = np.nonzero(plays)[0]
+        if not self._legal[games, moves[games]].all():
+            raise ValueError('illegal move in batch')
+
+        played = self._padded[moves[games]]
+        self._flat[games, played] = player
+        self.passes = np.where(self.done, self.passes, np.where(plays, 0, self.passes + 1))
+        self.done |= self.passes >= 2
+        self.next_player = self.next_player.other
+
+        # the new stone labels itself, and every friendly string next to it is relabeled to it. Strings only ever
+        # merge or are captured as a whole, so labels never have to be recomputed from scratch.
+        stones = self._flat.reshape(-1)
+        labels = self._labels.reshape(-1)
+        new_labels = games * self._size + played
+        labels[new_labels] = new_labels
+        for offset in self._offsets:
+            neighbors = new_labels + offset
+            friendly = stones[neighbors] == player
+            self._remap[labels[neighbors[friendly]]] = new_labels[friendly]
+        merged = np.flatnonzero(self._remap != self._identity)
+        if len(merged):
+            labels[:] = self._remap[labels]
+            self._remap[merged] = merged
+
+        # any opposite-color string left without liberties was captured by this move
+        self._count_liberties()
+        captured = (self._flat == other) & (self._liberties == 0)
+        num_captured = captured.sum(axis=1)
+        self._hash[games] ^= self._codes[player, played]
+        if num_captured.any():
+            self._hash ^= np.bitwise_xor.reduce(np.where(captured, self._codes[other], 0), axis=1)
+            self._flat[captured] = EMPTY
+            self._count_liberties()
+
+        # simple ko: a lone stone that captured exactly one stone and is left with exactly one liberty
+        self.ko[:] = -1
+        is_candidate = num_captured[games] == 1
+        ko_games = games[is_candidate]
+        if len(ko_games):
+            ko_played = played[is_candidate]
+            neighbors = ko_played[:, None] + np.array(self._offsets)
+            lone = (self._flat[ko_games[:, None], neighbors] != player).all(axis=1)
+            in_atari = self._liberties[ko_games, ko_played] == 1
+            captured_point = captured[ko_games][:, self._padded].argmax(axis=1)
+            is_ko = lone & in_atari
+            self.ko[ko_games[is_ko]] = captured_point[is_ko]
+
+        # a pass leaves the position as it was, so only games that played a stone can repeat one
+        repeated = []
+        for game, position in zip(games.tolist(), self._hash[games].tolist()):
+            positions = self._positions[game]
+            if position in positions:
+                repeated.append(game)
+            else:
+                positions.add(position)
+        self.repeated[repeated] = True
+        self.done[repeated] = True
+
+        self._update_legal()
+        self.num_steps += 1
+
+    def random_moves(self, rng: np.random.Generator) -> np.ndarray:
+        """
+        A uniformly random legal move for every game that does not fill one of the next player's own eyes (an empty
+        point whose on-board neighbors are all the player's stones). Games without such a move pass.
+        """
+        flat = self._flat
+        friendly = (flat == self.next_player.value) | (flat == BORDER)
+        all_friendly = np.ones((self.num_games, self._last - self._first), dtype=bool)
+        for offset in self._offsets:
+            all_friendly &= self._window(friendly, offset)
+        candidates = self._legal & ~all_friendly[:, self._padded - self._first]
+
+        scores = np.where(candidates, rng.random(candidates.shape), -1.0)
+        moves = scores.argmax(axis=1)
+        return np.where(candidates.any(axis=1), moves, PASS)
+
+    def play_random(self, rng: np.random.Generator, max_steps: int | None = None) -> int:
+        """
+        Plays random moves in every game until all games are finished (two consecutive passes or a repeated position) or
+        max_steps moves have been played. Returns the number of steps played.
+        """
+        if max_steps is None:
+            max_steps = 3 * self.num_points
+        steps = 0
+        while not self.done.all() and steps < max_steps:
+            self.play(self.random_moves(rng))
+            steps += 1
+        return steps
+
+    def point(self, flat_index: int) -> Point:
+        return Point(flat_index // self.num_cols + 1, flat_index % self.num_cols + 1)
+
+    def to_board(self, game: int) -> goboard.Board:
+        # a dlgo.goboard.Board with the stones of one game, e.g. to print or to analyze it further
+        board = goboard.Board(self.num_rows, self.num_cols)
+        stones = self.stones[game].reshape(-1)
+        for flat_index in np.flatnonzero(stones):
+            board.place_stone(Player(int(stones[flat_index])), self.point(int(flat_index)))
+        return board
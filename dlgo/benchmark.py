@@ -0,0 +1,312 @@
+from __future__ import annotations
+import gc
+import io
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+from typing import Callable
+import numpy as np
+from dlgo import goboard_slow, goboard, goboard_fast, bitboard, instrument, sgf
+from dlgo.agent.naive import NaiveAgent
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.goboard import Move
+from dlgo.gotypes import Player, Point
+
+__all__ = ['ENGINES', 'BOARD_SIZES', 'SUITES', 'Regression', 'record_game', 'run_suite', 'compare', 'load', 'dump']
+
+"""
+Benchmarks of the board engines, so that they can be compared with each other and with earlier runs. For every engine
+and board size, the suite measures:
+
+    place_stone_per_sec     stones placed per second, replaying a recorded random game on a bare Board
+    apply_move_us           microseconds per GameState.apply_move, replaying the same game
+    is_valid_move_per_sec   GameState.is_valid_move calls per second, for every point of positions from that game
+    random_game_ms          milliseconds for a whole game of NaiveAgent against itself
+    peak_memory_kb          peak memory allocated while replaying the game, with every GameState kept alive
+
+The sgf suite measures reading and writing game records, on a collection of SGF_GAMES recorded random games per
+board size:
+
+    parse_games_per_sec     games per second read back with sgf.read_games
+    write_games_per_sec     games per second formatted with sgf.SGFWriter
+
+The encoders suite measures the feature-plane encoder on every position of the recorded game, played on goboard:
+
+    encodings_per_sec       positions per second encoded into a preallocated batch
+
+Every game is seeded, so all engines see the same positions and runs are comparable. Timings are the best of
+`repeat` runs. Results are plain dicts that can be dumped as JSON, and compare() reports the metrics of a run that got
+worse than a stored baseline by more than a tolerance. Metrics ending in _per_sec are better when higher, all others
+when lower. With instrument set, the random game is played once more with dlgo.instrument enabled, and its counters
+are reported separately, so that the instrumentation does not distort the timings.
+
+place_stone_per_sec and apply_move_us are the numbers to watch when changing how goboard and goboard_fast keep their
+legal points up to date: a move should only re-check the points around it, never every liberty of the strings next to
+it. test_legal_points_check_does_not_grow_with_string_size asserts this without timing anything.
+"""
+
+ENGINES: dict[str, tuple[type, type]] = {
+    'goboard_slow': (goboard_slow.Board, goboard_slow.GameState),
+    'goboard': (goboard.Board, goboard.GameState),
+    'goboard_fast': (goboard_fast.Board, goboard_fast.GameState),
+    'bitboard': (bitboard.BitBoard, bitboard.GameState),
+}
+
+BOARD_SIZES = (5, 9, 13, 19)
+
+SGF_GAMES = 200
+
+Regression = namedtuple('Regression', 'benchmark metric baseline value change')
+
+
+def record_game(board_size: int, seed: int = 0) -> list[Move]:
+    # a random game between two NaiveAgents, played on goboard_fast, as the list of its moves
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        agent = NaiveAgent()
+        game_state = goboard_fast.GameState.new_game(board_size)
+        moves: list[Move] = []
+        while not game_state.is_over() and len(moves) < 4 * board_size * board_size:
+            move = agent.select_move(game_state)
+            moves.append(move)
+            game_state = game_state.apply_move(move)
+        return moves
+    finally:
+        random.setstate(state)
+
+
+def _best_time(function: Callable[[], object], repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _replay_game(game_state_class: type, board_size: int, moves: list[Move]) -> list:
+    game_state = game_state_class.new_game(board_size)
+    states = [game_state]
+    for move in moves:
+        game_state = game_state.apply_move(move)
+        states.append(game_state)
+    return states
+
+
+def bench_place_stone(board_class: type, board_size: int, moves: list[Move], repeat: int) -> float:
+    placements = []
+    player = Player.BLACK
+    for move in moves:
+        if move.is_play:
+            placements.append((player, move.point))
+        player = player.other
+
+    def place_all() -> None:
+        board = board_class(board_size, board_size)
+        for stone_player, point in placements:
+            board.place_stone(stone_player, point)
+
+    return len(placements) / _best_time(place_all, repeat)
+
+
+def bench_apply_move(game_state_class: type, board_size: int, moves: list[Move], repeat: int) -> float:
+    seconds = _best_time(lambda: _replay_game(game_state_class, board_size, moves), repeat)
+    return seconds / len(moves) * 1e6
+
+
+def bench_is_valid_move(game_state_class: type, board_size: int, moves: list[Move], repeat: int) -> float:
+    # every point is checked in a handful of positions spread over the game
+    states = _replay_game(game_state_class, board_size, moves)
+    positions = states[::max(1, len(states) // 8)]
+    candidates = [Move.play(Point(row, col)) for row in range(1, board_size + 1) for col in range(1, board_size + 1)]
+
+    def check_all() -> None:
+        for game_state in positions:
+            for move in candidates:
+                game_state.is_valid_move(move)
+
+    return len(positions) * len(candidates) / _best_time(check_all, repeat)
+
+
+def bench_random_game(game_state_class: type, board_size: int, repeat: int, seed: int = 0) -> float:
+    def play() -> None:
+        random.seed(seed)
+        agent = NaiveAgent()
+        game_state = game_state_class.new_game(board_size)
+        num_moves = 0
+        while not game_state.is_over() and num_moves < 4 * board_size * board_size:
+            game_state = game_state.apply_move(agent.select_move(game_state))
+            num_moves += 1
+
+    state = random.getstate()
+    try:
+        return _best_time(play, repeat) * 1e3
+    finally:
+        random.setstate(state)
+
+
+def bench_peak_memory(game_state_class: type, board_size: int, moves: list[Move]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        states = _replay_game(game_state_class, board_size, moves)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del states
+    return peak / 1024
+
+
+def bench_sgf(board_size: int, repeat: int, seed: int = 0) -> dict[str, float]:
+    games = [record_game(board_size, seed + game) for game in range(SGF_GAMES)]
+
+    def write_all() -> str:
+        buffer = io.StringIO()
+        writer = sgf.SGFWriter(buffer)
+        for moves in games:
+            writer.write_game(moves, board_size, result='B+R')
+        return buffer.getvalue()
+
+    text = write_all()
+
+    def read_all() -> None:
+        for _ in sgf.read_games(io.StringIO(text)):
+            pass
+
+    return {
+        'parse_games_per_sec': len(games) / _best_time(read_all, repeat),
+        'write_games_per_sec': len(games) / _best_time(write_all, repeat),
+    }
+
+
+def bench_encoder(name: str, board_size: int, moves: list[Move], repeat: int) -> float:
+    encoder = get_encoder_by_name(name, board_size)
+    states = _replay_game(goboard.GameState, board_size, moves)
+    batch = np.empty((len(states),) + encoder.shape(), dtype=np.float32)
+    return len(states) / _best_time(lambda: encoder.encode_batch(states, batch), repeat)
+
+
+def _engine_suite(engines: list[str], board_sizes: tuple[int, ...], repeat: int, seed: int,
+                  progress: Callable[[str], None], instrumented: bool, counters: dict[str, dict]) -> dict:
+    results: dict[str, dict[str, float]] = {}
+    for board_size in board_sizes:
+        moves = record_game(board_size, seed)
+        for engine in engines:
+            board_class, game_state_class = ENGINES[engine]
+            name = f'{engine}/{board_size}x{board_size}'
+            progress(name)
+            results[name] = {
+                'place_stone_per_sec': bench_place_stone(board_class, board_size, moves, repeat),
+                'apply_move_us': bench_apply_move(game_state_class, board_size, moves, repeat),
+                'is_valid_move_per_sec': bench_is_valid_move(game_state_class, board_size, moves, repeat),
+                'random_game_ms': bench_random_game(game_state_class, board_size, repeat, seed),
+                'peak_memory_kb': bench_peak_memory(game_state_class, board_size, moves),
+            }
+            if instrumented:
+                with instrument.enabled():
+                    instrument.reset()
+                    bench_random_game(game_state_class, board_size, 1, seed)
+                    counters[name] = instrument.snapshot()
+    return results
+
+
+def _sgf_suite(engines: list[str], board_sizes: tuple[int, ...], repeat: int, seed: int,
+               progress: Callable[[str], None], instrumented: bool, counters: dict[str, dict]) -> dict:
+    results: dict[str, dict[str, float]] = {}
+    for board_size in board_sizes:
+        name = f'sgf/{board_size}x{board_size}'
+        progress(name)
+        results[name] = bench_sgf(board_size, repeat, seed)
+    return results
+
+
+def _encoder_suite(engines: list[str], board_sizes: tuple[int, ...], repeat: int, seed: int,
+                   progress: Callable[[str], None], instrumented: bool, counters: dict[str, dict]) -> dict:
+    results: dict[str, dict[str, float]] = {}
+    for board_size in board_sizes:
+        name = f'planes/{board_size}x{board_size}'
+        progress(name)
+        moves = record_game(board_size, seed)
+        results[name] = {'encodings_per_sec': bench_encoder('planes', board_size, moves, repeat)}
+    return results
+
+
+def _no_progress(name: str) -> None:
+    pass
+
+
+SUITES = {
+    'engines': _engine_suite,
+    'sgf': _sgf_suite,
+    'encoders': _encoder_suite,
+}
+
+
+def run_suite(engines: list[str] | None = None, board_sizes: tuple[int, ...] = BOARD_SIZES, repeat: int = 3,
+              seed: int = 0, progress: Callable[[str], None] | None = None, instrumented: bool = False,
+              suites: list[str] | None = None) -> dict:
+    """
+    Runs the benchmarks of the given suites (all of SUITES by default) for every engine and board size, and returns
+    the results together with a description of the machine they were measured on.
+    """
+    if engines is None:
+        engines = list(ENGINES)
+    if suites is None:
+        suites = list(SUITES)
+    if progress is None:
+        progress = _no_progress
+
+    results: dict[str, dict[str, float]] = {}
+    counters: dict[str, dict] = {}
+    for suite in suites:
+        results.update(SUITES[suite](engines, board_sizes, repeat, seed, progress, instrumented, counters))
+
+    run = {
+        'meta': {
+            'python': sys.version.split()[0],
+            'platform': platform.platform(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'repeat': repeat,
+            'seed': seed,
+            'suites': suites,
+        },
+        'results': results,
+    }
+    if instrumented:
+        run['counters'] = counters
+    return run
+
+
+def compare(run: dict, baseline: dict, tolerance: float = 0.1) -> list[Regression]:
+    """
+    Every metric of run that is worse than the same metric of baseline by more than tolerance (a fraction, 0.1 is 10%).
+    Benchmarks or metrics that only appear in one of the two are ignored.
+    """
+    regressions = []
+    for benchmark, metrics in run['results'].items():
+        baseline_metrics = baseline['results'].get(benchmark, {})
+        for metric, value in metrics.items():
+            if metric not in baseline_metrics or baseline_metrics[metric] == 0:
+                continue
+            baseline_value = baseline_metrics[metric]
+            change = (value - baseline_value) / baseline_value
+            worse = -change if metric.endswith('_per_sec') else change
+            if worse > tolerance:
+                regressions.append(Regression(benchmark, metric, baseline_value, value, change))
+    return regressions
+
+
+def dump(run: dict, path: str) -> None:
+    with open(path, 'w') as file:
+        json.dump(run, file, indent=2, sort_keys=True)
+
+
+def load(path: str) -> dict:
+    with open(path) as file:
+        return json.load(file)
@@ -0,0 +1,308 @@
+from __future__ import annotations
+from functools import lru_cache
+from dlgo.gotypes import Point, Player, neighbor_table, corner_table, color_table
+# Move is re-exported, so that the engine modules can stand in for each other (from dlgo import bitboard as goboard)
+from dlgo.goboard import GoString, Move  # noqa: F401
+from dlgo import goboard, zobrist
+
+"""
+A GoBoard that represents the position as three Python integers used as bit sets: the black stones, the white stones
+and the mask of on-board points. Each point is one bit:
+
+    bit = (row - 1) * (num_cols + 1) + (col - 1)
+
+Every row has one spare bit at its end which is never on the board, so shifting a set of stones left or right by one
+can not wrap around into the next row. With that, the neighbors of any set of points are a handful of shifts:
+
+    ((s << 1) | (s >> 1) | (s << stride) | (s >> stride)) & on_board
+
+and flood filling a string, finding its liberties and detecting captures are all done with shift/and/or operations on
+whole sets of points instead of per-Point dict lookups. Copying a BitBoard only copies three integers.
+"""
+
+
+@lru_cache(maxsize=None)
+def _points(num_rows: int, num_cols: int) -> tuple[Point | None, ...]:
+    # bit -> Point for every on-grid bit, None for the spare bit at the end of each row
+    stride = num_cols + 1
+    points: list[Point | None] = [None] * (num_rows * stride)
+    for row in range(1, num_rows + 1):
+        for col in range(1, num_cols + 1):
+            points[(row - 1) * stride + col - 1] = Point(row, col)
+    return tuple(points)
+
+
+@lru_cache(maxsize=None)
+def _hash_codes(num_rows: int, num_cols: int) -> dict[Player, tuple[int, ...]]:
+    # player -> bit -> zobrist code
+    table = zobrist.hash_table(num_rows, num_cols)
+    return {
+        player: tuple(0 if point is None else table[player][point.index] for point in _points(num_rows, num_cols))
+        for player in (Player.BLACK, Player.WHITE)
+    }
+
+
+def _bits(bitset: int):
+    # yields the index of every set bit, lowest first
+    while bitset:
+        lowest = bitset & -bitset
+        yield lowest.bit_length() - 1
+        bitset ^= lowest
+
+
+class BitBoard:
+    def __init__(self, num_rows: int, num_cols: int) -> None:
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+
+        self._stride = num_cols + 1
+        self._points = _points(num_rows, num_cols)
+        self._codes = _hash_codes(num_rows, num_cols)
+        self._neighbors = neighbor_table(num_rows, num_cols)
+        self._corners = corner_table(num_rows, num_cols)
+        self._on_board = sum(1 << bit for bit, point in enumerate(self._points) if point is not None)
+
+        self._stones: dict[Player, int] = {Player.BLACK: 0, Player.WHITE: 0}
+        self._hash = zobrist.EMPTY_BOARD
+
+        # legal point sets are derived from the bit sets on demand, and replaced whenever a stone is placed. Copies
+        # share them until then.
+        self._legal: dict[Player, set[Point]] = {}
+        self._empty_points: list[Point] | None = None
+        self._colors: bytes | None = None
+
+        # (black stones, white stones, hash) before every play_in_place move, most recent move last
+        self._journal: list[tuple[int, int, zobrist.Hash]] = []
+
+    def copy(self) -> BitBoard:
+        board = BitBoard.__new__(BitBoard)
+        board.__dict__.update(self.__dict__)
+        board._stones = self._stones.copy()
+        # a copy starts a history of its own
+        board._journal = []
+        return board
+
+    def __deepcopy__(self, memo: dict) -> BitBoard:
+        return self.copy()
+
+    def _bit(self, point: Point) -> int:
+        return 1 << ((point.row - 1) * self._stride + point.col - 1)
+
+    @staticmethod
+    def _index(bit: int) -> int:
+        return bit.bit_length() - 1
+
+    def _expand(self, bitset: int) -> int:
+        # every on-board point next to a point in bitset
+        stride = self._stride
+        return ((bitset << 1) | (bitset >> 1) | (bitset << stride) | (bitset >> stride)) & self._on_board
+
+    def _empty(self) -> int:
+        return self._on_board & ~(self._stones[Player.BLACK] | self._stones[Player.WHITE])
+
+    def _flood(self, seed: int, stones: int) -> int:
+        # grows seed through stones until it covers the whole string(s) seed touches
+        string = seed
+        while True:
+            grown = string | (self._expand(string) & stones)
+            if grown == string:
+                return string
+            string = grown
+
+    def _strings(self, stones: int):
+        # yields every string in stones as its own bit set
+        while stones:
+            string = self._flood(stones & -stones, stones)
+            stones &= ~string
+            yield string
+
+    def place_stone(self, player: Player, point: Point) -> None:
+        """
+        To place a stone, do the following:
+
+        1. merge any adjacent strings of the same color (implicit, strings are flood filled when needed)
+        2. reduce liberties of any adjacent strings of opposite color
+        3. if any opposite-color strings have zero liberties, remove them.
+        """
+        assert self.is_on_grid(point)
+        bit = self._bit(point)
+        assert not bit & ~self._empty()
+
+        self._stones[player] |= bit
+        self._hash ^= self._codes[player][self._index(bit)]
+        self._legal = {}
+        self._empty_points = None
+        self._colors = None
+
+        other = player.other
+        empty = self._empty()
+        opposite = self._stones[other]
+        adjacent = self._expand(bit) & opposite
+        codes = self._codes[other]
+
+        while adjacent:
+            string = self._flood(adjacent & -adjacent, opposite)
+            adjacent &= ~string
+            if not self._expand(string) & empty:
+                opposite &= ~string
+                for stone in _bits(string):
+                    self._hash ^= codes[stone]
+
+        self._stones[other] = opposite
+
+    def play_in_place(self, player: Player, point: Point) -> None:
+        # place_stone, recorded so that undo() can take it back. The whole position is three integers, so that is all
+        # the journal keeps.
+        self._journal.append((self._stones[Player.BLACK], self._stones[Player.WHITE], self._hash))
+        self.place_stone(player, point)
+
+    def undo(self) -> None:
+        if not self._journal:
+            raise ValueError('no move to undo')
+        black, white, self._hash = self._journal.pop()
+        self._stones = {Player.BLACK: black, Player.WHITE: white}
+        self._legal = {}
+        self._empty_points = None
+        self._colors = None
+
+    @property
+    def num_undoable(self) -> int:
+        return len(self._journal)
+
+    def is_self_capture(self, player: Player, point: Point) -> bool:
+        bit = self._bit(point)
+        empty = self._empty()
+        neighbors = self._expand(bit)
+        if neighbors & empty:
+            return False
+
+        own = self._stones[player]
+        friendly = self._flood(neighbors & own, own) if neighbors & own else 0
+        if self._expand(friendly) & empty & ~bit:
+            return False
+
+        opposite = self._stones[player.other]
+        adjacent = neighbors & opposite
+        while adjacent:
+            string = self._flood(adjacent & -adjacent, opposite)
+            adjacent &= ~string
+            if self._expand(string) & empty == bit:
+                return False
+        return True
+
+    def hash_after_move(self, player: Player, point: Point) -> zobrist.Hash:
+        bit = self._bit(point)
+        empty = self._empty() & ~bit
+        opposite = self._stones[player.other]
+        codes = self._codes[player.other]
+        next_hash = self._hash ^ self._codes[player][self._index(bit)]
+
+        adjacent = self._expand(bit) & opposite
+        while adjacent:
+            string = self._flood(adjacent & -adjacent, opposite)
+            adjacent &= ~string
+            if not self._expand(string) & empty:
+                for stone in _bits(string):
+                    next_hash ^= codes[stone]
+        return next_hash
+
+    def legal_points(self, player: Player) -> set[Point]:
+        """
+        The legal points are computed for all empty points at once: a point is legal if it has an empty neighbor, is a
+        liberty of a friendly string with two or more liberties, or is the last liberty of an opposite-color string.
+        """
+        if player not in self._legal:
+            empty = self._empty()
+            own = self._stones[player]
+            opposite = self._stones[player.other]
+
+            legal = empty & self._expand(empty)
+            for string in self._strings(own):
+                liberties = self._expand(string) & empty
+                if liberties.bit_count() >= 2:
+                    legal |= liberties
+            for string in self._strings(opposite):
+                liberties = self._expand(string) & empty
+                if liberties.bit_count() == 1:
+                    legal |= liberties
+
+            self._legal[player] = {self._points[bit] for bit in _bits(legal)}
+        return self._legal[player]
+
+    def empty_points(self) -> list[Point]:
+        # derived from the bit sets like legal_points, and shared by copies until a stone is placed. The list is owned
+        # by the board and must not be modified.
+        if self._empty_points is None:
+            self._empty_points = [self._points[bit] for bit in _bits(self._empty())]
+        return self._empty_points
+
+    def colors(self) -> bytes:
+        # the color of every point, laid out as gotypes.color_table describes, and shared by copies like empty_points
+        if self._colors is None:
+            colors = bytearray(color_table(self.num_rows, self.num_cols))
+            stride = self.num_cols + 2
+            for player, stones in self._stones.items():
+                for bit in _bits(stones):
+                    point = self._points[bit]
+                    colors[point.row * stride + point.col] = player.value
+            self._colors = bytes(colors)
+        return self._colors
+
+    def neighbors(self, point: Point) -> tuple[Point, ...]:
+        return self._neighbors[point]
+
+    def corners(self, point: Point) -> tuple[Point, ...]:
+        return self._corners[point]
+
+    def point_at(self, index: int) -> Point:
+        point = Point.from_index(index)
+        assert self.is_on_grid(point)
+        return point
+
+    def is_on_grid(self, point: Point) -> bool:
+        return 1 <= point.row <= self.num_rows and 1 <= point.col <= self.num_cols
+
+    def get_player(self, point: Point) -> Player | None:
+        if not self.is_on_grid(point):
+            return None
+        bit = self._bit(point)
+        if self._stones[Player.BLACK] & bit:
+            return Player.BLACK
+        if self._stones[Player.WHITE] & bit:
+            return Player.WHITE
+        return None
+
+    def get_go_string(self, point: Point) -> GoString | None:
+        player = self.get_player(point)
+        if player is None:
+            return None
+
+        string = self._flood(self._bit(point), self._stones[player])
+        liberties = self._expand(string) & self._empty()
+        return GoString(
+            color=player,
+            stones=[self._points[bit] for bit in _bits(string)],
+            liberties=[self._points[bit] for bit in _bits(liberties)],
+        )
+
+    def num_liberties(self, point: Point) -> int:
+        # the liberties of the string at point, 0 if the point is empty
+        player = self.get_player(point)
+        if player is None:
+            return 0
+        string = self._flood(self._bit(point), self._stones[player])
+        return (self._expand(string) & self._empty()).bit_count()
+
+    def is_point_occupied(self, point: Point) -> bool:
+        if not self.is_on_grid(point):
+            return False
+        return bool((self._stones[Player.BLACK] | self._stones[Player.WHITE]) & self._bit(point))
+
+    def zobrist_hash(self) -> zobrist.Hash:
+        return self._hash
+
+
+class GameState(goboard.GameState):
+    @classmethod
+    def new_game(cls, board_size: int) -> GameState:
+        return GameState(BitBoard(board_size, board_size), Player.BLACK, None, None)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+import importlib
+from typing import Sequence
+import numpy as np
+from dlgo.goboard import GameState
+from dlgo.gotypes import Point
+
+__all__ = ['Encoder', 'get_encoder_by_name']
+
+"""
+Encoders turn a GameState into the NumPy arrays a model is trained on, and map board points to and from the flat
+indices of the model's move predictions.
+
+Every encoder lives in its own module of this package, with a create(board_size) function, so that it can be looked
+up by name. encode_into writes a position into an existing array, so that a whole batch can be filled without
+allocating an array per position.
+"""
+
+
+class Encoder:
+    def name(self) -> str:
+        raise NotImplementedError()
+
+    def shape(self) -> tuple[int, ...]:
+        # the shape of one encoded position
+        raise NotImplementedError()
+
+    def encode_into(self, game_state: GameState, out: np.ndarray) -> None:
+        # overwrites out, an array of shape(), with the encoding of game_state
+        raise NotImplementedError()
+
+    def encode_point(self, point: Point) -> int:
+        raise NotImplementedError()
+
+    def decode_point_index(self, index: int) -> Point:
+        raise NotImplementedError()
+
+    def num_points(self) -> int:
+        raise NotImplementedError()
+
+    def encode(self, game_state: GameState, dtype: np.dtype = np.float32) -> np.ndarray:
+        out = np.empty(self.shape(), dtype=dtype)
+        self.encode_into(game_state, out)
+        return out
+
+    def encode_batch(self, game_states: Sequence[GameState], out: np.ndarray | None = None,
+                     dtype: np.dtype = np.float32) -> np.ndarray:
+        """
+        Encodes game_states into out[0], out[1], ..., which must be a C-contiguous array of shape
+        (batch size,) + shape() with at least len(game_states) entries. A new array is allocated if out is None.
+        """
+        if out is None:
+            out = np.empty((len(game_states),) + self.shape(), dtype=dtype)
+        if out.shape[1:] != self.shape() or len(out) < len(game_states):
+            raise ValueError(f'batch of shape {out.shape} can not hold {len(game_states)} positions of {self.shape()}')
+        for position, game_state in enumerate(game_states):
+            self.encode_into(game_state, out[position])
+        return out
+
+
+def get_encoder_by_name(name: str, board_size: int | tuple[int, int]) -> Encoder:
+    # the encoder of module dlgo.encoders.<name>, for square boards of board_size or boards of (rows, cols)
+    if isinstance(board_size, int):
+        board_size = (board_size, board_size)
+    module = importlib.import_module('dlgo.encoders.' + name)
+    return module.create(board_size)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+import numpy as np
+from dlgo.encoders.base import Encoder
+from dlgo.goboard import GameState
+from dlgo.gotypes import Player, Point
+
+__all__ = ['FeaturePlaneEncoder', 'create']
+
+"""
+Feature planes for move prediction. Each plane is a (num_rows, num_cols) array of zeros and ones, seen from the side
+of the player to move:
+
+    0           the player's stones
+    1           the opponent's stones
+    2, 3, 4     the player's stones in strings with 1, 2 and 3 or more liberties
+    5, 6, 7     the same for the opponent's stones
+    8           the ko point the player may not retake on
+    9           all ones if the player is black
+    10, ...     the point of the last move, the move before it, and so on for history moves (empty for passes)
+
+Point(row, col) is at [row - 1, col - 1] of every plane, and its index in move predictions is
+(row - 1) * num_cols + (col - 1).
+"""
+
+OWN_STONES = 0
+OPPONENT_STONES = 1
+OWN_LIBERTIES = 2
+OPPONENT_LIBERTIES = 5
+KO = 8
+BLACK_TO_MOVE = 9
+HISTORY = 10
+
+
+class FeaturePlaneEncoder(Encoder):
+    def __init__(self, board_size: tuple[int, int], history: int = 4) -> None:
+        self.num_rows, self.num_cols = board_size
+        self.history = history
+        self.num_planes = HISTORY + history
+        self._area = self.num_rows * self.num_cols
+        # the point of every flat index
+        self._points = [Point(row, col) for row in range(1, self.num_rows + 1) for col in range(1, self.num_cols + 1)]
+
+    def name(self) -> str:
+        return 'planes'
+
+    def shape(self) -> tuple[int, int, int]:
+        return self.num_planes, self.num_rows, self.num_cols
+
+    def encode_into(self, game_state: GameState, out: np.ndarray) -> None:
+        if out.shape != self.shape() or not out.flags.c_contiguous:
+            raise ValueError(f'can not encode into an array of shape {out.shape}, need a C-contiguous {self.shape()}')
+        out.fill(0)
+        # a flat view, so that every write is a single integer index
+        flat = out.reshape(-1)
+        area = self._area
+        board = game_state.board
+        player = game_state.next_player
+
+        # the stone planes come straight from the board's colors (see gotypes.color_table), the liberty planes from
+        # one num_liberties call per stone
+        colors = np.frombuffer(board.colors(), dtype=np.uint8).reshape(self.num_rows + 2, self.num_cols + 2)[1:-1, 1:-1]
+        own = colors == player.value
+        opponent = colors == player.other.value
+        stones = np.flatnonzero(colors).tolist()
+        liberties = np.zeros(area, dtype=np.uint8)
+        liberties[stones] = [min(board.num_liberties(self._points[index]), 3) for index in stones]
+        liberties = liberties.reshape(self.num_rows, self.num_cols)
+
+        out[OWN_STONES] = own
+        out[OPPONENT_STONES] = opponent
+        for liberty_plane in range(3):
+            has_liberties = liberties == liberty_plane + 1
+            out[OWN_LIBERTIES + liberty_plane] = own & has_liberties
+            out[OPPONENT_LIBERTIES + liberty_plane] = opponent & has_liberties
+
+        ko_point = game_state.ko_point
+        if ko_point is not None:
+            flat[KO * area + self.encode_point(ko_point)] = 1
+        if player == Player.BLACK:
+            flat[BLACK_TO_MOVE * area:(BLACK_TO_MOVE + 1) * area] = 1
+
+        for plane in range(HISTORY, self.num_planes):
+            move = game_state.last_move
+            if move is None:
+                break
+            if move.is_play:
+                flat[plane * area + self.encode_point(move.point)] = 1
+            game_state = game_state.previous_state
+
+    def encode_point(self, point: Point) -> int:
+        return (point.row - 1) * self.num_cols + point.col - 1
+
+    def decode_point_index(self, index: int) -> Point:
+        return Point(index // self.num_cols + 1, index % self.num_cols + 1)
+
+    def num_points(self) -> int:
+        return self._area
+
+
+def create(board_size: tuple[int, int]) -> FeaturePlaneEncoder:
+    return FeaturePlaneEncoder(board_size)
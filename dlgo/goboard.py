@@ -1,9 +1,11 @@
 from __future__ import annotations
+from collections import namedtuple
 from typing import Iterable
-import copy
-from dlgo.gotypes import Point, Player
+from dlgo.gotypes import Point, Player, EmptyPoints, neighbor_table, corner_table, neighborhood_table, color_table
 from dlgo.goboard_slow import Move
 from dlgo import zobrist
+from dlgo.patterns import OFF_BOARD, ATARI_SHIFT
+from dlgo.persistent import PersistentSet
 
 """
 This implementation of a GoBoard utilizes Zobrist hashing to greatly speed things up (for increasing
@@ -18,6 +20,15 @@ until we end up at the board state we desire. Then, comparing two boards for sim
 constant time.
 """
 
+_STALE = -1
+
+# a copy re-checks the legality of the points the last moves changed once more than this many have piled up
+MAX_UNCHECKED = 64
+
+# a play_in_place move: the stone placed, its position in the empty points, the hash before the move and the strings
+# the move replaced (see Board.play_in_place)
+_JournalEntry = namedtuple('_JournalEntry', 'player point position previous_hash merged captured liberties_changed')
+
 
 class GoString:
     def __init__(self, color: Player, stones: Iterable[Point], liberties: Iterable[Point]) -> None:
@@ -56,8 +67,71 @@ class Board:
         self.num_rows = num_rows
         self.num_cols = num_cols
 
+        self._neighbors = neighbor_table(num_rows, num_cols)
+        self._corners = corner_table(num_rows, num_cols)
+        self._neighborhoods = neighborhood_table(num_rows, num_cols)
+
+        self._codes = zobrist.hash_table(num_rows, num_cols)
+
         self._grid: dict[Point, GoString | None] = {}
         self._hash = zobrist.EMPTY_BOARD
+        self._empty = EmptyPoints(num_rows, num_cols)
+        # colors() of the current position, built when it is first asked for and shared by copies until a stone is
+        # placed
+        self._colors: bytes | None = color_table(num_rows, num_cols)
+
+        # for each player, every empty point they can play on without self-capture. place_stone only collects the
+        # points whose legality may have changed in _unchecked, legal_points() re-checks them when it is called. A
+        # copy shares the sets with the original, and whichever board re-checks first copies them (see copy).
+        all_points = {Point(row, col) for row in range(1, num_rows + 1) for col in range(1, num_cols + 1)}
+        self._legal: dict[Player, set[Point]] = {
+            Player.BLACK: all_points,
+            Player.WHITE: set(all_points),
+        }
+        self._legal_shared = False
+        self._unchecked: set[Point] = set()
+
+        # the 3x3 pattern of every empty point by Point.index (see dlgo.patterns), allocated by the first pattern()
+        # call, so that boards nobody asks for patterns never build it. place_stone only marks the points whose pattern
+        # may have changed as _STALE, pattern() recomputes them when they are asked for. Copies share the list until
+        # one of them writes to it, like the legal point sets.
+        self._patterns: list[int] | None = None
+        self._patterns_shared = False
+
+        # what play_in_place changed, most recent move last, so that undo() can restore it
+        self._journal: list[_JournalEntry] = []
+
+    def copy(self) -> Board:
+        """
+        GoStrings are immutable, so a copy of the board can share them with the original. Only the grid mapping
+        itself has to be copied, which is much cheaper than a deepcopy of every GoString and Point.
+        """
+        # the legal point sets are shared until one of the boards re-checks them, so that copies that are only played
+        # on, as in playouts, never copy them. The unchecked points are handed on to the copy instead, up to a limit.
+        if len(self._unchecked) > MAX_UNCHECKED:
+            self._check_legal()
+        board = Board.__new__(Board)
+        board.num_rows = self.num_rows
+        board.num_cols = self.num_cols
+        board._neighbors = self._neighbors
+        board._corners = self._corners
+        board._codes = self._codes
+        board._grid = self._grid.copy()
+        board._hash = self._hash
+        board._colors = self._colors
+        board._empty = self._empty.copy()
+        board._legal = self._legal
+        board._legal_shared = self._legal_shared = True
+        board._unchecked = self._unchecked.copy()
+        board._neighborhoods = self._neighborhoods
+        board._patterns = self._patterns
+        board._patterns_shared = self._patterns_shared = self._patterns is not None
+        # a copy starts a history of its own
+        board._journal = []
+        return board
+
+    def __deepcopy__(self, memo: dict) -> Board:
+        return self.copy()
 
     def place_stone(self, player: Player, point: Point):
         """
@@ -75,15 +149,14 @@ class Board:
         liberties: list[Point] = []
 
         # sort neighbors into categories: same color, opposite color, unoccupied (liberty)
-        for neighbor_point in point.neighbors():
-            if not self.is_on_grid(neighbor_point):
-                continue
+        for neighbor_point in self._neighbors[point]:
             neighbor_string = self._grid.get(neighbor_point)
             if neighbor_string is None:
                 liberties.append(neighbor_point)
             elif neighbor_string.color == player:
-                adjacent_same_color.append(neighbor_string)
-            else:
+                if neighbor_string not in adjacent_same_color:
+                    adjacent_same_color.append(neighbor_string)
+            elif neighbor_string not in adjacent_opposite_color:
                 adjacent_opposite_color.append(neighbor_string)
 
         # create initial GoString of placed stone
@@ -98,19 +171,246 @@ class Board:
         for new_string_point in new_string.stones:
             self._grid[new_string_point] = new_string
 
-        self._hash ^= zobrist.HASH_CODE[point, player]
+        self._hash ^= self._codes[player][point.index]
+        self._empty.remove(point)
+        self._colors = None
 
         # remove liberties of neighbors that aren't the same color. If no more liberties for a GoString, remove it
+        changed_points = [point]
         for other_color_string in adjacent_opposite_color:
             replacement_string = other_color_string.without_liberty(point)
 
             if replacement_string.num_liberties == 0:
-                for point in replacement_string.stones:
-                    self._hash ^= zobrist.HASH_CODE[point, player.other]
+                captured_codes = self._codes[player.other]
+                for captured_point in replacement_string.stones:
+                    self._hash ^= captured_codes[captured_point.index]
+                changed_points.extend(replacement_string.stones)
                 self._remove_string(other_color_string)
             else:
                 self._replace_string(replacement_string)
 
+        self._update_legal(changed_points)
+
+    def play_in_place(self, player: Player, point: Point) -> None:
+        """
+        place_stone, recorded in a journal so that undo() can take it back. Search code can play out long sequences
+        and return to the starting position without copying the board.
+
+        GoStrings are immutable, so the journal only keeps the strings the move replaces: the friendly strings it
+        merges, the opposite-color strings it captures, and every other string whose liberties it changes (the
+        opposite-color strings next to the point, and the friendly strings next to a captured string).
+        """
+        merged: list[GoString] = []
+        captured: list[GoString] = []
+        liberties_changed: list[GoString] = []
+
+        def known(string: GoString) -> bool:
+            return any(string is other for other in merged + captured + liberties_changed)
+
+        for neighbor in self._neighbors[point]:
+            neighbor_string = self._grid.get(neighbor)
+            if neighbor_string is None or known(neighbor_string):
+                continue
+            if neighbor_string.color == player:
+                merged.append(neighbor_string)
+            elif neighbor_string.num_liberties == 1:
+                captured.append(neighbor_string)
+            else:
+                liberties_changed.append(neighbor_string)
+
+        for captured_string in captured:
+            for captured_point in captured_string.stones:
+                for captured_neighbor in self._neighbors[captured_point]:
+                    string = self._grid.get(captured_neighbor)
+                    if string is not None and string.color == player and not known(string):
+                        liberties_changed.append(string)
+
+        entry = _JournalEntry(player, point, self._empty.position(point), self._hash, merged, captured,
+                              liberties_changed)
+        self.place_stone(player, point)
+        self._journal.append(entry)
+
+    def undo(self) -> None:
+        """
+        Takes back the last play_in_place, restoring the strings, hash and empty points exactly.
+        """
+        if not self._journal:
+            raise ValueError('no move to undo')
+        entry = self._journal.pop()
+
+        # captured points were added to the end of the empty points, one string after the other
+        changed_points = [entry.point]
+        for captured_string in reversed(entry.captured):
+            for _ in captured_string.stones:
+                captured_point = self._empty.points[-1]
+                self._empty.remove(captured_point)
+                changed_points.append(captured_point)
+        self._empty.restore(entry.point, entry.position)
+
+        self._grid[entry.point] = None
+        for string in entry.merged + entry.captured + entry.liberties_changed:
+            self._replace_string(string)
+        self._hash = entry.previous_hash
+        self._colors = None
+        self._update_legal(changed_points)
+
+    @property
+    def num_undoable(self) -> int:
+        # the number of play_in_place moves undo() can take back
+        return len(self._journal)
+
+    def _update_legal(self, changed_points: list[Point]) -> None:
+        """
+        An empty point can only change between legal and self-capture if one of its neighbors changed, or if a string
+        next to it went in or out of atari. A string's liberties can only have changed if it touches a changed point,
+        and then only by changed points, so it went in or out of atari only if it has exactly one liberty that is not
+        a changed point. That liberty is re-checked along with the changed points and their empty neighbors, and
+        nothing else is, so the cost of a move does not grow with the size of the strings around it.
+
+        The same points are the only ones whose neighbors can have gone in or out of atari, so together with the
+        diagonal corners of the changed points they are also the only ones whose pattern can have changed. Legality is
+        only re-checked when legal_points() is called, patterns when pattern() is.
+        """
+        grid = self._grid
+        changed = set(changed_points)
+        touched = set(changed)
+        # every string next to a changed point, by id
+        strings: dict[int, GoString] = {}
+        for changed_point in changed_points:
+            for neighbor in self._neighbors[changed_point]:
+                neighbor_string = grid.get(neighbor)
+                if neighbor_string is None:
+                    touched.add(neighbor)
+                else:
+                    strings[id(neighbor_string)] = neighbor_string
+
+        for string in strings.values():
+            num_liberties = string.num_liberties
+            if num_liberties - len(changed) <= 1 and num_liberties - len(string.liberties & changed) == 1:
+                touched |= string.liberties - changed
+
+        if self._patterns is not None:
+            patterns = self._writable_patterns()
+            for touched_point in touched:
+                patterns[touched_point.index] = _STALE
+            for changed_point in changed_points:
+                for corner in self._corners[changed_point]:
+                    patterns[corner.index] = _STALE
+
+        self._unchecked |= touched
+
+    def legal_points(self, player: Player) -> set[Point]:
+        """
+        Every empty point where player can place a stone without capturing themselves. Ko is not taken into account,
+        since that depends on the game history rather than the board. The returned set is owned by the board and must
+        not be modified, and is only up to date until the next move.
+        """
+        if self._unchecked:
+            self._check_legal()
+        return self._legal[player]
+
+    def _check_legal(self) -> None:
+        if self._legal_shared:
+            self._legal = {player: points.copy() for player, points in self._legal.items()}
+            self._legal_shared = False
+        grid = self._grid
+        for point in self._unchecked:
+            occupied = grid.get(point) is not None
+            for player, legal_points in self._legal.items():
+                if occupied or self.is_self_capture(player, point):
+                    legal_points.discard(point)
+                else:
+                    legal_points.add(point)
+        self._unchecked.clear()
+
+    def empty_points(self) -> list[Point]:
+        # every empty point in no particular order. The list is owned by the board and must not be modified.
+        return self._empty.points
+
+    def pattern(self, point: Point) -> int:
+        # the 3x3 pattern around an empty point, as described in dlgo.patterns
+        assert self._grid.get(point) is None
+        if self._patterns is None:
+            self._patterns = [_STALE] * (Point(self.num_rows, self.num_cols).index + 1)
+            self._patterns_shared = False
+        pattern = self._patterns[point.index]
+        if pattern == _STALE:
+            pattern = self._writable_patterns()[point.index] = self._compute_pattern(point)
+        return pattern
+
+    def _writable_patterns(self) -> list[int]:
+        # the pattern list, copied first if it is shared with a copy of the board
+        if self._patterns_shared:
+            self._patterns = self._patterns[:]
+            self._patterns_shared = False
+        return self._patterns
+
+    def _compute_pattern(self, point: Point) -> int:
+        pattern = 0
+        for position, neighbor in enumerate(self._neighborhoods[point]):
+            if neighbor is None:
+                pattern |= OFF_BOARD << (2 * position)
+                continue
+            string = self._grid.get(neighbor)
+            if string is None:
+                continue
+            pattern |= string.color.value << (2 * position)
+            if position < 4 and string.num_liberties == 1:
+                pattern |= 1 << (ATARI_SHIFT + position)
+        return pattern
+
+    def is_self_capture(self, player: Player, point: Point) -> bool:
+        """
+        Decides from the neighbors alone whether playing at an empty point would leave the new string without
+        liberties. The move is fine if the point has an empty neighbor, joins a friendly string that has a liberty to
+        spare, or captures an opposite-color string that is in atari.
+        """
+        for neighbor in self._neighbors[point]:
+            neighbor_string = self._grid.get(neighbor)
+            if neighbor_string is None:
+                return False
+            if neighbor_string.color == player:
+                if neighbor_string.num_liberties > 1:
+                    return False
+            elif neighbor_string.num_liberties == 1:
+                return False
+        return True
+
+    def hash_after_move(self, player: Player, point: Point) -> zobrist.Hash:
+        """
+        The zobrist hash the board would have after player places a stone on point, computed from the current hash and
+        the stones the move would capture, without placing anything.
+        """
+        next_hash = self._hash ^ self._codes[player][point.index]
+        captured_codes = self._codes[player.other]
+        captured: list[GoString] = []
+
+        for neighbor in self._neighbors[point]:
+            neighbor_string = self._grid.get(neighbor)
+            if neighbor_string is None or neighbor_string.color == player or neighbor_string.num_liberties != 1:
+                continue
+            if any(neighbor_string is captured_string for captured_string in captured):
+                continue
+            captured.append(neighbor_string)
+            for captured_point in neighbor_string.stones:
+                next_hash ^= captured_codes[captured_point.index]
+
+        return next_hash
+
+    def neighbors(self, point: Point) -> tuple[Point, ...]:
+        # the on-grid neighbors of an on-grid point, from a table shared by all boards of this size
+        return self._neighbors[point]
+
+    def corners(self, point: Point) -> tuple[Point, ...]:
+        # the on-grid diagonal corners of an on-grid point
+        return self._corners[point]
+
+    def point_at(self, index: int) -> Point:
+        # the inverse of Point.index, for points on this board
+        point = Point.from_index(index)
+        assert self.is_on_grid(point)
+        return point
+
     def is_on_grid(self, point: Point) -> bool:
         return 1 <= point.row <= self.num_rows and 1 <= point.col <= self.num_cols
 
@@ -125,6 +425,22 @@ class Board:
     def get_go_string(self, point: Point) -> GoString | None:
         return self._grid.get(point)
 
+    def num_liberties(self, point: Point) -> int:
+        # the liberties of the string at point, 0 if the point is empty
+        string = self._grid.get(point)
+        return 0 if string is None else string.num_liberties
+
+    def colors(self) -> bytes:
+        # the color of every point, laid out as gotypes.color_table describes
+        if self._colors is None:
+            colors = bytearray(color_table(self.num_rows, self.num_cols))
+            stride = self.num_cols + 2
+            for point, string in self._grid.items():
+                if string is not None:
+                    colors[point.row * stride + point.col] = string.color.value
+            self._colors = bytes(colors)
+        return self._colors
+
     def is_point_occupied(self, point: Point) -> bool:
         string = self._grid.get(point)
 
@@ -138,13 +454,14 @@ class Board:
         for point in string.stones:
 
             # for all neighboring points, add the removed point as a liberty if it is part of a GoString
-            for neighbor in point.neighbors():
+            for neighbor in self._neighbors[point]:
                 neighbor_string = self._grid.get(neighbor)
                 if neighbor_string is None:
                     continue
                 if neighbor_string is not string:
                     self._replace_string(neighbor_string.with_liberty(point))
             self._grid[point] = None
+            self._empty.add(point)
 
     def zobrist_hash(self) -> zobrist.Hash:
         return self._hash
@@ -159,13 +476,13 @@ class GameState:
         # The last GameState
         self.previous_state = previous_state
 
-        # A set of hashes of all historical GameStates
+        # A set of the situation hashes of all historical GameStates. It is persistent, so every GameState shares it
+        # with its parent and only adds its parent's situation, instead of copying the whole history.
         if previous_state is None:
-            self.previous_states: frozenset[tuple[Player, zobrist.Hash]] = frozenset(
-            )
+            self.previous_states: PersistentSet = PersistentSet()
         else:
-            self.previous_states: frozenset[tuple[Player, zobrist.Hash]] = previous_state.previous_states | \
-                {(previous_state.next_player, previous_state.board.zobrist_hash())}
+            self.previous_states: PersistentSet = previous_state.previous_states.with_item(
+                previous_state.situation_hash())
 
     @classmethod
     def new_game(cls, board_size: int) -> GameState:
@@ -173,11 +490,11 @@ class GameState:
 
     def apply_move(self, move: Move) -> GameState:
         if move.is_play:
-            next_board = copy.deepcopy(self.board)
+            next_board = self.board.copy()
             next_board.place_stone(self.next_player, move.point)
         else:
             next_board = self.board
-        return GameState(next_board, self.next_player.other, self, move)
+        return type(self)(next_board, self.next_player.other, self, move)
 
     @staticmethod
     def apply_sequence(init_state: GameState, moves: Iterable[Point]) -> GameState:
@@ -204,9 +521,7 @@ class GameState:
         """
         if not move.is_play:
             return False
-        future_board = copy.deepcopy(self.board)
-        future_board.place_stone(player, move.point)
-        return len(future_board.get_go_string(move.point).liberties) == 0
+        return self.board.is_self_capture(player, move.point)
 
     """
     Ko: A situation that arises when a player plays a move where the resulting GameState is identical to another
@@ -217,23 +532,78 @@ class GameState:
     def situation(self) -> tuple[Player, Board]:
         return self.next_player, self.board
 
+    def situation_hash(self, include_ko: bool = False, include_passes: bool = False) -> zobrist.Hash:
+        """
+        A single 64-bit key for the situation: the board's zobrist hash with the side to move folded in. Optionally,
+        the simple-ko point and the number of consecutive passes are folded in too, for caches that must tell those
+        apart. Positional superko only needs the default.
+        """
+        situation_hash = self.board.zobrist_hash() ^ zobrist.to_move_code(self.next_player)
+        if include_ko:
+            ko_point = self.ko_point
+            if ko_point is not None:
+                situation_hash ^= zobrist.ko_code(ko_point)
+        if include_passes:
+            situation_hash ^= zobrist.pass_code(self.num_passes)
+        return situation_hash
+
+    @property
+    def ko_point(self) -> Point | None:
+        """
+        The point the next player can not immediately retake on, if the last move captured a single stone with a
+        single stone that is now in atari.
+        """
+        if self.last_move is None or not self.last_move.is_play:
+            return None
+        string = self.board.get_go_string(self.last_move.point)
+        if len(string.stones) != 1 or string.num_liberties != 1:
+            return None
+        (liberty,) = string.liberties
+        captured = self.previous_state.board.get_go_string(liberty)
+        if captured is None or len(captured.stones) != 1:
+            return None
+        return liberty
+
+    @property
+    def num_passes(self) -> int:
+        # the number of consecutive passes that led to this state
+        num_passes = 0
+        game_state = self
+        while num_passes < 2 and game_state.last_move is not None and game_state.last_move.is_pass:
+            num_passes += 1
+            game_state = game_state.previous_state
+        return num_passes
+
     def violates_ko(self, player: Player, move: Move) -> bool:
         if not move.is_play:
             return False
-        next_board = copy.deepcopy(self.board)
-        next_board.place_stone(player, move.point)
-        next_situation: tuple[Player, zobrist.Hash] = (
-            player.other, next_board.zobrist_hash())
+        next_situation = self.board.hash_after_move(player, move.point) ^ zobrist.to_move_code(player.other)
 
         return next_situation in self.previous_states
 
+    def legal_moves(self) -> list[Move]:
+        """
+        All valid moves for the next player. Candidate points come from the board's incrementally maintained legal
+        point set, so only the ko check is done here.
+        """
+        if self.is_over():
+            return []
+        moves: list[Move] = []
+        for point in self.board.legal_points(self.next_player):
+            move = Move.play(point)
+            if not self.violates_ko(self.next_player, move):
+                moves.append(move)
+        moves.append(Move.pass_turn())
+        moves.append(Move.resign_turn())
+        return moves
+
     def is_valid_move(self, move: Move) -> bool:
         if self.is_over():
             return False
         if move.is_pass or move.is_resign:
             return True
         return (
-            self.board.get_go_string(move.point) is None and
+            not self.board.is_point_occupied(move.point) and
             not self.is_move_self_capture(self.next_player, move) and
             not self.violates_ko(self.next_player, move)
         )
@@ -0,0 +1,543 @@
+from __future__ import annotations
+from array import array
+from collections import namedtuple
+from functools import lru_cache
+from dlgo.gotypes import Point, Player, EmptyPoints, neighbor_table, corner_table
+# Move is re-exported, so that the engine modules can stand in for each other (from dlgo import goboard_fast as goboard)
+from dlgo.goboard import GoString, Move  # noqa: F401
+from dlgo import goboard, zobrist
+
+"""
+An array-backed GoBoard. Instead of mapping every Point to an immutable GoString (which has to be rebuilt on every
+merge, liberty change and capture), stones are kept in a flat integer array with a one-point border around the
+playing area:
+
+    index = row * (num_cols + 2) + col
+
+Strings are tracked with a union-find structure: every stone points at a parent stone, and the root of each string
+holds the liberty count, the sum of the liberty indices and the number of stones of the whole string. Strings are
+merged by size, so that the smaller string hangs below the root of the larger one. A stone that joins a single string
+(the usual case) updates its liberties from its own neighbors; only a stone that joins several strings has to
+recount, since they may share liberties. The stones of a string are additionally linked in a circular list, so that
+captures and GoString lookups can walk a string without searching the board. The liberty sum of a string with a
+single liberty is that liberty, which the legal point updates use instead of walking the string.
+
+The color, liberty and size arrays are a bytearray and arrays rather than lists: copying them for every
+GameState.apply_move is a plain memory copy, and they add nothing for the garbage collector to scan.
+
+The public API matches dlgo.goboard.Board, so GameState and the agents work unchanged. GoStrings are only built when
+get_go_string is called, and kept until the board changes.
+"""
+
+EMPTY = 0
+BORDER = 3
+
+# index -> owner of a point, as stored in the color array
+_PLAYERS: tuple[Player | None, ...] = (None, Player.BLACK, Player.WHITE)
+
+# a play_in_place move: the stone placed, its position in the empty points, the hash before the move, and the previous
+# (index, color, parent, next, liberties, liberty sum, size) of every index the move can change
+_JournalEntry = namedtuple('_JournalEntry', 'player point position previous_hash saved num_captured')
+
+
+@lru_cache(maxsize=None)
+def _points(num_rows: int, num_cols: int) -> tuple[Point | None, ...]:
+    # index -> Point for every on-grid index, None for border indices
+    stride = num_cols + 2
+    points: list[Point | None] = [None] * ((num_rows + 2) * stride)
+    for row in range(1, num_rows + 1):
+        for col in range(1, num_cols + 1):
+            points[row * stride + col] = Point(row, col)
+    return tuple(points)
+
+
+@lru_cache(maxsize=None)
+def _indices(num_rows: int, num_cols: int) -> dict[Point, int]:
+    # Point -> index for every on-grid point, so that a lookup also tells whether a point is on the grid
+    return {point: index for index, point in enumerate(_points(num_rows, num_cols)) if point is not None}
+
+
+@lru_cache(maxsize=None)
+def _hash_codes(num_rows: int, num_cols: int) -> tuple[tuple[int, ...], ...]:
+    # color -> index -> zobrist code, so that hashing a stone is two list lookups
+    table = zobrist.hash_table(num_rows, num_cols)
+    points = _points(num_rows, num_cols)
+    codes: list[tuple[int, ...]] = [()]
+    for player in (Player.BLACK, Player.WHITE):
+        codes.append(tuple(
+            0 if point is None else table[player][point.index] for point in points
+        ))
+    return tuple(codes)
+
+
+class Board:
+    def __init__(self, num_rows: int, num_cols: int) -> None:
+        self.num_rows = num_rows
+        self.num_cols = num_cols
+
+        self._stride = num_cols + 2
+        self._offsets = (-self._stride, self._stride, -1, 1)
+        self._points = _points(num_rows, num_cols)
+        self._indices = _indices(num_rows, num_cols)
+        self._codes = _hash_codes(num_rows, num_cols)
+        self._neighbors = neighbor_table(num_rows, num_cols)
+        self._corners = corner_table(num_rows, num_cols)
+
+        size = (num_rows + 2) * self._stride
+        self._color = bytearray([BORDER]) * size
+        for index, point in enumerate(self._points):
+            if point is not None:
+                self._color[index] = EMPTY
+
+        # union-find parent, circular "next stone in string" link and per-root liberty count, sum of the liberty indices
+        # and number of stones
+        self._parent = list(range(size))
+        self._next = list(range(size))
+        self._liberties = array('H', [0]) * size
+        self._liberty_sums = array('L', [0]) * size
+        self._sizes = array('H', [1]) * size
+        # GoStrings built by get_go_string by root, until the next move
+        self._strings: dict[int, GoString] = {}
+
+        self._hash = zobrist.EMPTY_BOARD
+        self._empty = EmptyPoints(num_rows, num_cols)
+
+        # for each player, every empty point they can play on without self-capture, whether the sets are shared with a
+        # copy, and the indices whose legality may have changed since legal_points() last re-checked them (see
+        # goboard.Board)
+        all_points = {point for point in self._points if point is not None}
+        self._legal: dict[Player, set[Point]] = {
+            Player.BLACK: all_points,
+            Player.WHITE: set(all_points),
+        }
+        self._legal_shared = False
+        self._unchecked: set[int] = set()
+
+        # what play_in_place changed, most recent move last, so that undo() can restore it
+        self._journal: list[_JournalEntry] = []
+
+    def copy(self) -> Board:
+        # the point and hash tables are shared between all boards of the same size, only copy the state arrays
+        if len(self._unchecked) > goboard.MAX_UNCHECKED:
+            self._check_legal()
+        board = Board.__new__(Board)
+        board.__dict__.update(self.__dict__)
+        board._color = self._color[:]
+        board._parent = self._parent[:]
+        board._next = self._next[:]
+        board._liberties = self._liberties[:]
+        board._liberty_sums = self._liberty_sums[:]
+        board._sizes = self._sizes[:]
+        board._strings = {}
+        board._empty = self._empty.copy()
+        board._legal_shared = self._legal_shared = True
+        board._unchecked = self._unchecked.copy()
+        # a copy starts a history of its own
+        board._journal = []
+        return board
+
+    def __deepcopy__(self, memo: dict) -> Board:
+        return self.copy()
+
+    def _index(self, point: Point) -> int:
+        return point.row * self._stride + point.col
+
+    def _find(self, index: int) -> int:
+        parent = self._parent
+        while parent[index] != index:
+            # path halving
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    def _stones(self, root: int) -> list[int]:
+        stones = [root]
+        stone = self._next[root]
+        while stone != root:
+            stones.append(stone)
+            stone = self._next[stone]
+        return stones
+
+    def _string_liberties(self, root: int) -> set[int]:
+        color = self._color
+        return {
+            stone + offset for stone in self._stones(root) for offset in self._offsets if color[stone + offset] == EMPTY
+        }
+
+    def _union(self, root_a: int, root_b: int) -> int:
+        # attach the smaller string below the root of the larger one, and splice the two circular stone lists together
+        sizes = self._sizes
+        if sizes[root_a] < sizes[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parent[root_b] = root_a
+        sizes[root_a] += sizes[root_b]
+        self._next[root_a], self._next[root_b] = self._next[root_b], self._next[root_a]
+        return root_a
+
+    def place_stone(self, player: Player, point: Point) -> None:
+        """
+        To place a stone, do the following:
+
+        1. merge any adjacent strings of the same color
+        2. reduce liberties of any adjacent strings of opposite color
+        3. if any opposite-color strings have zero liberties, remove them.
+        """
+        assert self.is_on_grid(point)
+        index = self._index(point)
+        assert self._color[index] == EMPTY
+
+        color = self._color
+        own = player.value
+        liberties = self._liberties
+        liberty_sums = self._liberty_sums
+        self._strings.clear()
+
+        adjacent_same_color: list[int] = []
+        adjacent_opposite_color: list[int] = []
+        num_empty = 0
+        empty_sum = 0
+
+        # sort neighbors into categories: same color, opposite color, unoccupied (liberty)
+        for offset in self._offsets:
+            neighbor = index + offset
+            neighbor_color = color[neighbor]
+            if neighbor_color == EMPTY:
+                num_empty += 1
+                empty_sum += neighbor
+            elif neighbor_color == BORDER:
+                continue
+            else:
+                root = self._find(neighbor)
+                if neighbor_color == own:
+                    if root not in adjacent_same_color:
+                        adjacent_same_color.append(root)
+                elif root not in adjacent_opposite_color:
+                    adjacent_opposite_color.append(root)
+
+        color[index] = own
+        self._parent[index] = index
+        self._next[index] = index
+        self._sizes[index] = 1
+        self._hash ^= self._codes[own][index]
+        self._empty.remove(point)
+
+        # merge all same-colored strings together. A single string loses the point and gains every empty neighbor of
+        # the stone that is not already one of its liberties. Several strings may share liberties, so their merged
+        # string is recounted.
+        if len(adjacent_same_color) == 1:
+            (string_root,) = adjacent_same_color
+            num_liberties = liberties[string_root] - 1
+            liberty_sum = liberty_sums[string_root] - index
+            for offset in self._offsets:
+                neighbor = index + offset
+                if color[neighbor] == EMPTY and not self._touches(neighbor, string_root):
+                    num_liberties += 1
+                    liberty_sum += neighbor
+            root = self._union(string_root, index)
+            liberties[root] = num_liberties
+            liberty_sums[root] = liberty_sum
+        elif adjacent_same_color:
+            root = index
+            for same_color_root in adjacent_same_color:
+                root = self._union(same_color_root, root)
+            string_liberties = self._string_liberties(root)
+            liberties[root] = len(string_liberties)
+            liberty_sums[root] = sum(string_liberties)
+        else:
+            liberties[index] = num_empty
+            liberty_sums[index] = empty_sum
+
+        # the placed stone takes away exactly one liberty of every adjacent opposite-color string
+        changed = [index]
+        for other_color_root in adjacent_opposite_color:
+            liberties[other_color_root] -= 1
+            liberty_sums[other_color_root] -= index
+            if liberties[other_color_root] == 0:
+                changed.extend(self._remove_string(other_color_root))
+
+        self._update_legal(changed)
+
+    def _touches(self, index: int, root: int) -> bool:
+        # whether the string of root has a stone next to index
+        color = self._color
+        for offset in self._offsets:
+            neighbor = index + offset
+            if color[neighbor] != EMPTY and color[neighbor] != BORDER and self._find(neighbor) == root:
+                return True
+        return False
+
+    def play_in_place(self, player: Player, point: Point) -> None:
+        """
+        place_stone, recorded in a journal so that undo() can take it back (see goboard.Board.play_in_place).
+
+        A move only writes to the point itself and to the stones of the strings around it: the strings next to the
+        point, and the friendly strings next to a string it captures. The journal keeps the previous array entries of
+        all of those stones. Path halving in _find only ever rewires stones within one of these strings, so restoring
+        them also undoes any rewiring done after the move.
+        """
+        index = self._index(point)
+        color = self._color
+        own = player.value
+        roots: list[int] = []
+        for offset in self._offsets:
+            neighbor_color = color[index + offset]
+            if neighbor_color == EMPTY or neighbor_color == BORDER:
+                continue
+            root = self._find(index + offset)
+            if root in roots:
+                continue
+            roots.append(root)
+            if neighbor_color != own and self._liberties[root] == 1:
+                for stone in self._stones(root):
+                    for stone_offset in self._offsets:
+                        if color[stone + stone_offset] == own:
+                            friendly_root = self._find(stone + stone_offset)
+                            if friendly_root not in roots:
+                                roots.append(friendly_root)
+
+        parent, next_stone, sizes = self._parent, self._next, self._sizes
+        liberties, liberty_sums = self._liberties, self._liberty_sums
+        saved = [(index, EMPTY, parent[index], next_stone[index], liberties[index], liberty_sums[index], sizes[index])]
+        for root in roots:
+            saved.extend(
+                (stone, color[stone], parent[stone], next_stone[stone], liberties[stone], liberty_sums[stone],
+                 sizes[stone])
+                for stone in self._stones(root)
+            )
+
+        num_empty = len(self._empty)
+        entry = _JournalEntry(player, point, self._empty.position(point), self._hash, saved, 0)
+        self.place_stone(player, point)
+        # captured points are added to the end of the empty points
+        self._journal.append(entry._replace(num_captured=len(self._empty) - num_empty + 1))
+
+    def undo(self) -> None:
+        # takes back the last play_in_place, see goboard.Board.undo
+        if not self._journal:
+            raise ValueError('no move to undo')
+        entry = self._journal.pop()
+
+        changed = [self._index(entry.point)]
+        for _ in range(entry.num_captured):
+            captured_point = self._empty.points[-1]
+            self._empty.remove(captured_point)
+            changed.append(self._index(captured_point))
+        self._empty.restore(entry.point, entry.position)
+
+        color, parent, next_stone = self._color, self._parent, self._next
+        liberties, liberty_sums, sizes = self._liberties, self._liberty_sums, self._sizes
+        for index, index_color, index_parent, index_next, index_liberties, index_sum, index_size in entry.saved:
+            color[index] = index_color
+            parent[index] = index_parent
+            next_stone[index] = index_next
+            liberties[index] = index_liberties
+            liberty_sums[index] = index_sum
+            sizes[index] = index_size
+        self._strings.clear()
+        self._hash = entry.previous_hash
+        self._update_legal(changed)
+
+    @property
+    def num_undoable(self) -> int:
+        return len(self._journal)
+
+    def _update_legal(self, changed: list[int]) -> None:
+        # see goboard.Board._update_legal: collect the changed indices, their empty neighbors and the liberty of every
+        # string next to them that has exactly one liberty apart from the changed indices. That liberty is the liberty
+        # sum of the string less its changed liberties, so the strings are never walked.
+        color = self._color
+        liberties = self._liberties
+        liberty_sums = self._liberty_sums
+        touched = self._unchecked
+        touched.update(changed)
+        # every root next to a changed index, with the number and the sum of its liberties among the changed indices
+        num_changed: dict[int, int] = {}
+        changed_sums: dict[int, int] = {}
+        for changed_index in changed:
+            is_liberty = color[changed_index] == EMPTY
+            roots: list[int] = []
+            for offset in self._offsets:
+                neighbor = changed_index + offset
+                neighbor_color = color[neighbor]
+                if neighbor_color == EMPTY:
+                    touched.add(neighbor)
+                elif neighbor_color != BORDER:
+                    root = self._find(neighbor)
+                    if root not in roots:
+                        roots.append(root)
+            if is_liberty:
+                for root in roots:
+                    num_changed[root] = num_changed.get(root, 0) + 1
+                    changed_sums[root] = changed_sums.get(root, 0) + changed_index
+            else:
+                for root in roots:
+                    num_changed.setdefault(root, 0)
+
+        for root, root_changed in num_changed.items():
+            if liberties[root] - root_changed == 1:
+                touched.add(liberty_sums[root] - changed_sums.get(root, 0))
+
+    def legal_points(self, player: Player) -> set[Point]:
+        if self._unchecked:
+            self._check_legal()
+        return self._legal[player]
+
+    def _check_legal(self) -> None:
+        if self._legal_shared:
+            self._legal = {player: points.copy() for player, points in self._legal.items()}
+            self._legal_shared = False
+        color = self._color
+        for index in self._unchecked:
+            point = self._points[index]
+            occupied = color[index] != EMPTY
+            for player, legal_points in self._legal.items():
+                if occupied or self.is_self_capture(player, point):
+                    legal_points.discard(point)
+                else:
+                    legal_points.add(point)
+        self._unchecked.clear()
+
+    def empty_points(self) -> list[Point]:
+        # every empty point in no particular order. The list is owned by the board and must not be modified.
+        return self._empty.points
+
+    def _remove_string(self, root: int) -> list[int]:
+        color, parent, next_stone = self._color, self._parent, self._next
+        liberties, liberty_sums = self._liberties, self._liberty_sums
+        codes = self._codes[color[root]]
+        points = self._points
+        add_empty = self._empty.add
+        stones = self._stones(root)
+
+        removed_hash = 0
+        for stone in stones:
+            removed_hash ^= codes[stone]
+            color[stone] = EMPTY
+            parent[stone] = stone
+            next_stone[stone] = stone
+            add_empty(points[stone])
+        self._hash ^= removed_hash
+
+        # every removed stone becomes a liberty of each distinct string next to it
+        for stone in stones:
+            neighbor_roots: list[int] = []
+            for offset in self._offsets:
+                neighbor = stone + offset
+                neighbor_color = color[neighbor]
+                if neighbor_color != EMPTY and neighbor_color != BORDER:
+                    neighbor_root = self._find(neighbor)
+                    if neighbor_root not in neighbor_roots:
+                        neighbor_roots.append(neighbor_root)
+                        liberties[neighbor_root] += 1
+                        liberty_sums[neighbor_root] += stone
+
+        return stones
+
+    def is_self_capture(self, player: Player, point: Point) -> bool:
+        color = self._color
+        index = self._indices[point]
+        up, down, left, right = self._offsets
+        if not (color[index + up] and color[index + down] and color[index + left] and color[index + right]):
+            # EMPTY is 0, so one of the neighbors is empty
+            return False
+        own = player.value
+        for offset in self._offsets:
+            neighbor = index + offset
+            neighbor_color = color[neighbor]
+            if neighbor_color == BORDER:
+                continue
+            num_liberties = self._liberties[self._find(neighbor)]
+            if neighbor_color == own:
+                if num_liberties > 1:
+                    return False
+            elif num_liberties == 1:
+                return False
+        return True
+
+    def hash_after_move(self, player: Player, point: Point) -> zobrist.Hash:
+        color = self._color
+        index = self._indices[point]
+        own = player.value
+        # the two colors are 1 and 2
+        other = 3 - own
+        next_hash = self._hash ^ self._codes[own][index]
+        captured: list[int] = []
+
+        for offset in self._offsets:
+            neighbor = index + offset
+            if color[neighbor] != other:
+                continue
+            root = self._find(neighbor)
+            if self._liberties[root] != 1 or root in captured:
+                continue
+            captured.append(root)
+            other_codes = self._codes[other]
+            for stone in self._stones(root):
+                next_hash ^= other_codes[stone]
+
+        return next_hash
+
+    def neighbors(self, point: Point) -> tuple[Point, ...]:
+        return self._neighbors[point]
+
+    def corners(self, point: Point) -> tuple[Point, ...]:
+        return self._corners[point]
+
+    def point_at(self, index: int) -> Point:
+        point = Point.from_index(index)
+        assert self.is_on_grid(point)
+        return point
+
+    def is_on_grid(self, point: Point) -> bool:
+        return 1 <= point.row <= self.num_rows and 1 <= point.col <= self.num_cols
+
+    def get_player(self, point: Point) -> Player | None:
+        if not self.is_on_grid(point):
+            return None
+        return _PLAYERS[self._color[self._index(point)]]
+
+    def get_go_string(self, point: Point) -> GoString | None:
+        if not self.is_on_grid(point):
+            return None
+        index = self._index(point)
+        if self._color[index] == EMPTY:
+            return None
+
+        root = self._find(index)
+        string = self._strings.get(root)
+        if string is None:
+            color = self._color
+            stones = self._stones(root)
+            liberties = [
+                stone + offset for stone in stones for offset in self._offsets if color[stone + offset] == EMPTY
+            ]
+            string = self._strings[root] = GoString(
+                color=_PLAYERS[color[index]],
+                stones=[self._points[stone] for stone in stones],
+                liberties=[self._points[liberty] for liberty in liberties],
+            )
+        return string
+
+    def num_liberties(self, point: Point) -> int:
+        # the liberty count of the string at point, read from its root without building a GoString. 0 if it is empty.
+        index = self._indices.get(point)
+        if index is None or self._color[index] == EMPTY:
+            return 0
+        return self._liberties[self._find(index)]
+
+    def colors(self) -> bytes:
+        # the color array is laid out as gotypes.color_table describes, with BORDER as patterns.OFF_BOARD
+        return bytes(self._color)
+
+    def is_point_occupied(self, point: Point) -> bool:
+        index = self._indices.get(point)
+        return index is not None and self._color[index] != EMPTY
+
+    def zobrist_hash(self) -> zobrist.Hash:
+        return self._hash
+
+
+class GameState(goboard.GameState):
+    @classmethod
+    def new_game(cls, board_size: int) -> GameState:
+        return GameState(Board(board_size, board_size), Player.BLACK, None, None)
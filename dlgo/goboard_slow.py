@@ -1,7 +1,7 @@
 from __future__ import annotations
 from typing import Iterable
 import copy
-from dlgo.gotypes import Point, Player
+from dlgo.gotypes import Point, Player, EmptyPoints, neighbor_table, corner_table, color_table
 
 
 class Move:
@@ -60,6 +60,7 @@ class Board:
         self.num_cols = num_cols
 
         self._grid: dict[Point, GoString | None] = {}
+        self._empty = EmptyPoints(num_rows, num_cols)
 
     def place_stone(self, player: Player, point: Point) -> None:
         """
@@ -98,6 +99,7 @@ class Board:
         # map all points the new_string covers to new_string
         for new_string_point in new_string.stones:
             self._grid[new_string_point] = new_string
+        self._empty.remove(point)
 
         # remove liberties of neighbors that aren't the same color. If no more liberties for a GoString, remove it
         for other_color_string in adjacent_opposite_color:
@@ -106,6 +108,22 @@ class Board:
             if other_color_string.num_liberties == 0:
                 self._remove_string(other_color_string)
 
+    def empty_points(self) -> list[Point]:
+        # every empty point in no particular order. The list is owned by the board and must not be modified.
+        return self._empty.points
+
+    # the tables are looked up on every call rather than stored on the board, so deepcopy does not copy them
+    def neighbors(self, point: Point) -> tuple[Point, ...]:
+        return neighbor_table(self.num_rows, self.num_cols)[point]
+
+    def corners(self, point: Point) -> tuple[Point, ...]:
+        return corner_table(self.num_rows, self.num_cols)[point]
+
+    def point_at(self, index: int) -> Point:
+        point = Point.from_index(index)
+        assert self.is_on_grid(point)
+        return point
+
     def is_on_grid(self, point: Point) -> bool:
         return 1 <= point.row <= self.num_rows and 1 <= point.col <= self.num_cols
 
@@ -120,6 +138,20 @@ class Board:
     def get_go_string(self, point: Point) -> GoString | None:
         return self._grid.get(point)
 
+    def num_liberties(self, point: Point) -> int:
+        # the liberties of the string at point, 0 if the point is empty
+        string = self._grid.get(point)
+        return 0 if string is None else string.num_liberties
+
+    def colors(self) -> bytes:
+        # the color of every point, laid out as gotypes.color_table describes
+        colors = bytearray(color_table(self.num_rows, self.num_cols))
+        stride = self.num_cols + 2
+        for point, string in self._grid.items():
+            if string is not None:
+                colors[point.row * stride + point.col] = string.color.value
+        return bytes(colors)
+
     def is_point_occupied(self, point: Point) -> bool:
         string = self._grid.get(point)
 
@@ -136,6 +168,7 @@ class Board:
                 if neighbor_string is not string:
                     neighbor_string.add_liberty(point)
             self._grid[point] = None
+            self._empty.add(point)
 
 
 class GameState:
@@ -199,6 +232,19 @@ class GameState:
             node = node.previous_state
         return False
 
+    def legal_moves(self) -> list[Move]:
+        if self.is_over():
+            return []
+        moves: list[Move] = []
+        for row in range(1, self.board.num_rows + 1):
+            for col in range(1, self.board.num_cols + 1):
+                move = Move.play(Point(row, col))
+                if self.is_valid_move(move):
+                    moves.append(move)
+        moves.append(Move.pass_turn())
+        moves.append(Move.resign_turn())
+        return moves
+
     def is_valid_move(self, move: Move) -> bool:
         if self.is_over():
             return False
@@ -1,8 +1,12 @@
 from __future__ import annotations
 from enum import Enum
 from collections import namedtuple
+from functools import lru_cache, cached_property
 from typing import List
 
+# the largest board Points are interned and indexed for
+MAX_BOARD_SIZE = 25
+
 
 class Player(Enum):
     BLACK = 1
@@ -14,6 +18,40 @@ class Player(Enum):
 
 
 class Point(namedtuple('Point', 'row col')):
+    """
+    Points are interned: for every coordinate on a board of up to MAX_BOARD_SIZE (plus the ring of points just off
+    the board), Point(row, col) always returns the same object. Every on-board point also has a dense integer index,
+
+        index = (row - 1) * MAX_BOARD_SIZE + (col - 1)
+
+    which does not depend on the size of the board, so tables indexed by it can be shared between board sizes.
+    """
+
+    def __new__(cls, row: int, col: int) -> Point:
+        if 0 <= row <= MAX_BOARD_SIZE + 1 and 0 <= col <= MAX_BOARD_SIZE + 1:
+            interned = _INTERNED[row][col]
+            if interned is not None:
+                return interned
+        return super().__new__(cls, row, col)
+
+    @classmethod
+    def from_index(cls, index: int) -> Point:
+        return _BY_INDEX[index]
+
+    @cached_property
+    def index(self) -> int:
+        return (self.row - 1) * MAX_BOARD_SIZE + (self.col - 1)
+
+    def __reduce__(self):
+        # unpickling goes through __new__, so Points sent to other processes are interned again
+        return Point, (self.row, self.col)
+
+    def __copy__(self) -> Point:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> Point:
+        return self
+
     def neighbors(self) -> List[Point]:
         return [
             Point(self.row - 1, self.col),
@@ -29,3 +67,140 @@ class Point(namedtuple('Point', 'row col')):
             Point(self.row + 1, self.col - 1),
             Point(self.row + 1, self.col + 1)
         ]
+
+
+# every interned Point is created once, here. While the table is being filled, __new__ falls through to tuple.__new__
+_INTERNED: list[list[Point | None]] = [[None] * (MAX_BOARD_SIZE + 2) for _ in range(MAX_BOARD_SIZE + 2)]
+for _row in range(MAX_BOARD_SIZE + 2):
+    for _col in range(MAX_BOARD_SIZE + 2):
+        _INTERNED[_row][_col] = Point(_row, _col)
+
+_BY_INDEX: tuple[Point, ...] = tuple(
+    _INTERNED[row][col] for row in range(1, MAX_BOARD_SIZE + 1) for col in range(1, MAX_BOARD_SIZE + 1)
+)
+
+
+"""
+Point.neighbors() and Point.corners() allocate new Points on every call, and include points that are off the board.
+Boards look neighbors and corners up in these tables instead: for every on-grid point of a board size, the table holds
+only the on-grid neighbors (or diagonal corners). The tables are built once per (num_rows, num_cols) and shared by all
+boards of that size.
+"""
+
+
+@lru_cache(maxsize=None)
+def neighbor_table(num_rows: int, num_cols: int) -> dict[Point, tuple[Point, ...]]:
+    return _on_grid_table(num_rows, num_cols, Point.neighbors)
+
+
+@lru_cache(maxsize=None)
+def corner_table(num_rows: int, num_cols: int) -> dict[Point, tuple[Point, ...]]:
+    return _on_grid_table(num_rows, num_cols, Point.corners)
+
+
+# the eight points around a point, as (row, col) offsets: the four neighbors north, east, south and west, then the corners
+# north-east, south-east, south-west and north-west. North is towards higher rows.
+NEIGHBORHOOD = ((1, 0), (0, 1), (-1, 0), (0, -1), (1, 1), (-1, 1), (-1, -1), (1, -1))
+
+
+@lru_cache(maxsize=None)
+def neighborhood_table(num_rows: int, num_cols: int) -> dict[Point, tuple[Point | None, ...]]:
+    # the eight points around every on-grid point in NEIGHBORHOOD order, with None for points off the board
+    table: dict[Point, tuple[Point | None, ...]] = {}
+    for row in range(1, num_rows + 1):
+        for col in range(1, num_cols + 1):
+            table[Point(row, col)] = tuple(
+                Point(row + d_row, col + d_col) if 1 <= row + d_row <= num_rows and 1 <= col + d_col <= num_cols
+                else None
+                for d_row, d_col in NEIGHBORHOOD
+            )
+    return table
+
+
+@lru_cache(maxsize=None)
+def color_table(num_rows: int, num_cols: int) -> bytes:
+    """
+    The colors of an empty board, as Board.colors() returns them: the board padded by one point on every side, row by
+    row, so that Point(row, col) is at
+
+        row * (num_cols + 2) + col
+
+    Every point holds the Player value of its stone, 0 if it is empty and 3 if it is off the board (patterns.EMPTY and
+    patterns.OFF_BOARD).
+    """
+    stride = num_cols + 2
+    colors = bytearray([3]) * ((num_rows + 2) * stride)
+    for row in range(1, num_rows + 1):
+        colors[row * stride + 1:row * stride + num_cols + 1] = bytes(num_cols)
+    return bytes(colors)
+
+
+def _on_grid_table(num_rows: int, num_cols: int, adjacent) -> dict[Point, tuple[Point, ...]]:
+    table: dict[Point, tuple[Point, ...]] = {}
+    for row in range(1, num_rows + 1):
+        for col in range(1, num_cols + 1):
+            point = Point(row, col)
+            table[point] = tuple(
+                other for other in adjacent(point) if 1 <= other.row <= num_rows and 1 <= other.col <= num_cols
+            )
+    return table
+
+
+class EmptyPoints:
+    """
+    The empty points of a board as a list in no particular order, for sampling a random point in O(1). A point is
+    removed by moving the last point of the list into its slot, so that adding and removing points are O(1) as well.
+    Boards keep one up to date as stones are placed and captured.
+    """
+
+    def __init__(self, num_rows: int, num_cols: int) -> None:
+        self.points: list[Point] = [Point(row, col) for row in range(1, num_rows + 1) for col in range(1, num_cols + 1)]
+        # Point.index -> position of the point in points
+        self._positions: list[int] = [-1] * (Point(num_rows, num_cols).index + 1)
+        for position, point in enumerate(self.points):
+            self._positions[point.index] = position
+
+    def copy(self) -> EmptyPoints:
+        empty_points = EmptyPoints.__new__(EmptyPoints)
+        empty_points.points = self.points[:]
+        empty_points._positions = self._positions[:]
+        return empty_points
+
+    def __deepcopy__(self, memo: dict) -> EmptyPoints:
+        return self.copy()
+
+    def add(self, point: Point) -> None:
+        self._positions[point.index] = len(self.points)
+        self.points.append(point)
+
+    def remove(self, point: Point) -> None:
+        position = self._positions[point.index]
+        last = self.points.pop()
+        if last is not point:
+            self.points[position] = last
+            self._positions[last.index] = position
+        self._positions[point.index] = -1
+
+    def position(self, point: Point) -> int:
+        # where point is in points
+        return self._positions[point.index]
+
+    def restore(self, point: Point, position: int) -> None:
+        """
+        Undoes remove(point), given the position the point had, putting back the point that was moved into its slot.
+        Removals must be undone in reverse order for the list to be exactly as it was.
+        """
+        if position < len(self.points):
+            moved = self.points[position]
+            self._positions[moved.index] = len(self.points)
+            self.points.append(moved)
+            self.points[position] = point
+        else:
+            self.points.append(point)
+        self._positions[point.index] = position
+
+    def __contains__(self, point: Point) -> bool:
+        return 0 <= point.index < len(self._positions) and self._positions[point.index] >= 0
+
+    def __len__(self) -> int:
+        return len(self.points)
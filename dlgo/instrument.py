@@ -0,0 +1,182 @@
+from __future__ import annotations
+import functools
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+from dlgo import goboard_slow, goboard, goboard_fast, bitboard
+from dlgo.agent.base import Agent
+# imported so that their agents are among the Agent subclasses that get instrumented
+from dlgo.agent import naive, mcts  # noqa: F401
+
+__all__ = ['enable', 'disable', 'is_enabled', 'enabled', 'snapshot', 'reset', 'merge']
+
+"""
+Opt-in counters and timers for the hot paths of the boards, game states and agents.
+
+Nothing in the engines knows about this module. enable() replaces the instrumented methods on their classes with
+wrappers that count and time every call, and disable() puts the original functions back, so when instrumentation is
+off there is not even a flag check left on the hot path.
+
+Timed methods, per class that defines them:
+
+    place_stone, _remove_string       boards
+    apply_move, is_move_self_capture  game states
+    violates_ko                       game states (does_not_violate_ko for goboard_slow)
+    select_move                       every Agent subclass
+
+Times are inclusive: apply_move includes the place_stone it calls. place_stone also counts captures (moves that
+captured, and how many stones each captured) and string merges (the number of existing friendly strings every new
+stone joined). Captured stones are derived from the board's empty point count, so they work the same on every engine.
+
+snapshot() returns all counters as a JSON-friendly dict, reset() zeroes them. Self-play and benchmark drivers take a
+snapshot per game.
+"""
+
+_BOARD_METHODS = ('place_stone', '_remove_string')
+_GAME_STATE_METHODS = ('apply_move', 'is_move_self_capture', 'violates_ko', 'does_not_violate_ko')
+
+_BOARD_CLASSES = (goboard_slow.Board, goboard.Board, goboard_fast.Board, bitboard.BitBoard)
+_GAME_STATE_CLASSES = (goboard_slow.GameState, goboard.GameState, goboard_fast.GameState, bitboard.GameState)
+
+# name -> [calls, seconds]
+_timers: dict[str, list] = {}
+# number of stones captured by one move -> number of such moves
+_capture_sizes: dict[int, int] = {}
+_counts = {'captures': 0, 'captured_stones': 0, 'merged_strings': 0}
+
+# (class, method name, original function) of every method replaced by enable()
+_patched: list[tuple[type, str, Callable]] = []
+
+
+def _name(cls: type, method: str) -> str:
+    return f'{cls.__module__.rpartition(".")[2]}.{cls.__qualname__}.{method}'
+
+
+def _timed(name: str, function: Callable) -> Callable:
+    timer = _timers.setdefault(name, [0, 0.0])
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            timer[0] += 1
+            timer[1] += time.perf_counter() - start
+
+    return wrapper
+
+
+def _counted_place_stone(name: str, function: Callable) -> Callable:
+    timed = _timed(name, function)
+
+    @functools.wraps(function)
+    def place_stone(board, player, point):
+        # the friendly strings next to the point, each identified by its stones
+        merged = {
+            frozenset(board.get_go_string(neighbor).stones)
+            for neighbor in board.neighbors(point) if board.get_player(neighbor) == player
+        }
+        num_empty = len(board.empty_points())
+
+        timed(board, player, point)
+
+        _counts['merged_strings'] += len(merged)
+        captured = len(board.empty_points()) - num_empty + 1
+        if captured:
+            _counts['captures'] += 1
+            _counts['captured_stones'] += captured
+            _capture_sizes[captured] = _capture_sizes.get(captured, 0) + 1
+
+    return place_stone
+
+
+def _agent_classes() -> list[type]:
+    classes = []
+    pending = [Agent]
+    while pending:
+        cls = pending.pop()
+        classes.append(cls)
+        pending.extend(cls.__subclasses__())
+    return classes
+
+
+def _patch(cls: type, method: str) -> None:
+    # only methods defined on the class itself, inherited ones are patched on the class that defines them
+    original = cls.__dict__.get(method)
+    if original is None:
+        return
+    name = _name(cls, method)
+    wrapper = _counted_place_stone(name, original) if method == 'place_stone' else _timed(name, original)
+    _patched.append((cls, method, original))
+    setattr(cls, method, wrapper)
+
+
+def enable() -> None:
+    if _patched:
+        return
+    for cls in _BOARD_CLASSES:
+        for method in _BOARD_METHODS:
+            _patch(cls, method)
+    for cls in _GAME_STATE_CLASSES:
+        for method in _GAME_STATE_METHODS:
+            _patch(cls, method)
+    for cls in _agent_classes():
+        _patch(cls, 'select_move')
+
+
+def disable() -> None:
+    while _patched:
+        cls, method, original = _patched.pop()
+        setattr(cls, method, original)
+
+
+def is_enabled() -> bool:
+    return bool(_patched)
+
+
+@contextmanager
+def enabled() -> Iterator[None]:
+    was_enabled = is_enabled()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def reset() -> None:
+    for timer in _timers.values():
+        timer[0] = 0
+        timer[1] = 0.0
+    _capture_sizes.clear()
+    for key in _counts:
+        _counts[key] = 0
+
+
+def snapshot() -> dict:
+    return {
+        'timers': {
+            name: {'calls': calls, 'seconds': seconds} for name, (calls, seconds) in sorted(_timers.items()) if calls
+        },
+        'capture_sizes': dict(sorted(_capture_sizes.items())),
+        **_counts,
+    }
+
+
+def merge(snapshots: list[dict]) -> dict:
+    # adds up snapshots, e.g. the per-game snapshots of a self-play run
+    total = {'timers': {}, 'capture_sizes': {}, **{key: 0 for key in _counts}}
+    for counters in snapshots:
+        for name, timer in counters['timers'].items():
+            total_timer = total['timers'].setdefault(name, {'calls': 0, 'seconds': 0.0})
+            total_timer['calls'] += timer['calls']
+            total_timer['seconds'] += timer['seconds']
+        for size, count in counters['capture_sizes'].items():
+            total['capture_sizes'][size] = total['capture_sizes'].get(size, 0) + count
+        for key in _counts:
+            total[key] += counters[key]
+    total['timers'] = dict(sorted(total['timers'].items()))
+    total['capture_sizes'] = dict(sorted(total['capture_sizes'].items()))
+    return total
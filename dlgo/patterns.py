@@ -0,0 +1,137 @@
+from __future__ import annotations
+import random
+from typing import Sequence
+from dlgo.gotypes import Player, Point
+
+__all__ = ['PatternTable', 'pattern_from_diagram', 'symmetries', 'swap_colors', 'EMPTY', 'OFF_BOARD', 'NUM_PATTERNS']
+
+"""
+3x3 patterns around empty points, for playout policies that prefer some moves over others.
+
+A pattern is an int. Its low 16 bits hold the color of the eight points around the center, two bits each, in
+gotypes.NEIGHBORHOOD order (north, east, south, west, then north-east, south-east, south-west, north-west): EMPTY,
+Player.BLACK.value, Player.WHITE.value or OFF_BOARD. Bits 16 to 19 flag the four direct neighbors that belong to a
+string in atari, in the same order. goboard.Board keeps the pattern of every empty point up to date (see
+Board.pattern), so a policy can weight a candidate move with one table lookup.
+
+Patterns are easiest to write as diagrams, see pattern_from_diagram. PatternTable stores every pattern under all eight
+rotations and reflections of the board, and for both players, so lookups need no canonical form.
+"""
+
+EMPTY = 0
+OFF_BOARD = 3
+ATARI_SHIFT = 16
+NUM_PATTERNS = 1 << (ATARI_SHIFT + 4)
+
+# where each of the eight points goes when the board is turned a quarter clockwise, or mirrored east to west
+_ROTATION = (1, 2, 3, 0, 5, 6, 7, 4)
+_REFLECTION = (0, 3, 2, 1, 7, 6, 5, 4)
+
+# diagram rows from north to south, as positions in NEIGHBORHOOD order (None is the center)
+_DIAGRAM = ((7, 0, 4), (3, None, 1), (6, 2, 5))
+_DIAGRAM_COLORS = {
+    '.': (EMPTY, False), '#': (OFF_BOARD, False),
+    'X': (Player.BLACK.value, False), 'O': (Player.WHITE.value, False),
+    'x': (Player.BLACK.value, True), 'o': (Player.WHITE.value, True),
+}
+
+
+def pattern_from_diagram(diagram: str) -> int:
+    """
+    The pattern of a 3x3 diagram, given as three rows from north to south, e.g.
+
+        XO.
+        .*.
+        ###
+
+    for a point on the southern edge. X and O are black and white stones, x and o stones in atari (only on the four
+    direct neighbors), . empty points, # off the board, and the center is any character.
+    """
+    rows = diagram.split()
+    if len(rows) != 3 or any(len(row) != 3 for row in rows):
+        raise ValueError(f'a pattern diagram has three rows of three points, got {diagram!r}')
+
+    pattern = 0
+    for row, positions in zip(rows, _DIAGRAM):
+        for char, position in zip(row, positions):
+            if position is None:
+                continue
+            if char not in _DIAGRAM_COLORS:
+                raise ValueError(f'unknown point {char!r} in pattern diagram')
+            color, in_atari = _DIAGRAM_COLORS[char]
+            if in_atari and position >= 4:
+                raise ValueError('only the four direct neighbors can be marked as in atari')
+            pattern |= color << (2 * position)
+            if in_atari:
+                pattern |= 1 << (ATARI_SHIFT + position)
+    return pattern
+
+
+def _permute(pattern: int, permutation: Sequence[int]) -> int:
+    permuted = 0
+    for position, target in enumerate(permutation):
+        permuted |= ((pattern >> (2 * position)) & 3) << (2 * target)
+        if position < 4 and pattern & (1 << (ATARI_SHIFT + position)):
+            permuted |= 1 << (ATARI_SHIFT + target)
+    return permuted
+
+
+def symmetries(pattern: int) -> set[int]:
+    # the pattern under every rotation and reflection of the board
+    patterns = set()
+    for _ in range(4):
+        patterns.add(pattern)
+        patterns.add(_permute(pattern, _REFLECTION))
+        pattern = _permute(pattern, _ROTATION)
+    return patterns
+
+
+def swap_colors(pattern: int) -> int:
+    swapped = pattern & ~0xffff
+    for position in range(8):
+        color = (pattern >> (2 * position)) & 3
+        if color == Player.BLACK.value or color == Player.WHITE.value:
+            color ^= Player.BLACK.value ^ Player.WHITE.value
+        swapped |= color << (2 * position)
+    return swapped
+
+
+class PatternTable:
+    """
+    Move weights by pattern, for a playout policy. Patterns are added as seen by black; the table looks them up with
+    the colors swapped when white is to move. Points whose pattern was never added weigh default.
+    """
+
+    def __init__(self, default: float = 1.0) -> None:
+        self.default = default
+        self._weights: dict[Player, dict[int, float]] = {Player.BLACK: {}, Player.WHITE: {}}
+
+    def add(self, pattern: int | str, weight: float) -> None:
+        # pattern is a pattern code or a diagram for pattern_from_diagram
+        if isinstance(pattern, str):
+            pattern = pattern_from_diagram(pattern)
+        for symmetric in symmetries(pattern):
+            self._weights[Player.BLACK][symmetric] = weight
+            self._weights[Player.WHITE][swap_colors(symmetric)] = weight
+
+    def __len__(self) -> int:
+        return len(self._weights[Player.BLACK])
+
+    def __contains__(self, pattern: int) -> bool:
+        return pattern in self._weights[Player.BLACK]
+
+    def weight(self, board, point: Point, player: Player) -> float:
+        return self._weights[player].get(board.pattern(point), self.default)
+
+    def weights(self, board, points: Sequence[Point], player: Player) -> list[float]:
+        weights = self._weights[player]
+        default = self.default
+        pattern = board.pattern
+        return [weights.get(pattern(point), default) for point in points]
+
+    def choose(self, board, points: Sequence[Point], player: Player, rng: random.Random | None = None) -> Point | None:
+        # one of points, drawn with probability proportional to its weight, or None if all weights are zero
+        weights = self.weights(board, points, player)
+        if not points or not any(weights):
+            return None
+        return (rng or random).choices(points, weights)[0]
@@ -0,0 +1,125 @@
+from __future__ import annotations
+from typing import Hashable, Iterator
+
+"""
+A persistent (immutable) hash set, implemented as a hash array mapped trie.
+
+Adding an item returns a new set and leaves the old one untouched, but the two share every part of the trie except
+the path from the root to the new item. With 32-way branching that path is only a few nodes long, so adding an item
+and checking membership are effectively O(1), no matter how many sets share the same history. This is what GameState
+needs to keep the situations of a whole game: every GameState extends its parent's set by one item, and siblings in a
+search tree all share their parent's set.
+"""
+
+_BITS = 5
+_MASK = (1 << _BITS) - 1
+_HASH_BITS = 64
+_HASH_MASK = (1 << _HASH_BITS) - 1
+
+
+class _Node:
+    # entries are stored densely: bit i of bitmap says whether the slot for hash chunk i is used
+    __slots__ = ('bitmap', 'entries')
+
+    def __init__(self, bitmap: int, entries: tuple) -> None:
+        self.bitmap = bitmap
+        self.entries = entries
+
+
+class _Bucket:
+    # items whose full hashes are equal
+    __slots__ = ('items',)
+
+    def __init__(self, items: tuple) -> None:
+        self.items = items
+
+
+def _hash(item: Hashable) -> int:
+    return hash(item) & _HASH_MASK
+
+
+def _pair(item_a: Hashable, hash_a: int, item_b: Hashable, hash_b: int, shift: int) -> _Node | _Bucket:
+    if shift >= _HASH_BITS:
+        return _Bucket((item_a, item_b))
+
+    chunk_a = (hash_a >> shift) & _MASK
+    chunk_b = (hash_b >> shift) & _MASK
+    if chunk_a == chunk_b:
+        return _Node(1 << chunk_a, (_pair(item_a, hash_a, item_b, hash_b, shift + _BITS),))
+    if chunk_a < chunk_b:
+        return _Node((1 << chunk_a) | (1 << chunk_b), (item_a, item_b))
+    return _Node((1 << chunk_a) | (1 << chunk_b), (item_b, item_a))
+
+
+def _insert(node: _Node | _Bucket, item: Hashable, item_hash: int, shift: int) -> _Node | _Bucket:
+    if isinstance(node, _Bucket):
+        if item in node.items:
+            return node
+        return _Bucket(node.items + (item,))
+
+    bit = 1 << ((item_hash >> shift) & _MASK)
+    position = (node.bitmap & (bit - 1)).bit_count()
+
+    if not node.bitmap & bit:
+        entries = node.entries[:position] + (item,) + node.entries[position:]
+        return _Node(node.bitmap | bit, entries)
+
+    entry = node.entries[position]
+    if isinstance(entry, (_Node, _Bucket)):
+        replacement = _insert(entry, item, item_hash, shift + _BITS)
+        if replacement is entry:
+            return node
+    elif entry == item:
+        return node
+    else:
+        replacement = _pair(entry, _hash(entry), item, item_hash, shift + _BITS)
+
+    entries = node.entries[:position] + (replacement,) + node.entries[position + 1:]
+    return _Node(node.bitmap, entries)
+
+
+class PersistentSet:
+    def __init__(self) -> None:
+        self._root: _Node | _Bucket = _Node(0, ())
+        self._size = 0
+
+    def with_item(self, item: Hashable) -> PersistentSet:
+        root = _insert(self._root, item, _hash(item), 0)
+        if root is self._root:
+            return self
+
+        new_set = PersistentSet.__new__(PersistentSet)
+        new_set._root = root
+        new_set._size = self._size + 1
+        return new_set
+
+    def __contains__(self, item: Hashable) -> bool:
+        item_hash = _hash(item)
+        node = self._root
+        shift = 0
+
+        while isinstance(node, _Node):
+            bit = 1 << ((item_hash >> shift) & _MASK)
+            if not node.bitmap & bit:
+                return False
+            entry = node.entries[(node.bitmap & (bit - 1)).bit_count()]
+            if not isinstance(entry, (_Node, _Bucket)):
+                return entry == item
+            node = entry
+            shift += _BITS
+
+        return item in node.items
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Hashable]:
+        stack: list[_Node | _Bucket] = [self._root]
+        while stack:
+            node = stack.pop()
+            entries = node.items if isinstance(node, _Bucket) else node.entries
+            for entry in entries:
+                if isinstance(entry, (_Node, _Bucket)):
+                    stack.append(entry)
+                else:
+                    yield entry
@@ -0,0 +1,94 @@
+from __future__ import annotations
+from collections import namedtuple
+import numpy as np
+from dlgo.goboard import Board, GameState
+from dlgo.gotypes import Player, Point
+
+__all__ = ['GameResult', 'compute_game_result', 'territory']
+
+"""
+Area scoring: every player scores their stones on the board plus the empty points of their territory, and white gets
+komi on top. An empty region is territory of a player if every stone it touches is theirs; regions that touch both
+colors (or none, on an empty board) are neutral. Dead stones are not detected, so games should be played out until
+they are settled, as random playouts are.
+
+Regions are found without labeling them one by one: starting from the stones of each player, reachability is grown
+through empty points with shifted boolean arrays until it stops changing. An empty point reachable from both players
+belongs to a neutral region. Each step costs a handful of array operations on the whole board, and the number of
+steps is bounded by the size of the largest empty region, so this stays cheap enough for the end of every playout.
+"""
+
+
+class GameResult(namedtuple('GameResult', 'b w komi')):
+    # b and w are the points of black and white without komi: stones on the board plus territory
+
+    @property
+    def winner(self) -> Player | None:
+        # None for a draw, which only an integer komi allows
+        white = self.w + self.komi
+        if self.b == white:
+            return None
+        return Player.BLACK if self.b > white else Player.WHITE
+
+    @property
+    def winning_margin(self) -> float:
+        return abs(self.b - (self.w + self.komi))
+
+    def __str__(self) -> str:
+        # as an SGF RE value, where 0 is a draw
+        winner = self.winner
+        if winner is None:
+            return '0'
+        return f'{"B" if winner == Player.BLACK else "W"}+{self.winning_margin:g}'
+
+
+_POINTS: dict[tuple[int, int], list[Point]] = {}
+
+
+def _stone_grid(board: Board) -> np.ndarray:
+    # the board as a (num_rows, num_cols) array of Player values, 0 for empty points
+    size = (board.num_rows, board.num_cols)
+    points = _POINTS.get(size)
+    if points is None:
+        points = _POINTS[size] = [Point(row, col) for row in range(1, size[0] + 1) for col in range(1, size[1] + 1)]
+    get_player = board.get_player
+    values = [0 if player is None else player.value for player in map(get_player, points)]
+    return np.array(values, dtype=np.int8).reshape(size)
+
+
+def _territory(grid: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    empty = grid == 0
+    # reached[0] and reached[1] are the points reachable from black and from white stones, padded by one on each side
+    # so that neighbors are plain slices
+    reached = np.zeros((2, grid.shape[0] + 2, grid.shape[1] + 2), dtype=bool)
+    reached[0, 1:-1, 1:-1] = grid == Player.BLACK.value
+    reached[1, 1:-1, 1:-1] = grid == Player.WHITE.value
+
+    inner = reached[:, 1:-1, 1:-1]
+    while True:
+        grown = inner | (empty & (
+            reached[:, :-2, 1:-1] | reached[:, 2:, 1:-1] | reached[:, 1:-1, :-2] | reached[:, 1:-1, 2:]
+        ))
+        if np.array_equal(grown, inner):
+            break
+        inner[...] = grown
+
+    black, white = inner
+    return empty & black & ~white, empty & white & ~black
+
+
+def territory(board: Board) -> tuple[np.ndarray, np.ndarray]:
+    """
+    The territory of black and of white as (num_rows, num_cols) boolean arrays, indexed [row - 1, col - 1].
+    """
+    return _territory(_stone_grid(board))
+
+
+def compute_game_result(game_state: GameState, komi: float = 7.5) -> GameResult:
+    grid = _stone_grid(game_state.board)
+    black_territory, white_territory = _territory(grid)
+    return GameResult(
+        int(np.count_nonzero(grid == Player.BLACK.value)) + int(np.count_nonzero(black_territory)),
+        int(np.count_nonzero(grid == Player.WHITE.value)) + int(np.count_nonzero(white_territory)),
+        komi,
+    )
@@ -0,0 +1,187 @@
+from __future__ import annotations
+import random
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator
+from dlgo import goboard, goboard_fast, bitboard, instrument
+from dlgo.agent.base import Agent
+from dlgo.agent.naive import NaiveAgent
+from dlgo.agent.mcts import MCTSAgent
+from dlgo.gotypes import Player
+from dlgo.scoring import compute_game_result
+
+__all__ = ['GameRecord', 'SelfPlayStats', 'make_agent', 'play_game', 'play_games', 'sgf_result', 'AGENTS', 'ENGINES']
+
+"""
+Headless bot-vs-bot games for bulk simulation. Games are independent, so they are spread over a process pool (one
+worker per core by default) and each finished game is yielded as soon as it is done, in completion order.
+
+Agents are given per color as specs, so they can be sent to worker processes and built there:
+
+    naive
+    mcts:num_playouts=200,exploration=1.0
+
+i.e. a name from AGENTS, optionally followed by keyword arguments for its constructor.
+"""
+
+AGENTS: dict[str, type[Agent]] = {
+    'naive': NaiveAgent,
+    'mcts': MCTSAgent,
+}
+
+ENGINES: dict[str, type[goboard.GameState]] = {
+    'goboard': goboard.GameState,
+    'fast': goboard_fast.GameState,
+    'bitboard': bitboard.GameState,
+}
+
+# winner is None if the game was cut off at max_moves, or if it was scored a draw (margin 0). counters is an
+# instrument.snapshot() of instrumented games, moves the list of Moves played if they were recorded, margin the winning
+# margin of games that were scored.
+GameRecord = namedtuple('GameRecord', 'game winner num_moves num_passes resigned seconds counters moves margin',
+                        defaults=(None, None, None))
+
+
+def _parse_value(value: str) -> int | float | bool | str:
+    if value in ('True', 'False'):
+        return value == 'True'
+    for parse in (int, float):
+        try:
+            return parse(value)
+        except ValueError:
+            pass
+    return value
+
+
+def make_agent(spec: str) -> Agent:
+    name, _, arguments = spec.partition(':')
+    if name not in AGENTS:
+        raise ValueError(f'unknown agent {name!r}, expected one of {", ".join(AGENTS)}')
+
+    kwargs = {}
+    for argument in filter(None, arguments.split(',')):
+        key, _, value = argument.partition('=')
+        kwargs[key.strip()] = _parse_value(value.strip())
+    return AGENTS[name](**kwargs)
+
+
+def play_game(game: int, black: str, white: str, board_size: int = 9, engine: str = 'goboard', komi: float = 7.5,
+              seed: int | None = None, max_moves: int | None = None, instrumented: bool = False,
+              record_moves: bool = False) -> GameRecord:
+    """
+    Plays one game between the agents given by the black and white specs. If seed is given, the game is seeded with
+    seed + game, so that a run can be repeated game by game no matter which worker plays it. If instrumented is set,
+    the record carries the instrument counters of the game, if record_moves is set the moves that were played.
+    """
+    if instrumented:
+        with instrument.enabled():
+            instrument.reset()
+            record = play_game(game, black, white, board_size, engine, komi, seed, max_moves, False, record_moves)
+            return record._replace(counters=instrument.snapshot())
+
+    if seed is not None:
+        random.seed(seed + game)
+    if max_moves is None:
+        max_moves = 4 * board_size * board_size
+
+    start = time.perf_counter()
+    agents = {Player.BLACK: make_agent(black), Player.WHITE: make_agent(white)}
+    game_state = ENGINES[engine].new_game(board_size)
+    num_moves = 0
+    num_passes = 0
+    moves = [] if record_moves else None
+
+    while not game_state.is_over() and num_moves < max_moves:
+        move = agents[game_state.next_player].select_move(game_state)
+        if moves is not None:
+            moves.append(move)
+        num_passes += move.is_pass
+        game_state = game_state.apply_move(move)
+        num_moves += 1
+
+    resigned = game_state.last_move is not None and game_state.last_move.is_resign
+    margin = None
+    if resigned:
+        # the player who resigned is the one who moved last
+        winner = game_state.next_player
+    elif game_state.is_over():
+        result = compute_game_result(game_state, komi)
+        winner = result.winner
+        margin = result.winning_margin
+    else:
+        winner = None
+
+    return GameRecord(game, winner, num_moves, num_passes, resigned, time.perf_counter() - start, None, moves, margin)
+
+
+def sgf_result(record: GameRecord) -> str:
+    # the SGF RE value of a finished game: the winner, and R if the loser resigned or else the winning margin. 0 is a
+    # draw.
+    if record.winner is None:
+        return '0' if record.margin == 0 else '?'
+    winner = 'B+' if record.winner == Player.BLACK else 'W+'
+    if record.resigned:
+        return winner + 'R'
+    return winner if record.margin is None else f'{winner}{record.margin:g}'
+
+
+def play_games(num_games: int, black: str, white: str, workers: int | None = None, **kwargs) -> Iterator[GameRecord]:
+    """
+    Plays num_games games with play_game on a pool of worker processes, one per core unless workers is given, and
+    yields every GameRecord as soon as its game is finished. With workers=0 the games are played in this process.
+    """
+    if workers == 0:
+        for game in range(num_games):
+            yield play_game(game, black, white, **kwargs)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(play_game, game, black, white, **kwargs) for game in range(num_games)]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+class SelfPlayStats:
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.games = 0
+        self.moves = 0
+        self.passes = 0
+        self.resignations = 0
+        self.unfinished = 0
+        self.draws = 0
+        self.wins = {Player.BLACK: 0, Player.WHITE: 0}
+
+    def add(self, record: GameRecord) -> None:
+        self.games += 1
+        self.moves += record.num_moves
+        self.passes += record.num_passes
+        self.resignations += record.resigned
+        if record.winner is None and record.margin == 0:
+            self.draws += 1
+        elif record.winner is None:
+            self.unfinished += 1
+        else:
+            self.wins[record.winner] += 1
+
+    @property
+    def seconds(self) -> float:
+        return time.perf_counter() - self.start
+
+    def summary(self) -> dict[str, float]:
+        seconds = self.seconds
+        return {
+            'games': self.games,
+            'moves': self.moves,
+            'seconds': seconds,
+            'games_per_second': self.games / seconds,
+            'moves_per_second': self.moves / seconds,
+            'average_length': self.moves / self.games if self.games else 0.0,
+            'black_wins': self.wins[Player.BLACK],
+            'white_wins': self.wins[Player.WHITE],
+            'draws': self.draws,
+            'unfinished': self.unfinished,
+            'passes': self.passes,
+            'resignations': self.resignations,
+        }
@@ -0,0 +1,270 @@
+from __future__ import annotations
+import os
+import re
+import string
+from collections import namedtuple
+from typing import Iterable, Iterator, TextIO
+from dlgo import goboard, utils
+from dlgo.goboard import Move
+from dlgo.gotypes import Player, Point
+
+__all__ = ['SGFGame', 'SGFWriter', 'read_games', 'replay', 'sgf_to_point', 'point_to_sgf', 'format_game']
+
+"""
+Reading and writing games in SGF, the Smart Game Format (https://www.red-bean.com/sgf/).
+
+read_games parses a file incrementally: it reads fixed-size chunks, tokenizes them with a single regular expression
+and yields every game as soon as its closing parenthesis has been read, so files with any number of games are
+processed in constant memory. Only the main line of each game is kept (the first variation wherever the game
+branches), as the moves played in order, together with the root properties (board size, komi, result, players, ...)
+and the setup stones of the root node, e.g. handicap stones.
+
+A point is written as two letters, column first and row second, counted from the top left corner. Column letters are
+utils.COLS in lower case (like SGF, it does not skip the letter I), continued through the alphabet for boards larger
+than utils.COLS. An empty value, or tt on boards up to 19x19, is a pass.
+
+SGFWriter appends games one per line, so self-play can write every game as it finishes.
+"""
+
+# setup maps a Player to the points of their setup stones, moves is a list of (Player, Move) in the order played
+SGFGame = namedtuple('SGFGame', 'board_size komi result properties setup moves')
+
+_LETTERS = utils.COLS.lower() + string.ascii_lowercase[len(utils.COLS):]
+
+_COLORS = {'B': Player.BLACK, 'W': Player.WHITE}
+_SETUP = {'AB': Player.BLACK, 'AW': Player.WHITE}
+
+# one token: an opening or closing parenthesis, a node marker, a property identifier or a bracketed value
+_TOKEN = re.compile(r'\s*(?:([();])|([A-Za-z]+)|\[((?:[^\]\\]|\\.)*)\])', re.DOTALL)
+_ESCAPE = re.compile(r'\\(\r\n|\n\r|\n|\r|.)', re.DOTALL)
+
+_CHUNK_SIZE = 1 << 16
+
+
+def sgf_to_point(coords: str, board_size: int) -> Point | None:
+    # the Point of two SGF coordinate letters, or None for a pass
+    if coords == '' or (coords == 'tt' and board_size <= 19):
+        return None
+    col = _LETTERS.index(coords[0]) + 1
+    row = board_size - _LETTERS.index(coords[1])
+    if not (1 <= row <= board_size and 1 <= col <= board_size):
+        raise ValueError(f'point {coords!r} is not on a {board_size}x{board_size} board')
+    return Point(row, col)
+
+
+def point_to_sgf(point: Point | None, board_size: int) -> str:
+    if point is None:
+        return ''
+    return _LETTERS[point.col - 1] + _LETTERS[board_size - point.row]
+
+
+def _unescape(value: str) -> str:
+    # an escaped line break is a soft line break and disappears, any other escaped character stands for itself
+    return _ESCAPE.sub(lambda match: '' if match.group(1) in ('\n', '\r', '\r\n', '\n\r') else match.group(1), value)
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace(']', '\\]')
+
+
+class _GameBuilder:
+    # collects the main line of one game tree from its tokens
+    def __init__(self) -> None:
+        self.depth = 0
+        self.main_line_done = False
+        self.nodes: list[dict[str, list[str]]] = []
+        self.identifier: str | None = None
+
+    def open(self) -> None:
+        self.depth += 1
+
+    def close(self) -> None:
+        self.depth -= 1
+        # the first variation to end is the end of the main line, everything after it is a sibling variation
+        self.main_line_done = True
+
+    def node(self) -> None:
+        if not self.main_line_done:
+            self.nodes.append({})
+        self.identifier = None
+
+    def property(self, identifier: str) -> None:
+        self.identifier = identifier.upper() if not self.main_line_done else None
+
+    def value(self, value: str) -> None:
+        if self.identifier is not None and self.nodes:
+            self.nodes[-1].setdefault(self.identifier, []).append(value)
+
+    def build(self) -> SGFGame:
+        if not self.nodes:
+            raise ValueError('game without nodes')
+        root = {identifier: [_unescape(value) for value in values] for identifier, values in self.nodes[0].items()}
+
+        size = root.get('SZ', ['19'])[0]
+        if ':' in size:
+            num_cols, num_rows = size.split(':')
+            if num_cols != num_rows:
+                raise ValueError(f'non-square board {size} is not supported')
+            size = num_cols
+        board_size = int(size)
+        komi = float(root['KM'][0]) if root.get('KM', [''])[0] else 0.0
+        result = root['RE'][0] if 'RE' in root else None
+
+        setup = {
+            player: [sgf_to_point(value, board_size) for value in root.get(identifier, [])]
+            for identifier, player in _SETUP.items()
+        }
+        moves = []
+        for node in self.nodes:
+            for identifier, player in _COLORS.items():
+                if identifier in node:
+                    point = sgf_to_point(node[identifier][0], board_size)
+                    moves.append((player, Move.pass_turn() if point is None else Move.play(point)))
+
+        return SGFGame(board_size, komi, result, root, setup, moves)
+
+
+def read_games(source: str | os.PathLike | TextIO, chunk_size: int = _CHUNK_SIZE) -> Iterator[SGFGame]:
+    """
+    Yields the games of an SGF file, given as a path or an open text file, one at a time while the file is read.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, encoding='utf-8') as file:
+            yield from read_games(file, chunk_size)
+        return
+
+    buffer = ''
+    position = 0
+    builder: _GameBuilder | None = None
+    at_end = False
+
+    while True:
+        if not at_end:
+            chunk = source.read(chunk_size)
+            at_end = not chunk
+            buffer = buffer[position:] + chunk
+            position = 0
+
+        while True:
+            match = _TOKEN.match(buffer, position)
+            # a token touching the end of the buffer may continue in the next chunk, unless it is self-delimiting
+            if match is None or (match.end() == len(buffer) and match.group(2) and not at_end):
+                break
+            position = match.end()
+            punctuation, identifier, value = match.groups()
+
+            if punctuation == '(':
+                if builder is None:
+                    builder = _GameBuilder()
+                builder.open()
+            elif builder is None:
+                # anything outside of a game tree is ignored
+                continue
+            elif punctuation == ')':
+                builder.close()
+                if builder.depth == 0:
+                    yield builder.build()
+                    builder = None
+            elif punctuation == ';':
+                builder.node()
+            elif identifier is not None:
+                builder.property(identifier)
+            else:
+                builder.value(value)
+
+        if at_end:
+            rest = buffer[position:].strip()
+            if builder is not None or rest.startswith(('(', ';', '[')):
+                raise ValueError('SGF data ends in the middle of a game')
+            return
+        # skip text between games that the tokenizer does not understand, up to the next game
+        if builder is None and position < len(buffer) and _TOKEN.match(buffer, position) is None:
+            next_game = buffer.find('(', position)
+            position = len(buffer) if next_game < 0 else next_game
+
+
+def replay(game: SGFGame, game_state_class: type = goboard.GameState) -> Iterator[goboard.GameState]:
+    """
+    Yields the GameState before the first move and after every move of game. Setup stones are placed on the initial
+    board, and a move by the player who is not to move simply takes the turn.
+    """
+    game_state = game_state_class.new_game(game.board_size)
+    for player, points in game.setup.items():
+        for point in points:
+            game_state.board.place_stone(player, point)
+    if game.setup[Player.BLACK] and not game.setup[Player.WHITE]:
+        # handicap stones: white moves first
+        game_state = game_state_class(game_state.board, Player.WHITE, None, None)
+    yield game_state
+
+    for player, move in game.moves:
+        if player != game_state.next_player:
+            game_state = game_state_class(game_state.board, player, game_state.previous_state, game_state.last_move)
+        game_state = game_state.apply_move(move)
+        yield game_state
+
+
+def format_game(moves: Iterable[Move | tuple[Player, Move]], board_size: int, komi: float = 7.5,
+                result: str | None = None, black: str | None = None, white: str | None = None,
+                setup: dict[Player, list[Point]] | None = None, **properties: str) -> str:
+    """
+    A game as a single line of SGF. moves are Moves in turn order starting with black, or (Player, Move) pairs.
+    Resignations are not moves in SGF, they belong in the result.
+    """
+    root = {'GM': '1', 'FF': '4', 'CA': 'UTF-8', 'SZ': str(board_size), 'KM': f'{komi:g}'}
+    if result is not None:
+        root['RE'] = result
+    if black is not None:
+        root['PB'] = black
+    if white is not None:
+        root['PW'] = white
+    root.update(properties)
+
+    parts = ['(;']
+    parts.extend(f'{identifier}[{_escape(value)}]' for identifier, value in root.items())
+    for player, identifier in ((Player.BLACK, 'AB'), (Player.WHITE, 'AW')):
+        points = (setup or {}).get(player)
+        if points:
+            parts.append(identifier + ''.join(f'[{point_to_sgf(point, board_size)}]' for point in points))
+
+    player = Player.BLACK
+    for move in moves:
+        if isinstance(move, tuple):
+            player, move = move
+        if not move.is_resign:
+            color = 'B' if player == Player.BLACK else 'W'
+            parts.append(f';{color}[{point_to_sgf(move.point, board_size)}]')
+        player = player.other
+    parts.append(')')
+    return ''.join(parts)
+
+
+class SGFWriter:
+    def __init__(self, target: str | os.PathLike | TextIO) -> None:
+        # a path is opened for appending, so that several runs can add to the same collection
+        if isinstance(target, (str, os.PathLike)):
+            self._file = open(target, 'a', encoding='utf-8')
+            self._owns_file = True
+        else:
+            self._file = target
+            self._owns_file = False
+        self.num_games = 0
+
+    def write_game(self, moves: Iterable[Move | tuple[Player, Move]], board_size: int, **kwargs) -> None:
+        self._file.write(format_game(moves, board_size, **kwargs) + '\n')
+        self.num_games += 1
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self) -> SGFWriter:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,138 @@
+from __future__ import annotations
+from dlgo.goboard import Board, GoString
+from dlgo.gotypes import Point
+
+__all__ = ['TacticsReader', 'can_escape', 'is_ladder']
+
+"""
+Reading of simple capturing races: can a string in atari escape, and can a string with two liberties be caught in a
+ladder? Playout policies and search agents use the answers to skip moves that only feed stones to the opponent, such
+as extending a string that is caught in a working ladder.
+
+The reader plays the sequences out on the board itself with Board.play_in_place and takes them back with Board.undo,
+so a query that reads dozens of moves deep copies nothing, and leaves the board exactly as it found it. Results are
+cached by the board's zobrist hash together with the string and the side to move, so that transpositions within a
+ladder and repeated queries on the same position are answered at once. Results that depend on the max_depth cutoff
+are not cached, since a query with more depth left could read further.
+
+The defender escapes by capturing an adjacent string that is in atari, or by extending at its last liberty until it
+has three liberties. The attacker only plays ataris. Ko and superko are not taken into account, and a sequence that
+runs past max_depth moves counts as an escape.
+"""
+
+_ESCAPE = 0
+_LADDER = 1
+
+
+class TacticsReader:
+    def __init__(self, max_depth: int = 100, cache_size: int = 100_000) -> None:
+        self.max_depth = max_depth
+        self.cache_size = cache_size
+        self._cache: dict[tuple[int, int, int], bool] = {}
+        # the number of times reading was cut off at max_depth, so that results below a cutoff are not cached
+        self._cutoffs = 0
+
+    def can_escape(self, board: Board, point: Point) -> bool:
+        """
+        Whether the string at point, which must be in atari, gets out of it with its owner to move.
+        """
+        string = board.get_go_string(point)
+        if string is None or string.num_liberties != 1:
+            raise ValueError(f'no string in atari at {point}')
+        return self._escape(board, point, 0)
+
+    def is_ladder(self, board: Board, point: Point) -> bool:
+        """
+        Whether the opponent of the string at point, which must have two liberties, can capture it with a sequence of
+        ataris, with the opponent to move.
+        """
+        string = board.get_go_string(point)
+        if string is None or string.num_liberties != 2:
+            raise ValueError(f'no string with two liberties at {point}')
+        return self._ladder(board, point, 0)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def _cached(self, board: Board, point: Point, query: int) -> bool | None:
+        return self._cache.get((board.zobrist_hash(), point.index, query))
+
+    def _store(self, board: Board, point: Point, query: int, result: bool, cutoffs: int) -> bool:
+        # cutoffs is the value of _cutoffs when reading this position started
+        if cutoffs != self._cutoffs:
+            return result
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        self._cache[(board.zobrist_hash(), point.index, query)] = result
+        return result
+
+    def _escape(self, board: Board, point: Point, depth: int) -> bool:
+        # the string at point is in atari and its owner is to move
+        if depth >= self.max_depth:
+            self._cutoffs += 1
+            return True
+        cached = self._cached(board, point, _ESCAPE)
+        if cached is not None:
+            return cached
+        cutoffs = self._cutoffs
+
+        string = board.get_go_string(point)
+        player = string.color
+        candidates = [captured.liberties for captured in _adjacent_strings(board, string) if captured.num_liberties == 1]
+        candidates.append(string.liberties)
+
+        for (move,) in candidates:
+            if board.is_self_capture(player, move):
+                continue
+            board.play_in_place(player, move)
+            num_liberties = board.get_go_string(point).num_liberties
+            escaped = num_liberties >= 3 or (num_liberties == 2 and not self._ladder(board, point, depth + 1))
+            board.undo()
+            if escaped:
+                return self._store(board, point, _ESCAPE, True, cutoffs)
+        return self._store(board, point, _ESCAPE, False, cutoffs)
+
+    def _ladder(self, board: Board, point: Point, depth: int) -> bool:
+        # the string at point has two liberties and its opponent is to move
+        if depth >= self.max_depth:
+            self._cutoffs += 1
+            return False
+        cached = self._cached(board, point, _LADDER)
+        if cached is not None:
+            return cached
+        cutoffs = self._cutoffs
+
+        string = board.get_go_string(point)
+        attacker = string.color.other
+        for move in sorted(string.liberties):
+            if board.is_self_capture(attacker, move):
+                continue
+            board.play_in_place(attacker, move)
+            captured = board.get_go_string(point).num_liberties == 1 and not self._escape(board, point, depth + 1)
+            board.undo()
+            if captured:
+                return self._store(board, point, _LADDER, True, cutoffs)
+        return self._store(board, point, _LADDER, False, cutoffs)
+
+
+def _adjacent_strings(board: Board, string: GoString) -> list[GoString]:
+    # the opposite-color strings touching string
+    adjacent: list[GoString] = []
+    for stone in string.stones:
+        for neighbor in board.neighbors(stone):
+            neighbor_string = board.get_go_string(neighbor)
+            if neighbor_string is not None and neighbor_string.color != string.color and \
+                    not any(neighbor_string is other for other in adjacent):
+                adjacent.append(neighbor_string)
+    return adjacent
+
+
+_default_reader = TacticsReader()
+
+
+def can_escape(board: Board, point: Point) -> bool:
+    return _default_reader.can_escape(board, point)
+
+
+def is_ladder(board: Board, point: Point) -> bool:
+    return _default_reader.is_ladder(board, point)
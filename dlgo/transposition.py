@@ -0,0 +1,169 @@
+from __future__ import annotations
+from array import array
+from collections import namedtuple
+from dlgo.goboard import Move
+from dlgo.gotypes import Point
+
+__all__ = ['TranspositionTable', 'TableEntry', 'EXACT', 'LOWER_BOUND', 'UPPER_BOUND', 'MAX_DEPTH']
+
+"""
+A fixed-size cache of search results, keyed by GameState.situation_hash() (the board's zobrist hash with the side to
+move folded in), so that positions reached through different move orders are only searched once.
+
+All entries live in preallocated parallel arrays, so the table never allocates per entry and its memory use is fixed
+when it is created. Slots are grouped in buckets of two. When a bucket is full, the entry to replace is picked by age
+first (entries left over from an earlier search go first, see new_search) and depth second (shallower results are
+cheaper to recompute).
+"""
+
+# what a stored value means, as in alpha-beta search
+EXACT = 0
+LOWER_BOUND = 1
+UPPER_BOUND = 2
+
+# bytes per slot: key, value, depth, age, flag and move
+ENTRY_BYTES = 8 + 8 + 2 + 2 + 1 + 2
+BUCKET_SIZE = 2
+
+_EMPTY = -1
+# the largest depth and age the int16 and uint16 arrays hold
+MAX_DEPTH = 0x7fff
+_MAX_AGE = 0xffff
+_NO_MOVE = -1
+_PASS = -2
+
+TableEntry = namedtuple('TableEntry', 'value depth flag move')
+
+
+def _encode_move(move: Move | None) -> int:
+    if move is None or move.is_resign:
+        return _NO_MOVE
+    if move.is_pass:
+        return _PASS
+    return move.point.index
+
+
+def _decode_move(code: int) -> Move | None:
+    if code == _NO_MOVE:
+        return None
+    if code == _PASS:
+        return Move.pass_turn()
+    return Move.play(Point.from_index(code))
+
+
+class TranspositionTable:
+    def __init__(self, size_bytes: int = 16 * 1024 * 1024) -> None:
+        # the number of buckets is a power of two, so a key is mapped to its bucket with a mask
+        num_buckets = 1
+        while num_buckets * 2 * BUCKET_SIZE * ENTRY_BYTES <= size_bytes:
+            num_buckets *= 2
+        self._mask = num_buckets - 1
+        self.capacity = num_buckets * BUCKET_SIZE
+
+        self._keys = array('Q', bytes(8 * self.capacity))
+        self._values = array('d', bytes(8 * self.capacity))
+        self._depths = array('h', [_EMPTY]) * self.capacity
+        self._ages = array('H', bytes(2 * self.capacity))
+        self._flags = array('b', bytes(self.capacity))
+        self._moves = array('h', [_NO_MOVE]) * self.capacity
+
+        self._age = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def _find(self, key: int) -> int:
+        # the slot holding key, or -1
+        first = (key & self._mask) * BUCKET_SIZE
+        for slot in range(first, first + BUCKET_SIZE):
+            if self._depths[slot] != _EMPTY and self._keys[slot] == key:
+                return slot
+        return -1
+
+    def probe(self, key: int) -> TableEntry | None:
+        slot = self._find(key)
+        if slot < 0:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        # a hit refreshes the entry, so it survives into the current search
+        self._ages[slot] = self._age
+        return TableEntry(self._values[slot], self._depths[slot], self._flags[slot], _decode_move(self._moves[slot]))
+
+    def store(self, key: int, value: float, depth: int, flag: int = EXACT, move: Move | None = None) -> None:
+        # a depth of _EMPTY marks a free slot, so depths must not be negative
+        if depth < 0:
+            raise ValueError(f'depth must not be negative, got {depth}')
+        if depth > MAX_DEPTH:
+            raise ValueError(f'depth must be at most {MAX_DEPTH}, got {depth}')
+        slot = self._find(key)
+        if slot >= 0:
+            # keep a deeper result for the same position from the current search
+            if self._ages[slot] == self._age and self._depths[slot] > depth:
+                return
+        else:
+            slot = self._replacement_slot(key)
+            if self._depths[slot] != _EMPTY:
+                self.evictions += 1
+
+        self.stores += 1
+        self._keys[slot] = key
+        self._values[slot] = value
+        self._depths[slot] = depth
+        self._ages[slot] = self._age
+        self._flags[slot] = flag
+        self._moves[slot] = _encode_move(move)
+
+    def _replacement_slot(self, key: int) -> int:
+        first = (key & self._mask) * BUCKET_SIZE
+        victim = first
+        victim_priority = None
+        for slot in range(first, first + BUCKET_SIZE):
+            if self._depths[slot] == _EMPTY:
+                return slot
+            # entries from the current search are kept over stale ones, then deeper over shallower
+            priority = (self._ages[slot] == self._age, self._depths[slot])
+            if victim_priority is None or priority < victim_priority:
+                victim = slot
+                victim_priority = priority
+        return victim
+
+    def new_search(self) -> None:
+        """
+        Marks every entry stored so far as belonging to an earlier search. They can still be probed, but are the first
+        to be replaced.
+
+        Ages are only ever compared with the current one, so when the age wraps around to 0 every entry is given the
+        last age before it. Otherwise entries from 65536 searches ago would pass for current ones.
+        """
+        if self._age == _MAX_AGE:
+            self._ages[:] = array('H', [_MAX_AGE]) * self.capacity
+            self._age = 0
+        else:
+            self._age += 1
+
+    def clear(self) -> None:
+        self._depths[:] = array('h', [_EMPTY]) * self.capacity
+        self._age = 0
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return self.capacity - self._depths.count(_EMPTY)
+
+    def __contains__(self, key: int) -> bool:
+        return self._find(key) >= 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'capacity': self.capacity,
+            'entries': len(self),
+            'hits': self.hits,
+            'misses': self.misses,
+            'stores': self.stores,
+            'evictions': self.evictions,
+        }
@@ -1,733 +1,82 @@
-from dlgo.gotypes import Player, Point
+from array import array
+from functools import lru_cache
 from typing import NewType
+from dlgo.gotypes import Player, Point, MAX_BOARD_SIZE
 
-__all__ = ['HASH_CODE', 'EMPTY_BOARD', 'Hash']
+__all__ = ['hash_code', 'hash_table', 'to_move_code', 'ko_code', 'pass_code', 'EMPTY_BOARD', 'WHITE_TO_MOVE', 'Hash']
 
-Hash = NewType('Hash', int)
+"""
+Zobrist codes for every (point, player) pair on boards of up to MAX_BOARD_SIZE x MAX_BOARD_SIZE.
+
+Instead of a pre-generated literal table, each code is derived from a fixed seed and the point's index with the
+splitmix64 mixing function. That makes the codes identical across runs and processes, independent of the board size
+(a point has the same code on a 9x9 and a 19x19 board), and cheap to generate on demand.
 
-HASH_CODE: dict[tuple[Point, Player], Hash] = {
-    (Point(row=1, col=1), Player.BLACK): 7293788486427154343,
-    (Point(row=1, col=1), Player.WHITE): 6402220942286541775,
-    (Point(row=1, col=2), Player.BLACK): 6744468686817425594,
-    (Point(row=1, col=2), Player.WHITE): 7061127236942587977,
-    (Point(row=1, col=3), Player.BLACK): 4552392710355958478,
-    (Point(row=1, col=3), Player.WHITE): 3086373844443105281,
-    (Point(row=1, col=4), Player.BLACK): 3663357307956449230,
-    (Point(row=1, col=4), Player.WHITE): 6364230406353231927,
-    (Point(row=1, col=5), Player.BLACK): 8654392855477526221,
-    (Point(row=1, col=5), Player.WHITE): 2244140611077254859,
-    (Point(row=1, col=6), Player.BLACK): 649208935335365974,
-    (Point(row=1, col=6), Player.WHITE): 7644702006236484009,
-    (Point(row=1, col=7), Player.BLACK): 1335453237566355591,
-    (Point(row=1, col=7), Player.WHITE): 3771815955691402673,
-    (Point(row=1, col=8), Player.BLACK): 3720592171533275902,
-    (Point(row=1, col=8), Player.WHITE): 1407103681544822989,
-    (Point(row=1, col=9), Player.BLACK): 1300644365383159319,
-    (Point(row=1, col=9), Player.WHITE): 3061891675225811296,
-    (Point(row=1, col=10), Player.BLACK): 4921552957481474743,
-    (Point(row=1, col=10), Player.WHITE): 267542187966252010,
-    (Point(row=1, col=11), Player.BLACK): 1214541058971299402,
-    (Point(row=1, col=11), Player.WHITE): 8832666034434571199,
-    (Point(row=1, col=12), Player.BLACK): 7303534121443282937,
-    (Point(row=1, col=12), Player.WHITE): 8286341367747270619,
-    (Point(row=1, col=13), Player.BLACK): 8943682414784749828,
-    (Point(row=1, col=13), Player.WHITE): 5231541782067297797,
-    (Point(row=1, col=14), Player.BLACK): 4976718522823700219,
-    (Point(row=1, col=14), Player.WHITE): 5266380016044951888,
-    (Point(row=1, col=15), Player.BLACK): 7267238800156781114,
-    (Point(row=1, col=15), Player.WHITE): 2213203080902410121,
-    (Point(row=1, col=16), Player.BLACK): 4376935981845275021,
-    (Point(row=1, col=16), Player.WHITE): 4142739255660980875,
-    (Point(row=1, col=17), Player.BLACK): 1021945231909166267,
-    (Point(row=1, col=17), Player.WHITE): 6933052027850061500,
-    (Point(row=1, col=18), Player.BLACK): 950317305550441008,
-    (Point(row=1, col=18), Player.WHITE): 7116905309811666891,
-    (Point(row=1, col=19), Player.BLACK): 3731889197073131236,
-    (Point(row=1, col=19), Player.WHITE): 6142561178342102881,
-    (Point(row=2, col=1), Player.BLACK): 2513281367510715089,
-    (Point(row=2, col=1), Player.WHITE): 6331586604449514664,
-    (Point(row=2, col=2), Player.BLACK): 1292290942752900911,
-    (Point(row=2, col=2), Player.WHITE): 4886619525018946080,
-    (Point(row=2, col=3), Player.BLACK): 8999202894331385909,
-    (Point(row=2, col=3), Player.WHITE): 9025649819690609074,
-    (Point(row=2, col=4), Player.BLACK): 4038945763123583870,
-    (Point(row=2, col=4), Player.WHITE): 480046003388297393,
-    (Point(row=2, col=5), Player.BLACK): 8376411873160458545,
-    (Point(row=2, col=5), Player.WHITE): 785156646638052699,
-    (Point(row=2, col=6), Player.BLACK): 6006777553500083982,
-    (Point(row=2, col=6), Player.WHITE): 7365263459786661107,
-    (Point(row=2, col=7), Player.BLACK): 9039240607923494989,
-    (Point(row=2, col=7), Player.WHITE): 2345131652959462883,
-    (Point(row=2, col=8), Player.BLACK): 6404668404574424037,
-    (Point(row=2, col=8), Player.WHITE): 3848043931328012952,
-    (Point(row=2, col=9), Player.BLACK): 5113116620050341458,
-    (Point(row=2, col=9), Player.WHITE): 2746113985603930069,
-    (Point(row=2, col=10), Player.BLACK): 5223750455317912510,
-    (Point(row=2, col=10), Player.WHITE): 4390813844372247624,
-    (Point(row=2, col=11), Player.BLACK): 2532421074448841913,
-    (Point(row=2, col=11), Player.WHITE): 4358818865498965669,
-    (Point(row=2, col=12), Player.BLACK): 884754010033936624,
-    (Point(row=2, col=12), Player.WHITE): 6326680581499259833,
-    (Point(row=2, col=13), Player.BLACK): 4292144053714135109,
-    (Point(row=2, col=13), Player.WHITE): 3133788319300505910,
-    (Point(row=2, col=14), Player.BLACK): 4669408438094687991,
-    (Point(row=2, col=14), Player.WHITE): 4829632648206911017,
-    (Point(row=2, col=15), Player.BLACK): 8044244510183501641,
-    (Point(row=2, col=15), Player.WHITE): 1762989963689314708,
-    (Point(row=2, col=16), Player.BLACK): 2258706489094070758,
-    (Point(row=2, col=16), Player.WHITE): 662462338970680109,
-    (Point(row=2, col=17), Player.BLACK): 8681144490241173964,
-    (Point(row=2, col=17), Player.WHITE): 3510222861895723089,
-    (Point(row=2, col=18), Player.BLACK): 7468003279800193756,
-    (Point(row=2, col=18), Player.WHITE): 4450873097644342641,
-    (Point(row=2, col=19), Player.BLACK): 2404996223618713028,
-    (Point(row=2, col=19), Player.WHITE): 6320697319031554308,
-    (Point(row=3, col=1), Player.BLACK): 5801185953243929296,
-    (Point(row=3, col=1), Player.WHITE): 985098948564237722,
-    (Point(row=3, col=2), Player.BLACK): 1262816063803886417,
-    (Point(row=3, col=2), Player.WHITE): 8431012324847784023,
-    (Point(row=3, col=3), Player.BLACK): 4574374319837444911,
-    (Point(row=3, col=3), Player.WHITE): 7452797036158645931,
-    (Point(row=3, col=4), Player.BLACK): 4661018070487043931,
-    (Point(row=3, col=4), Player.WHITE): 8151333179541271966,
-    (Point(row=3, col=5), Player.BLACK): 1982427049805895943,
-    (Point(row=3, col=5), Player.WHITE): 2726378869843514659,
-    (Point(row=3, col=6), Player.BLACK): 8140587900420078148,
-    (Point(row=3, col=6), Player.WHITE): 3081486226288446650,
-    (Point(row=3, col=7), Player.BLACK): 8945579481943144464,
-    (Point(row=3, col=7), Player.WHITE): 7460040416813939516,
-    (Point(row=3, col=8), Player.BLACK): 3060024290343180050,
-    (Point(row=3, col=8), Player.WHITE): 7624372482638068170,
-    (Point(row=3, col=9), Player.BLACK): 471056067896125737,
-    (Point(row=3, col=9), Player.WHITE): 3578775427673674552,
-    (Point(row=3, col=10), Player.BLACK): 3001874546042955130,
-    (Point(row=3, col=10), Player.WHITE): 2333143024039523129,
-    (Point(row=3, col=11), Player.BLACK): 2918483541348046903,
-    (Point(row=3, col=11), Player.WHITE): 6105294055892368654,
-    (Point(row=3, col=12), Player.BLACK): 7056910665046756883,
-    (Point(row=3, col=12), Player.WHITE): 922809687493718354,
-    (Point(row=3, col=13), Player.BLACK): 4309886662665229517,
-    (Point(row=3, col=13), Player.WHITE): 5059733520370559675,
-    (Point(row=3, col=14), Player.BLACK): 4926661770454271775,
-    (Point(row=3, col=14), Player.WHITE): 7440188056602560057,
-    (Point(row=3, col=15), Player.BLACK): 427429360133286511,
-    (Point(row=3, col=15), Player.WHITE): 4863655248868512772,
-    (Point(row=3, col=16), Player.BLACK): 7132635639747125116,
-    (Point(row=3, col=16), Player.WHITE): 3187165237331130229,
-    (Point(row=3, col=17), Player.BLACK): 7963223628304905894,
-    (Point(row=3, col=17), Player.WHITE): 4945779239968679675,
-    (Point(row=3, col=18), Player.BLACK): 8288639658678437136,
-    (Point(row=3, col=18), Player.WHITE): 4713216338145125758,
-    (Point(row=3, col=19), Player.BLACK): 7436561173500869689,
-    (Point(row=3, col=19), Player.WHITE): 1742066606048972744,
-    (Point(row=4, col=1), Player.BLACK): 308970216004111108,
-    (Point(row=4, col=1), Player.WHITE): 4015227072959546136,
-    (Point(row=4, col=2), Player.BLACK): 1701347468018062460,
-    (Point(row=4, col=2), Player.WHITE): 8670310281991420222,
-    (Point(row=4, col=3), Player.BLACK): 2025754426178751405,
-    (Point(row=4, col=3), Player.WHITE): 2720579203215366533,
-    (Point(row=4, col=4), Player.BLACK): 5121682074387075886,
-    (Point(row=4, col=4), Player.WHITE): 4525509218167625677,
-    (Point(row=4, col=5), Player.BLACK): 1205831041611700613,
-    (Point(row=4, col=5), Player.WHITE): 826713281801977683,
-    (Point(row=4, col=6), Player.BLACK): 3416747870108168658,
-    (Point(row=4, col=6), Player.WHITE): 1639739706238774071,
-    (Point(row=4, col=7), Player.BLACK): 2022939211288641654,
-    (Point(row=4, col=7), Player.WHITE): 4501470354280192278,
-    (Point(row=4, col=8), Player.BLACK): 6337399630416757677,
-    (Point(row=4, col=8), Player.WHITE): 7880507041749259928,
-    (Point(row=4, col=9), Player.BLACK): 4906582737908805303,
-    (Point(row=4, col=9), Player.WHITE): 4685217127952002377,
-    (Point(row=4, col=10), Player.BLACK): 4407371958166741571,
-    (Point(row=4, col=10), Player.WHITE): 7892068549934036262,
-    (Point(row=4, col=11), Player.BLACK): 986409584845620365,
-    (Point(row=4, col=11), Player.WHITE): 2674781847458969436,
-    (Point(row=4, col=12), Player.BLACK): 5253500704045176924,
-    (Point(row=4, col=12), Player.WHITE): 8123616631331335760,
-    (Point(row=4, col=13), Player.BLACK): 3743064017867053460,
-    (Point(row=4, col=13), Player.WHITE): 2422345621291036231,
-    (Point(row=4, col=14), Player.BLACK): 3464105254090177241,
-    (Point(row=4, col=14), Player.WHITE): 8867524090747730499,
-    (Point(row=4, col=15), Player.BLACK): 8987664462562723141,
-    (Point(row=4, col=15), Player.WHITE): 6722010463478226720,
-    (Point(row=4, col=16), Player.BLACK): 1777800831772212890,
-    (Point(row=4, col=16), Player.WHITE): 1482720931291807252,
-    (Point(row=4, col=17), Player.BLACK): 618155095795379759,
-    (Point(row=4, col=17), Player.WHITE): 4273920964081137259,
-    (Point(row=4, col=18), Player.BLACK): 5680468385982280858,
-    (Point(row=4, col=18), Player.WHITE): 4252943057820539927,
-    (Point(row=4, col=19), Player.BLACK): 7674814077066533509,
-    (Point(row=4, col=19), Player.WHITE): 5267708321560193553,
-    (Point(row=5, col=1), Player.BLACK): 4365397449659202162,
-    (Point(row=5, col=1), Player.WHITE): 4148162828540748549,
-    (Point(row=5, col=2), Player.BLACK): 1654745010327270491,
-    (Point(row=5, col=2), Player.WHITE): 2834157701544534247,
-    (Point(row=5, col=3), Player.BLACK): 2105301625043571289,
-    (Point(row=5, col=3), Player.WHITE): 676910882481232813,
-    (Point(row=5, col=4), Player.BLACK): 61089332574458019,
-    (Point(row=5, col=4), Player.WHITE): 3624936059256369337,
-    (Point(row=5, col=5), Player.BLACK): 811273506877532922,
-    (Point(row=5, col=5), Player.WHITE): 1532981152976847663,
-    (Point(row=5, col=6), Player.BLACK): 777934032640248949,
-    (Point(row=5, col=6), Player.WHITE): 6481555417298995565,
-    (Point(row=5, col=7), Player.BLACK): 8575096929559529686,
-    (Point(row=5, col=7), Player.WHITE): 360330080091511286,
-    (Point(row=5, col=8), Player.BLACK): 5644799539811171343,
-    (Point(row=5, col=8), Player.WHITE): 6779108313460621600,
-    (Point(row=5, col=9), Player.BLACK): 6018277032125266340,
-    (Point(row=5, col=9), Player.WHITE): 2420440016314070676,
-    (Point(row=5, col=10), Player.BLACK): 330973833290279800,
-    (Point(row=5, col=10), Player.WHITE): 6120179479842195187,
-    (Point(row=5, col=11), Player.BLACK): 6893522022960819570,
-    (Point(row=5, col=11), Player.WHITE): 8708989587487702814,
-    (Point(row=5, col=12), Player.BLACK): 2061316582505231626,
-    (Point(row=5, col=12), Player.WHITE): 6858092615599293929,
-    (Point(row=5, col=13), Player.BLACK): 782581328523271952,
-    (Point(row=5, col=13), Player.WHITE): 6367841960226587770,
-    (Point(row=5, col=14), Player.BLACK): 8705517062801240048,
-    (Point(row=5, col=14), Player.WHITE): 4285891847733266068,
-    (Point(row=5, col=15), Player.BLACK): 1906920424196076702,
-    (Point(row=5, col=15), Player.WHITE): 7697210188378698731,
-    (Point(row=5, col=16), Player.BLACK): 5199387332134590261,
-    (Point(row=5, col=16), Player.WHITE): 3195893476201333706,
-    (Point(row=5, col=17), Player.BLACK): 6540312441201313984,
-    (Point(row=5, col=17), Player.WHITE): 2557528077490663946,
-    (Point(row=5, col=18), Player.BLACK): 1773897365291825150,
-    (Point(row=5, col=18), Player.WHITE): 2035023881449367768,
-    (Point(row=5, col=19), Player.BLACK): 451938173334598407,
-    (Point(row=5, col=19), Player.WHITE): 6418941995176116493,
-    (Point(row=6, col=1), Player.BLACK): 6098783417264350813,
-    (Point(row=6, col=1), Player.WHITE): 9093911515743573503,
-    (Point(row=6, col=2), Player.BLACK): 2725157428436982550,
-    (Point(row=6, col=2), Player.WHITE): 6357705855274131718,
-    (Point(row=6, col=3), Player.BLACK): 8082280292364465161,
-    (Point(row=6, col=3), Player.WHITE): 2571035313275741495,
-    (Point(row=6, col=4), Player.BLACK): 1904209133470919565,
-    (Point(row=6, col=4), Player.WHITE): 7032808168841214518,
-    (Point(row=6, col=5), Player.BLACK): 678384551399047065,
-    (Point(row=6, col=5), Player.WHITE): 7556029920668041129,
-    (Point(row=6, col=6), Player.BLACK): 7670756486597683462,
-    (Point(row=6, col=6), Player.WHITE): 436792556769823720,
-    (Point(row=6, col=7), Player.BLACK): 3033911687622798393,
-    (Point(row=6, col=7), Player.WHITE): 3252922105868035556,
-    (Point(row=6, col=8), Player.BLACK): 2942220808202214880,
-    (Point(row=6, col=8), Player.WHITE): 4471207952490476131,
-    (Point(row=6, col=9), Player.BLACK): 4720213897025605350,
-    (Point(row=6, col=9), Player.WHITE): 5807599677519334424,
-    (Point(row=6, col=10), Player.BLACK): 4398556209427654690,
-    (Point(row=6, col=10), Player.WHITE): 1855501253265472171,
-    (Point(row=6, col=11), Player.BLACK): 1928610547653267897,
-    (Point(row=6, col=11), Player.WHITE): 3755487764839050319,
-    (Point(row=6, col=12), Player.BLACK): 1160187496945590249,
-    (Point(row=6, col=12), Player.WHITE): 4422550664637896591,
-    (Point(row=6, col=13), Player.BLACK): 5456138151867940864,
-    (Point(row=6, col=13), Player.WHITE): 1337463900072739518,
-    (Point(row=6, col=14), Player.BLACK): 2194809565926363073,
-    (Point(row=6, col=14), Player.WHITE): 2285056263858118722,
-    (Point(row=6, col=15), Player.BLACK): 3637521774447356192,
-    (Point(row=6, col=15), Player.WHITE): 1513361079477847604,
-    (Point(row=6, col=16), Player.BLACK): 7513059095265902633,
-    (Point(row=6, col=16), Player.WHITE): 5599093884463868331,
-    (Point(row=6, col=17), Player.BLACK): 8937086995801563559,
-    (Point(row=6, col=17), Player.WHITE): 6407079314859774040,
-    (Point(row=6, col=18), Player.BLACK): 6816315882474400632,
-    (Point(row=6, col=18), Player.WHITE): 549014799022334208,
-    (Point(row=6, col=19), Player.BLACK): 7733189914141828229,
-    (Point(row=6, col=19), Player.WHITE): 4018513691129081052,
-    (Point(row=7, col=1), Player.BLACK): 1872131328873057159,
-    (Point(row=7, col=1), Player.WHITE): 597268151921677968,
-    (Point(row=7, col=2), Player.BLACK): 122186645935292850,
-    (Point(row=7, col=2), Player.WHITE): 9176437467169639255,
-    (Point(row=7, col=3), Player.BLACK): 1017932942303878010,
-    (Point(row=7, col=3), Player.WHITE): 8954443628267343730,
-    (Point(row=7, col=4), Player.BLACK): 2950505241602057287,
-    (Point(row=7, col=4), Player.WHITE): 8144677017647529035,
-    (Point(row=7, col=5), Player.BLACK): 3074423254992674973,
-    (Point(row=7, col=5), Player.WHITE): 5950873129791608435,
-    (Point(row=7, col=6), Player.BLACK): 1569547520160199079,
-    (Point(row=7, col=6), Player.WHITE): 420939375318963484,
-    (Point(row=7, col=7), Player.BLACK): 3477111052586373118,
-    (Point(row=7, col=7), Player.WHITE): 5460309931610570744,
-    (Point(row=7, col=8), Player.BLACK): 1169312187478416551,
-    (Point(row=7, col=8), Player.WHITE): 119552393551597535,
-    (Point(row=7, col=9), Player.BLACK): 5312205567042521422,
-    (Point(row=7, col=9), Player.WHITE): 9109078046679713501,
-    (Point(row=7, col=10), Player.BLACK): 5496044107408811222,
-    (Point(row=7, col=10), Player.WHITE): 8112076750877501446,
-    (Point(row=7, col=11), Player.BLACK): 7844203813210087632,
-    (Point(row=7, col=11), Player.WHITE): 3101480980139070510,
-    (Point(row=7, col=12), Player.BLACK): 639971648119690148,
-    (Point(row=7, col=12), Player.WHITE): 2392187922039122368,
-    (Point(row=7, col=13), Player.BLACK): 2562563869844153463,
-    (Point(row=7, col=13), Player.WHITE): 5004676287246793628,
-    (Point(row=7, col=14), Player.BLACK): 237831272007883992,
-    (Point(row=7, col=14), Player.WHITE): 406844630637307108,
-    (Point(row=7, col=15), Player.BLACK): 4148468299165883262,
-    (Point(row=7, col=15), Player.WHITE): 494007007300173359,
-    (Point(row=7, col=16), Player.BLACK): 1494702807275798440,
-    (Point(row=7, col=16), Player.WHITE): 3685189616986708886,
-    (Point(row=7, col=17), Player.BLACK): 808652929414997927,
-    (Point(row=7, col=17), Player.WHITE): 7078953205205344131,
-    (Point(row=7, col=18), Player.BLACK): 256999316946088242,
-    (Point(row=7, col=18), Player.WHITE): 7005524883814467700,
-    (Point(row=7, col=19), Player.BLACK): 3783980817273852316,
-    (Point(row=7, col=19), Player.WHITE): 4597674075518213480,
-    (Point(row=8, col=1), Player.BLACK): 3476959297679386409,
-    (Point(row=8, col=1), Player.WHITE): 1911260286249237815,
-    (Point(row=8, col=2), Player.BLACK): 6750787757468136637,
-    (Point(row=8, col=2), Player.WHITE): 8975620242241966242,
-    (Point(row=8, col=3), Player.BLACK): 6102169199088065471,
-    (Point(row=8, col=3), Player.WHITE): 7089254902531886284,
-    (Point(row=8, col=4), Player.BLACK): 6987909330982376804,
-    (Point(row=8, col=4), Player.WHITE): 3865553782609854538,
-    (Point(row=8, col=5), Player.BLACK): 1627317814332222700,
-    (Point(row=8, col=5), Player.WHITE): 1486072000733989679,
-    (Point(row=8, col=6), Player.BLACK): 4429071176333089145,
-    (Point(row=8, col=6), Player.WHITE): 604421443368283224,
-    (Point(row=8, col=7), Player.BLACK): 7198330667332233639,
-    (Point(row=8, col=7), Player.WHITE): 5045808958336880955,
-    (Point(row=8, col=8), Player.BLACK): 7330664735812299876,
-    (Point(row=8, col=8), Player.WHITE): 1714773911716280007,
-    (Point(row=8, col=9), Player.BLACK): 8409260231133231950,
-    (Point(row=8, col=9), Player.WHITE): 4983331882983649781,
-    (Point(row=8, col=10), Player.BLACK): 7393609958116512638,
-    (Point(row=8, col=10), Player.WHITE): 1085741773094003457,
-    (Point(row=8, col=11), Player.BLACK): 2837063369955358697,
-    (Point(row=8, col=11), Player.WHITE): 1580402284370933427,
-    (Point(row=8, col=12), Player.BLACK): 8433430927564012152,
-    (Point(row=8, col=12), Player.WHITE): 7095339048232899653,
-    (Point(row=8, col=13), Player.BLACK): 5696218030038699129,
-    (Point(row=8, col=13), Player.WHITE): 4504913697735324152,
-    (Point(row=8, col=14), Player.BLACK): 8200920581261481201,
-    (Point(row=8, col=14), Player.WHITE): 6848944030194393935,
-    (Point(row=8, col=15), Player.BLACK): 2423180922255705065,
-    (Point(row=8, col=15), Player.WHITE): 9064809812876950992,
-    (Point(row=8, col=16), Player.BLACK): 2404441932606554261,
-    (Point(row=8, col=16), Player.WHITE): 4028299796814662394,
-    (Point(row=8, col=17), Player.BLACK): 6560208554769392739,
-    (Point(row=8, col=17), Player.WHITE): 1191932272877320893,
-    (Point(row=8, col=18), Player.BLACK): 7995268227356958457,
-    (Point(row=8, col=18), Player.WHITE): 6038083399495860666,
-    (Point(row=8, col=19), Player.BLACK): 6984115968480027173,
-    (Point(row=8, col=19), Player.WHITE): 5748376547910084000,
-    (Point(row=9, col=1), Player.BLACK): 2941645635156882443,
-    (Point(row=9, col=1), Player.WHITE): 4992933158501606477,
-    (Point(row=9, col=2), Player.BLACK): 7983034400665200118,
-    (Point(row=9, col=2), Player.WHITE): 5925270093476334458,
-    (Point(row=9, col=3), Player.BLACK): 5708680537228263707,
-    (Point(row=9, col=3), Player.WHITE): 8074965385316793558,
-    (Point(row=9, col=4), Player.BLACK): 6966669911249944451,
-    (Point(row=9, col=4), Player.WHITE): 7425607690001007549,
-    (Point(row=9, col=5), Player.BLACK): 4109061246699893789,
-    (Point(row=9, col=5), Player.WHITE): 7327640621848647475,
-    (Point(row=9, col=6), Player.BLACK): 6071858506921328700,
-    (Point(row=9, col=6), Player.WHITE): 281083867250356487,
-    (Point(row=9, col=7), Player.BLACK): 4601581259065552475,
-    (Point(row=9, col=7), Player.WHITE): 5290739212900016098,
-    (Point(row=9, col=8), Player.BLACK): 7194444552041385197,
-    (Point(row=9, col=8), Player.WHITE): 2205502969138760410,
-    (Point(row=9, col=9), Player.BLACK): 6020687880605623816,
-    (Point(row=9, col=9), Player.WHITE): 2115711444570528485,
-    (Point(row=9, col=10), Player.BLACK): 362522451385256939,
-    (Point(row=9, col=10), Player.WHITE): 5129345567035401406,
-    (Point(row=9, col=11), Player.BLACK): 2144987123924052428,
-    (Point(row=9, col=11), Player.WHITE): 2055883554690668745,
-    (Point(row=9, col=12), Player.BLACK): 4022260383916197179,
-    (Point(row=9, col=12), Player.WHITE): 6501848572162690295,
-    (Point(row=9, col=13), Player.BLACK): 8985415390067965458,
-    (Point(row=9, col=13), Player.WHITE): 380630736522399543,
-    (Point(row=9, col=14), Player.BLACK): 8172431363384067791,
-    (Point(row=9, col=14), Player.WHITE): 3621260158942349085,
-    (Point(row=9, col=15), Player.BLACK): 4488387975145712010,
-    (Point(row=9, col=15), Player.WHITE): 3827724311846596093,
-    (Point(row=9, col=16), Player.BLACK): 6274546813649707373,
-    (Point(row=9, col=16), Player.WHITE): 5828959716024020643,
-    (Point(row=9, col=17), Player.BLACK): 4322133906457078340,
-    (Point(row=9, col=17), Player.WHITE): 163268332933516312,
-    (Point(row=9, col=18), Player.BLACK): 3286807062288378868,
-    (Point(row=9, col=18), Player.WHITE): 6635217672393810927,
-    (Point(row=9, col=19), Player.BLACK): 3697727398370495154,
-    (Point(row=9, col=19), Player.WHITE): 8685247048952581754,
-    (Point(row=10, col=1), Player.BLACK): 5303472146478495400,
-    (Point(row=10, col=1), Player.WHITE): 4054796485717501605,
-    (Point(row=10, col=2), Player.BLACK): 2718666566970348454,
-    (Point(row=10, col=2), Player.WHITE): 1447539913199502591,
-    (Point(row=10, col=3), Player.BLACK): 4941102117661747775,
-    (Point(row=10, col=3), Player.WHITE): 8113142545909322252,
-    (Point(row=10, col=4), Player.BLACK): 8518128840790401362,
-    (Point(row=10, col=4), Player.WHITE): 8473737144632860954,
-    (Point(row=10, col=5), Player.BLACK): 596897034426730229,
-    (Point(row=10, col=5), Player.WHITE): 3169771132501186115,
-    (Point(row=10, col=6), Player.BLACK): 8723296019533010297,
-    (Point(row=10, col=6), Player.WHITE): 4229826809064476653,
-    (Point(row=10, col=7), Player.BLACK): 5409140096162538476,
-    (Point(row=10, col=7), Player.WHITE): 7526049988064338568,
-    (Point(row=10, col=8), Player.BLACK): 5702573419312827280,
-    (Point(row=10, col=8), Player.WHITE): 6189138297753553992,
-    (Point(row=10, col=9), Player.BLACK): 114421668078814289,
-    (Point(row=10, col=9), Player.WHITE): 9016192402308419279,
-    (Point(row=10, col=10), Player.BLACK): 7834702780068692362,
-    (Point(row=10, col=10), Player.WHITE): 3456704993980223755,
-    (Point(row=10, col=11), Player.BLACK): 6563720298754053266,
-    (Point(row=10, col=11), Player.WHITE): 3815304261836219359,
-    (Point(row=10, col=12), Player.BLACK): 7996436343543753069,
-    (Point(row=10, col=12), Player.WHITE): 2835086747162293159,
-    (Point(row=10, col=13), Player.BLACK): 6038763157981073767,
-    (Point(row=10, col=13), Player.WHITE): 1487954360199787583,
-    (Point(row=10, col=14), Player.BLACK): 6099638554222542971,
-    (Point(row=10, col=14), Player.WHITE): 3630686698913167958,
-    (Point(row=10, col=15), Player.BLACK): 1700423918821647763,
-    (Point(row=10, col=15), Player.WHITE): 4090369332897519414,
-    (Point(row=10, col=16), Player.BLACK): 429321207630263267,
-    (Point(row=10, col=16), Player.WHITE): 5477878413268411037,
-    (Point(row=10, col=17), Player.BLACK): 8225884978717029729,
-    (Point(row=10, col=17), Player.WHITE): 7502981546544164693,
-    (Point(row=10, col=18), Player.BLACK): 4760056645272953578,
-    (Point(row=10, col=18), Player.WHITE): 5362099180904654735,
-    (Point(row=10, col=19), Player.BLACK): 6176016986902639496,
-    (Point(row=10, col=19), Player.WHITE): 5531740483807561698,
-    (Point(row=11, col=1), Player.BLACK): 5902310283471229372,
-    (Point(row=11, col=1), Player.WHITE): 5246302907653588023,
-    (Point(row=11, col=2), Player.BLACK): 7767507738986135855,
-    (Point(row=11, col=2), Player.WHITE): 4389821160529747198,
-    (Point(row=11, col=3), Player.BLACK): 4256436212477563528,
-    (Point(row=11, col=3), Player.WHITE): 7565920749994508122,
-    (Point(row=11, col=4), Player.BLACK): 7732828618650979838,
-    (Point(row=11, col=4), Player.WHITE): 4807718619063464314,
-    (Point(row=11, col=5), Player.BLACK): 1077178851691823359,
-    (Point(row=11, col=5), Player.WHITE): 855338038205579631,
-    (Point(row=11, col=6), Player.BLACK): 7753676024390866733,
-    (Point(row=11, col=6), Player.WHITE): 931367351707732611,
-    (Point(row=11, col=7), Player.BLACK): 1100759042269318627,
-    (Point(row=11, col=7), Player.WHITE): 7370596157513782397,
-    (Point(row=11, col=8), Player.BLACK): 8600894530173591223,
-    (Point(row=11, col=8), Player.WHITE): 5241504497874200811,
-    (Point(row=11, col=9), Player.BLACK): 1016189458639302982,
-    (Point(row=11, col=9), Player.WHITE): 1507488504849552996,
-    (Point(row=11, col=10), Player.BLACK): 1494573462250906430,
-    (Point(row=11, col=10), Player.WHITE): 2041329496959180093,
-    (Point(row=11, col=11), Player.BLACK): 4684173542747202920,
-    (Point(row=11, col=11), Player.WHITE): 4115147780654061720,
-    (Point(row=11, col=12), Player.BLACK): 7031414855534534793,
-    (Point(row=11, col=12), Player.WHITE): 8800282719303115682,
-    (Point(row=11, col=13), Player.BLACK): 7893769770412828129,
-    (Point(row=11, col=13), Player.WHITE): 6864341235761478151,
-    (Point(row=11, col=14), Player.BLACK): 7456450593776563378,
-    (Point(row=11, col=14), Player.WHITE): 2338344171178951123,
-    (Point(row=11, col=15), Player.BLACK): 8849212677463918552,
-    (Point(row=11, col=15), Player.WHITE): 5953531180643624489,
-    (Point(row=11, col=16), Player.BLACK): 7770880123539482737,
-    (Point(row=11, col=16), Player.WHITE): 8333805439360657647,
-    (Point(row=11, col=17), Player.BLACK): 7348075792977517374,
-    (Point(row=11, col=17), Player.WHITE): 1144655866380670925,
-    (Point(row=11, col=18), Player.BLACK): 3516019353188959921,
-    (Point(row=11, col=18), Player.WHITE): 4810152792497762879,
-    (Point(row=11, col=19), Player.BLACK): 194607638900183794,
-    (Point(row=11, col=19), Player.WHITE): 4780633782122920698,
-    (Point(row=12, col=1), Player.BLACK): 8010712013795080870,
-    (Point(row=12, col=1), Player.WHITE): 7732896374283932458,
-    (Point(row=12, col=2), Player.BLACK): 5898766928605384426,
-    (Point(row=12, col=2), Player.WHITE): 2596685910363713606,
-    (Point(row=12, col=3), Player.BLACK): 3253131216381393912,
-    (Point(row=12, col=3), Player.WHITE): 5510298933723611820,
-    (Point(row=12, col=4), Player.BLACK): 3820983443911309765,
-    (Point(row=12, col=4), Player.WHITE): 4312610714537739042,
-    (Point(row=12, col=5), Player.BLACK): 6692087833080363076,
-    (Point(row=12, col=5), Player.WHITE): 7540701959708758449,
-    (Point(row=12, col=6), Player.BLACK): 5338201833369384985,
-    (Point(row=12, col=6), Player.WHITE): 6077603024000977895,
-    (Point(row=12, col=7), Player.BLACK): 6941232996416712717,
-    (Point(row=12, col=7), Player.WHITE): 8886752082726198943,
-    (Point(row=12, col=8), Player.BLACK): 8839646975961074624,
-    (Point(row=12, col=8), Player.WHITE): 4508269555374834217,
-    (Point(row=12, col=9), Player.BLACK): 9012266931683021670,
-    (Point(row=12, col=9), Player.WHITE): 9063932905472300480,
-    (Point(row=12, col=10), Player.BLACK): 4812817497085803045,
-    (Point(row=12, col=10), Player.WHITE): 4204971043602409016,
-    (Point(row=12, col=11), Player.BLACK): 2669147910743812857,
-    (Point(row=12, col=11), Player.WHITE): 7933422765536411056,
-    (Point(row=12, col=12), Player.BLACK): 2152824777736244799,
-    (Point(row=12, col=12), Player.WHITE): 433445306417718603,
-    (Point(row=12, col=13), Player.BLACK): 2396223069752870495,
-    (Point(row=12, col=13), Player.WHITE): 522552252531821303,
-    (Point(row=12, col=14), Player.BLACK): 6579230096367314881,
-    (Point(row=12, col=14), Player.WHITE): 3141619322490216563,
-    (Point(row=12, col=15), Player.BLACK): 6963026428710233797,
-    (Point(row=12, col=15), Player.WHITE): 5023071463875710305,
-    (Point(row=12, col=16), Player.BLACK): 2257018843379990901,
-    (Point(row=12, col=16), Player.WHITE): 9120877700870891407,
-    (Point(row=12, col=17), Player.BLACK): 8863393983524986641,
-    (Point(row=12, col=17), Player.WHITE): 1923928995854320594,
-    (Point(row=12, col=18), Player.BLACK): 3390695413894104073,
-    (Point(row=12, col=18), Player.WHITE): 4890064015946268230,
-    (Point(row=12, col=19), Player.BLACK): 2708359136200189882,
-    (Point(row=12, col=19), Player.WHITE): 1673285902973487564,
-    (Point(row=13, col=1), Player.BLACK): 5873522460035199907,
-    (Point(row=13, col=1), Player.WHITE): 601428492673577228,
-    (Point(row=13, col=2), Player.BLACK): 7094292676868546913,
-    (Point(row=13, col=2), Player.WHITE): 3013414527258746235,
-    (Point(row=13, col=3), Player.BLACK): 6947498344701243583,
-    (Point(row=13, col=3), Player.WHITE): 1910167075353142674,
-    (Point(row=13, col=4), Player.BLACK): 3379618364539756070,
-    (Point(row=13, col=4), Player.WHITE): 4005258160981864190,
-    (Point(row=13, col=5), Player.BLACK): 4127237421904231030,
-    (Point(row=13, col=5), Player.WHITE): 8603034056654907689,
-    (Point(row=13, col=6), Player.BLACK): 6575679568022660650,
-    (Point(row=13, col=6), Player.WHITE): 4525578214498321751,
-    (Point(row=13, col=7), Player.BLACK): 4810478530628680018,
-    (Point(row=13, col=7), Player.WHITE): 7873044954524630899,
-    (Point(row=13, col=8), Player.BLACK): 6974069662646740615,
-    (Point(row=13, col=8), Player.WHITE): 558254416883525125,
-    (Point(row=13, col=9), Player.BLACK): 2504527530210016056,
-    (Point(row=13, col=9), Player.WHITE): 6119397483006041361,
-    (Point(row=13, col=10), Player.BLACK): 5288104362626507510,
-    (Point(row=13, col=10), Player.WHITE): 4054367441708497189,
-    (Point(row=13, col=11), Player.BLACK): 7569655100657796851,
-    (Point(row=13, col=11), Player.WHITE): 4013649854982021101,
-    (Point(row=13, col=12), Player.BLACK): 6386150271094451535,
-    (Point(row=13, col=12), Player.WHITE): 8554210917012930123,
-    (Point(row=13, col=13), Player.BLACK): 4870039831390649155,
-    (Point(row=13, col=13), Player.WHITE): 2141570442099161676,
-    (Point(row=13, col=14), Player.BLACK): 1973488335963716443,
-    (Point(row=13, col=14), Player.WHITE): 4683535837141591733,
-    (Point(row=13, col=15), Player.BLACK): 7640269807373701099,
-    (Point(row=13, col=15), Player.WHITE): 2557591217027456600,
-    (Point(row=13, col=16), Player.BLACK): 5627849047631520686,
-    (Point(row=13, col=16), Player.WHITE): 8648864920781444270,
-    (Point(row=13, col=17), Player.BLACK): 1757552109695748140,
-    (Point(row=13, col=17), Player.WHITE): 5141905488411384985,
-    (Point(row=13, col=18), Player.BLACK): 5705037506378392809,
-    (Point(row=13, col=18), Player.WHITE): 8078278489697280758,
-    (Point(row=13, col=19), Player.BLACK): 4553107304384860270,
-    (Point(row=13, col=19), Player.WHITE): 2898008093309514616,
-    (Point(row=14, col=1), Player.BLACK): 5689461650951042046,
-    (Point(row=14, col=1), Player.WHITE): 3844129883498450755,
-    (Point(row=14, col=2), Player.BLACK): 7721689300661025464,
-    (Point(row=14, col=2), Player.WHITE): 1909136438763859842,
-    (Point(row=14, col=3), Player.BLACK): 7384612971721647353,
-    (Point(row=14, col=3), Player.WHITE): 396996098057722295,
-    (Point(row=14, col=4), Player.BLACK): 8220919443021723093,
-    (Point(row=14, col=4), Player.WHITE): 4952979938211201699,
-    (Point(row=14, col=5), Player.BLACK): 3056501438911476280,
-    (Point(row=14, col=5), Player.WHITE): 1624110816689475876,
-    (Point(row=14, col=6), Player.BLACK): 6641689494762664353,
-    (Point(row=14, col=6), Player.WHITE): 2244942284047939077,
-    (Point(row=14, col=7), Player.BLACK): 7127967602610632368,
-    (Point(row=14, col=7), Player.WHITE): 5611609858025479952,
-    (Point(row=14, col=8), Player.BLACK): 854919501486622324,
-    (Point(row=14, col=8), Player.WHITE): 6826911905287678414,
-    (Point(row=14, col=9), Player.BLACK): 3932144699079685604,
-    (Point(row=14, col=9), Player.WHITE): 6910353049627316835,
-    (Point(row=14, col=10), Player.BLACK): 1564179625076360668,
-    (Point(row=14, col=10), Player.WHITE): 1363382105091056821,
-    (Point(row=14, col=11), Player.BLACK): 6166347158656788415,
-    (Point(row=14, col=11), Player.WHITE): 3355271962152447327,
-    (Point(row=14, col=12), Player.BLACK): 398566963794005556,
-    (Point(row=14, col=12), Player.WHITE): 8293713575128567025,
-    (Point(row=14, col=13), Player.BLACK): 248395014313191409,
-    (Point(row=14, col=13), Player.WHITE): 1090465344060126298,
-    (Point(row=14, col=14), Player.BLACK): 1977178387467569170,
-    (Point(row=14, col=14), Player.WHITE): 1511692397637660446,
-    (Point(row=14, col=15), Player.BLACK): 7043613427793735994,
-    (Point(row=14, col=15), Player.WHITE): 6127285123046445941,
-    (Point(row=14, col=16), Player.BLACK): 5977245118433982770,
-    (Point(row=14, col=16), Player.WHITE): 8524076116373297023,
-    (Point(row=14, col=17), Player.BLACK): 8130425125612730265,
-    (Point(row=14, col=17), Player.WHITE): 3322622450456938227,
-    (Point(row=14, col=18), Player.BLACK): 4691166711554203277,
-    (Point(row=14, col=18), Player.WHITE): 2908162311063350404,
-    (Point(row=14, col=19), Player.BLACK): 7036869287354837977,
-    (Point(row=14, col=19), Player.WHITE): 8372420755019170347,
-    (Point(row=15, col=1), Player.BLACK): 5739843410822601107,
-    (Point(row=15, col=1), Player.WHITE): 2043988660444043229,
-    (Point(row=15, col=2), Player.BLACK): 6337369652025161909,
-    (Point(row=15, col=2), Player.WHITE): 1700592249940667258,
-    (Point(row=15, col=3), Player.BLACK): 1680579967600380280,
-    (Point(row=15, col=3), Player.WHITE): 785246681427527642,
-    (Point(row=15, col=4), Player.BLACK): 3183785083592788047,
-    (Point(row=15, col=4), Player.WHITE): 634243726095880282,
-    (Point(row=15, col=5), Player.BLACK): 381793264955658838,
-    (Point(row=15, col=5), Player.WHITE): 2646996728175985250,
-    (Point(row=15, col=6), Player.BLACK): 8202174176417302026,
-    (Point(row=15, col=6), Player.WHITE): 3573293469674753549,
-    (Point(row=15, col=7), Player.BLACK): 4419330529326801663,
-    (Point(row=15, col=7), Player.WHITE): 3836858228492834146,
-    (Point(row=15, col=8), Player.BLACK): 24028094601690517,
-    (Point(row=15, col=8), Player.WHITE): 7516582163252961554,
-    (Point(row=15, col=9), Player.BLACK): 1665034431275111941,
-    (Point(row=15, col=9), Player.WHITE): 2280255097755698919,
-    (Point(row=15, col=10), Player.BLACK): 7514404793108903507,
-    (Point(row=15, col=10), Player.WHITE): 5485487145859878362,
-    (Point(row=15, col=11), Player.BLACK): 965393464670429705,
-    (Point(row=15, col=11), Player.WHITE): 8352127569730531517,
-    (Point(row=15, col=12), Player.BLACK): 4111509230041633353,
-    (Point(row=15, col=12), Player.WHITE): 6854058025968288006,
-    (Point(row=15, col=13), Player.BLACK): 5417927833235495920,
-    (Point(row=15, col=13), Player.WHITE): 5972543527933715251,
-    (Point(row=15, col=14), Player.BLACK): 8868456912660633490,
-    (Point(row=15, col=14), Player.WHITE): 594234513125519072,
-    (Point(row=15, col=15), Player.BLACK): 7881867245703717972,
-    (Point(row=15, col=15), Player.WHITE): 4177880821031835297,
-    (Point(row=15, col=16), Player.BLACK): 7457439993140912603,
-    (Point(row=15, col=16), Player.WHITE): 7870144832987840516,
-    (Point(row=15, col=17), Player.BLACK): 6718408738600710743,
-    (Point(row=15, col=17), Player.WHITE): 3170646455872350779,
-    (Point(row=15, col=18), Player.BLACK): 323097857151986002,
-    (Point(row=15, col=18), Player.WHITE): 1651170661748460160,
-    (Point(row=15, col=19), Player.BLACK): 2706879409250603610,
-    (Point(row=15, col=19), Player.WHITE): 7399447417969720011,
-    (Point(row=16, col=1), Player.BLACK): 7332441541941021771,
-    (Point(row=16, col=1), Player.WHITE): 8237569195830115042,
-    (Point(row=16, col=2), Player.BLACK): 4571939250953046305,
-    (Point(row=16, col=2), Player.WHITE): 4791141139986374665,
-    (Point(row=16, col=3), Player.BLACK): 6774286772869937629,
-    (Point(row=16, col=3), Player.WHITE): 1621605495847069722,
-    (Point(row=16, col=4), Player.BLACK): 5720665874962851507,
-    (Point(row=16, col=4), Player.WHITE): 4421845975963872303,
-    (Point(row=16, col=5), Player.BLACK): 2368803861893517294,
-    (Point(row=16, col=5), Player.WHITE): 2654244361869231199,
-    (Point(row=16, col=6), Player.BLACK): 6943224160797262708,
-    (Point(row=16, col=6), Player.WHITE): 844389170805044631,
-    (Point(row=16, col=7), Player.BLACK): 5183028578650992053,
-    (Point(row=16, col=7), Player.WHITE): 4016036810923563711,
-    (Point(row=16, col=8), Player.BLACK): 5497530819351125062,
-    (Point(row=16, col=8), Player.WHITE): 456412491203222080,
-    (Point(row=16, col=9), Player.BLACK): 4672760981748482335,
-    (Point(row=16, col=9), Player.WHITE): 8040599380452365034,
-    (Point(row=16, col=10), Player.BLACK): 7805687371914962705,
-    (Point(row=16, col=10), Player.WHITE): 3656838847526014259,
-    (Point(row=16, col=11), Player.BLACK): 8454092954027065359,
-    (Point(row=16, col=11), Player.WHITE): 612972078906914025,
-    (Point(row=16, col=12), Player.BLACK): 9122322234044750218,
-    (Point(row=16, col=12), Player.WHITE): 5154521278690127665,
-    (Point(row=16, col=13), Player.BLACK): 5834871432959809398,
-    (Point(row=16, col=13), Player.WHITE): 6959142678955436702,
-    (Point(row=16, col=14), Player.BLACK): 5774780334955877532,
-    (Point(row=16, col=14), Player.WHITE): 7013807412615258094,
-    (Point(row=16, col=15), Player.BLACK): 2059713562920066791,
-    (Point(row=16, col=15), Player.WHITE): 7349627772459510158,
-    (Point(row=16, col=16), Player.BLACK): 5786566649768896913,
-    (Point(row=16, col=16), Player.WHITE): 595950172576755763,
-    (Point(row=16, col=17), Player.BLACK): 3314115235949766677,
-    (Point(row=16, col=17), Player.WHITE): 108492917161249185,
-    (Point(row=16, col=18), Player.BLACK): 4176489764787428213,
-    (Point(row=16, col=18), Player.WHITE): 6547088587342856155,
-    (Point(row=16, col=19), Player.BLACK): 3712840546544946503,
-    (Point(row=16, col=19), Player.WHITE): 5446739771272207938,
-    (Point(row=17, col=1), Player.BLACK): 7361074199832240141,
-    (Point(row=17, col=1), Player.WHITE): 6334335809339542857,
-    (Point(row=17, col=2), Player.BLACK): 1920889165615978529,
-    (Point(row=17, col=2), Player.WHITE): 750889223767296766,
-    (Point(row=17, col=3), Player.BLACK): 4580951866941060709,
-    (Point(row=17, col=3), Player.WHITE): 6192488883227111557,
-    (Point(row=17, col=4), Player.BLACK): 5500529496630589355,
-    (Point(row=17, col=4), Player.WHITE): 2021714297294860519,
-    (Point(row=17, col=5), Player.BLACK): 7986786936789361412,
-    (Point(row=17, col=5), Player.WHITE): 1521507111816124201,
-    (Point(row=17, col=6), Player.BLACK): 1592219527299987765,
-    (Point(row=17, col=6), Player.WHITE): 4689185574718869038,
-    (Point(row=17, col=7), Player.BLACK): 8669237564480641057,
-    (Point(row=17, col=7), Player.WHITE): 6553929448646707727,
-    (Point(row=17, col=8), Player.BLACK): 6684873183573876031,
-    (Point(row=17, col=8), Player.WHITE): 8223108976788765007,
-    (Point(row=17, col=9), Player.BLACK): 7951106047704887329,
-    (Point(row=17, col=9), Player.WHITE): 788315502697811878,
-    (Point(row=17, col=10), Player.BLACK): 1690863048943178625,
-    (Point(row=17, col=10), Player.WHITE): 1610029953423994846,
-    (Point(row=17, col=11), Player.BLACK): 659986395163842978,
-    (Point(row=17, col=11), Player.WHITE): 4310190374799581888,
-    (Point(row=17, col=12), Player.BLACK): 533890052964861792,
-    (Point(row=17, col=12), Player.WHITE): 1364744544297203503,
-    (Point(row=17, col=13), Player.BLACK): 2796108840863406054,
-    (Point(row=17, col=13), Player.WHITE): 5386152482394947427,
-    (Point(row=17, col=14), Player.BLACK): 4028746747879799827,
-    (Point(row=17, col=14), Player.WHITE): 3089292125972136928,
-    (Point(row=17, col=15), Player.BLACK): 3471229555080030083,
-    (Point(row=17, col=15), Player.WHITE): 5464638286038421463,
-    (Point(row=17, col=16), Player.BLACK): 1962837848374588237,
-    (Point(row=17, col=16), Player.WHITE): 4219878652540167931,
-    (Point(row=17, col=17), Player.BLACK): 4972025188534017119,
-    (Point(row=17, col=17), Player.WHITE): 7705488264231898376,
-    (Point(row=17, col=18), Player.BLACK): 4330314463057492666,
-    (Point(row=17, col=18), Player.WHITE): 7285339176988771024,
-    (Point(row=17, col=19), Player.BLACK): 1609975245749862309,
-    (Point(row=17, col=19), Player.WHITE): 5467379224651096140,
-    (Point(row=18, col=1), Player.BLACK): 2147027126146317913,
-    (Point(row=18, col=1), Player.WHITE): 6440973162755492424,
-    (Point(row=18, col=2), Player.BLACK): 5039805731950401965,
-    (Point(row=18, col=2), Player.WHITE): 6814714831698689127,
-    (Point(row=18, col=3), Player.BLACK): 5926733575024180165,
-    (Point(row=18, col=3), Player.WHITE): 4900868249643966780,
-    (Point(row=18, col=4), Player.BLACK): 4798690688982846806,
-    (Point(row=18, col=4), Player.WHITE): 5631520185868753760,
-    (Point(row=18, col=5), Player.BLACK): 7614320107476999133,
-    (Point(row=18, col=5), Player.WHITE): 8078571838071776479,
-    (Point(row=18, col=6), Player.BLACK): 4863779121859768506,
-    (Point(row=18, col=6), Player.WHITE): 7989047392216568561,
-    (Point(row=18, col=7), Player.BLACK): 2101248684825734577,
-    (Point(row=18, col=7), Player.WHITE): 5627729789250417421,
-    (Point(row=18, col=8), Player.BLACK): 720574460458957032,
-    (Point(row=18, col=8), Player.WHITE): 6253243251574844420,
-    (Point(row=18, col=9), Player.BLACK): 3528920504637766887,
-    (Point(row=18, col=9), Player.WHITE): 7176183084878755638,
-    (Point(row=18, col=10), Player.BLACK): 1848922661875027468,
-    (Point(row=18, col=10), Player.WHITE): 5104281105644663710,
-    (Point(row=18, col=11), Player.BLACK): 7094917689779819204,
-    (Point(row=18, col=11), Player.WHITE): 8376057441020838640,
-    (Point(row=18, col=12), Player.BLACK): 3565832172603010350,
-    (Point(row=18, col=12), Player.WHITE): 1389411998168744654,
-    (Point(row=18, col=13), Player.BLACK): 144327991744299750,
-    (Point(row=18, col=13), Player.WHITE): 6281480761584542603,
-    (Point(row=18, col=14), Player.BLACK): 4051356487972370471,
-    (Point(row=18, col=14), Player.WHITE): 1981069386910737852,
-    (Point(row=18, col=15), Player.BLACK): 5170852998328095899,
-    (Point(row=18, col=15), Player.WHITE): 3327962820411408905,
-    (Point(row=18, col=16), Player.BLACK): 5390857208843070263,
-    (Point(row=18, col=16), Player.WHITE): 7736322714826416197,
-    (Point(row=18, col=17), Player.BLACK): 6021261974587853592,
-    (Point(row=18, col=17), Player.WHITE): 6963422607057639226,
-    (Point(row=18, col=18), Player.BLACK): 3804290242733381622,
-    (Point(row=18, col=18), Player.WHITE): 1262748658331969198,
-    (Point(row=18, col=19), Player.BLACK): 2098909159657511063,
-    (Point(row=18, col=19), Player.WHITE): 2031957403690404205,
-    (Point(row=19, col=1), Player.BLACK): 5656704036788218080,
-    (Point(row=19, col=1), Player.WHITE): 7360545364918658382,
-    (Point(row=19, col=2), Player.BLACK): 4827118852508780839,
-    (Point(row=19, col=2), Player.WHITE): 440729499821239242,
-    (Point(row=19, col=3), Player.BLACK): 1521424244277801748,
-    (Point(row=19, col=3), Player.WHITE): 7592699148954320541,
-    (Point(row=19, col=4), Player.BLACK): 6150502676131493401,
-    (Point(row=19, col=4), Player.WHITE): 7030134961428921769,
-    (Point(row=19, col=5), Player.BLACK): 8797997877804263362,
-    (Point(row=19, col=5), Player.WHITE): 6803838551509408396,
-    (Point(row=19, col=6), Player.BLACK): 4987972226044398850,
-    (Point(row=19, col=6), Player.WHITE): 3844906960318834398,
-    (Point(row=19, col=7), Player.BLACK): 6554187259759954139,
-    (Point(row=19, col=7), Player.WHITE): 4323582341979503812,
-    (Point(row=19, col=8), Player.BLACK): 4941121506779999698,
-    (Point(row=19, col=8), Player.WHITE): 6178295009358967484,
-    (Point(row=19, col=9), Player.BLACK): 8632939198580627358,
-    (Point(row=19, col=9), Player.WHITE): 8129511770305932897,
-    (Point(row=19, col=10), Player.BLACK): 5108452185092465480,
-    (Point(row=19, col=10), Player.WHITE): 2317795365710230923,
-    (Point(row=19, col=11), Player.BLACK): 7824714187466081272,
-    (Point(row=19, col=11), Player.WHITE): 6553848788982295662,
-    (Point(row=19, col=12), Player.BLACK): 136879673970822036,
-    (Point(row=19, col=12), Player.WHITE): 3647632394989563946,
-    (Point(row=19, col=13), Player.BLACK): 7823663532142234046,
-    (Point(row=19, col=13), Player.WHITE): 7094545135596193202,
-    (Point(row=19, col=14), Player.BLACK): 6914332742495401100,
-    (Point(row=19, col=14), Player.WHITE): 5100949185585779021,
-    (Point(row=19, col=15), Player.BLACK): 6313964108793581025,
-    (Point(row=19, col=15), Player.WHITE): 7312581982977858697,
-    (Point(row=19, col=16), Player.BLACK): 6055118377652251859,
-    (Point(row=19, col=16), Player.WHITE): 3273873400825192629,
-    (Point(row=19, col=17), Player.BLACK): 5737260426274398901,
-    (Point(row=19, col=17), Player.WHITE): 7670222826268763033,
-    (Point(row=19, col=18), Player.BLACK): 8161561413983706276,
-    (Point(row=19, col=18), Player.WHITE): 7005016635456215169,
-    (Point(row=19, col=19), Player.BLACK): 6664743863348170665,
-    (Point(row=19, col=19), Player.WHITE): 5102429366153423034,
-}
+Boards use hash_table, which holds the codes for one board size in a compact int array per player indexed by
+Point.index, and is generated once per size.
+
+A few extra codes let a GameState fold more than the stones into one hash (see GameState.situation_hash): one for
+white being the side to move, one per possible simple-ko point and one per number of consecutive passes. Each kind of
+code is drawn from its own stream, so they never coincide with the stone codes.
+"""
+
+Hash = NewType('Hash', int)
 
 EMPTY_BOARD: Hash = 1
+
+SEED = 0x5DEECE66D2F9A1B3
+
+_MASK64 = 0xffffffffffffffff
+# 2 ^ 63 - 1, the maximum number we can have for the purposes of our hashes
+_MAX63 = 0x7fffffffffffffff
+
+
+def _splitmix64(value: int) -> int:
+    value = (value + 0x9e3779b97f4a7c15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xbf58476d1ce4e5b9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94d049bb133111eb) & _MASK64
+    return value ^ (value >> 31)
+
+
+def _code(stream: int) -> Hash:
+    return Hash(_splitmix64(SEED ^ stream) & _MAX63)
+
+
+# stream offsets of the codes that are not stones. Stone streams stay below 2 * MAX_BOARD_SIZE ** 2.
+_WHITE_TO_MOVE_STREAM = 1 << 20
+_KO_STREAM = 1 << 21
+_PASS_STREAM = 1 << 22
+
+
+def hash_code(point: Point, player: Player) -> Hash:
+    return _code(2 * point.index + player.value - 1)
+
+
+WHITE_TO_MOVE: Hash = _code(_WHITE_TO_MOVE_STREAM)
+
+
+def to_move_code(player: Player) -> Hash:
+    # black to move is the default, and does not change the hash
+    return WHITE_TO_MOVE if player == Player.WHITE else Hash(0)
+
+
+def ko_code(point: Point) -> Hash:
+    return _code(_KO_STREAM + point.index)
+
+
+def pass_code(num_passes: int) -> Hash:
+    # no passes is the default, and does not change the hash
+    return Hash(0) if num_passes == 0 else _code(_PASS_STREAM + num_passes)
+
+
+@lru_cache(maxsize=None)
+def hash_table(num_rows: int, num_cols: int) -> dict[Player, array]:
+    if not (1 <= num_rows <= MAX_BOARD_SIZE and 1 <= num_cols <= MAX_BOARD_SIZE):
+        raise ValueError(f'zobrist codes are only available for boards of up to {MAX_BOARD_SIZE}x{MAX_BOARD_SIZE}')
+
+    # Point.index of the last point on the board, every index up to it gets a code
+    size = Point(num_rows, num_cols).index + 1
+    return {
+        player: array('q', (_code(2 * index + player.value - 1) for index in range(size)))
+        for player in (Player.BLACK, Player.WHITE)
+    }
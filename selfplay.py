@@ -0,0 +1,52 @@
+import argparse
+import json
+from dlgo import instrument, selfplay, sgf
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Play bot vs bot games without a display, on all cores.')
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--board-size', type=int, default=9)
+    parser.add_argument('--black', default='naive', help='agent spec, e.g. naive or mcts:num_playouts=200')
+    parser.add_argument('--white', default='naive', help='agent spec, e.g. naive or mcts:num_playouts=200')
+    parser.add_argument('--engine', default='goboard', choices=sorted(selfplay.ENGINES))
+    parser.add_argument('--komi', type=float, default=7.5)
+    parser.add_argument('--workers', type=int, default=None, help='worker processes, one per core by default')
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--quiet', action='store_true', help='only print the summary')
+    parser.add_argument('--instrument', action='store_true', help='count and time the hot paths of every game')
+    parser.add_argument('--sgf', help='append every game to this SGF file')
+    args = parser.parse_args()
+
+    stats = selfplay.SelfPlayStats()
+    records = selfplay.play_games(
+        args.games, args.black, args.white, workers=args.workers, board_size=args.board_size, engine=args.engine,
+        komi=args.komi, seed=args.seed, instrumented=args.instrument, record_moves=args.sgf is not None,
+    )
+    writer = sgf.SGFWriter(args.sgf) if args.sgf else None
+    counters = []
+    for record in records:
+        stats.add(record)
+        if record.counters is not None:
+            counters.append(record.counters)
+        if writer is not None:
+            writer.write_game(record.moves, args.board_size, komi=args.komi, result=selfplay.sgf_result(record),
+                              black=args.black, white=args.white)
+        if not args.quiet:
+            if record.winner is not None:
+                outcome = f'{record.winner.name.lower()} wins'
+            else:
+                outcome = 'draw' if record.margin == 0 else 'none wins'
+            print(f'game {record.game}: {outcome} after {record.num_moves} moves ({record.seconds:.2f}s)')
+
+    if writer is not None:
+        writer.close()
+
+    for key, value in stats.summary().items():
+        print(f'{key}: {value:.2f}' if isinstance(value, float) else f'{key}: {value}')
+    if counters:
+        print(json.dumps(instrument.merge(counters), indent=2))
+
+
+if __name__ == '__main__':
+    main()
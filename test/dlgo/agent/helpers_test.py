@@ -0,0 +1,69 @@
+import random
+import pytest
+from dlgo.gotypes import Point, Player
+from dlgo import goboard, goboard_fast, bitboard
+from dlgo.agent.helpers import is_point_an_eye, eye_mask
+
+
+class TestEyes:
+    @pytest.fixture
+    def board(self) -> goboard.Board:
+        return goboard.Board(5, 5)
+
+    def test_eye_in_the_middle(self, board):
+        for point in [Point(2, 3), Point(3, 2), Point(3, 4), Point(4, 3), Point(2, 2), Point(2, 4), Point(4, 2)]:
+            board.place_stone(Player.BLACK, point)
+        # one diagonal corner may be taken by the opponent
+        board.place_stone(Player.WHITE, Point(4, 4))
+
+        assert is_point_an_eye(board, Point(3, 3), Player.BLACK)
+        assert not is_point_an_eye(board, Point(3, 3), Player.WHITE)
+        assert eye_mask(board, Player.BLACK)[2, 2]
+
+    def test_false_eye_in_the_middle(self, board):
+        for point in [Point(2, 3), Point(3, 2), Point(3, 4), Point(4, 3), Point(2, 2)]:
+            board.place_stone(Player.BLACK, point)
+        for point in [Point(4, 4), Point(2, 4)]:
+            board.place_stone(Player.WHITE, point)
+
+        assert not is_point_an_eye(board, Point(3, 3), Player.BLACK)
+        assert not eye_mask(board, Player.BLACK)[2, 2]
+
+    def test_edge_needs_every_corner(self, board):
+        for point in [Point(1, 2), Point(1, 4), Point(2, 3), Point(2, 2)]:
+            board.place_stone(Player.BLACK, point)
+
+        # the first corner checked is off the board, which used to decide the result on its own
+        assert not is_point_an_eye(board, Point(1, 3), Player.BLACK)
+        assert not eye_mask(board, Player.BLACK)[0, 2]
+
+        board.place_stone(Player.BLACK, Point(2, 4))
+        assert is_point_an_eye(board, Point(1, 3), Player.BLACK)
+        assert eye_mask(board, Player.BLACK)[0, 2]
+
+    def test_corner_eye(self, board):
+        for point in [Point(1, 2), Point(2, 1), Point(2, 2)]:
+            board.place_stone(Player.WHITE, point)
+
+        assert is_point_an_eye(board, Point(1, 1), Player.WHITE)
+        assert eye_mask(board, Player.WHITE)[0, 0]
+        assert not eye_mask(board, Player.BLACK)[0, 0]
+
+    @pytest.mark.parametrize('board_class', [goboard.Board, goboard_fast.Board, bitboard.BitBoard])
+    @pytest.mark.parametrize('num_rows, num_cols', [(5, 5), (7, 4)])
+    def test_eye_mask_matches_is_point_an_eye(self, board_class, num_rows, num_cols):
+        rng = random.Random(7)
+        for _ in range(20):
+            board = board_class(num_rows, num_cols)
+            for _ in range(num_rows * num_cols * 2):
+                point = Point(rng.randint(1, num_rows), rng.randint(1, num_cols))
+                player = rng.choice([Player.BLACK, Player.WHITE])
+                if point in board.legal_points(player):
+                    board.place_stone(player, point)
+
+            for color in (Player.BLACK, Player.WHITE):
+                mask = eye_mask(board, color)
+                assert mask.shape == (num_rows, num_cols)
+                for row in range(1, num_rows + 1):
+                    for col in range(1, num_cols + 1):
+                        assert mask[row - 1, col - 1] == is_point_an_eye(board, Point(row, col), color)
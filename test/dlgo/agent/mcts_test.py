@@ -0,0 +1,65 @@
+import random
+import pytest
+from dlgo import goboard_fast as goboard
+from dlgo.agent import mcts
+
+
+class TestMCTSAgent:
+    @pytest.fixture(scope="function")
+    def game_state(self) -> goboard.GameState:
+        random.seed(1234)
+        return goboard.GameState.new_game(board_size=4)
+
+    def test_selects_valid_move(self, game_state):
+        agent = mcts.MCTSAgent(num_playouts=50)
+        move = agent.select_move(game_state)
+
+        assert game_state.is_valid_move(move)
+        assert not move.is_resign
+        assert agent.playouts == 50
+        assert agent.stats()['playouts_per_second'] > 0
+
+    def test_root_visits_match_playouts(self, game_state):
+        agent = mcts.MCTSAgent(num_playouts=40, reuse_tree=False)
+        agent.select_move(game_state)
+        # the tree is dropped after every move when it is not reused
+        assert agent.num_nodes == 0
+
+        agent = mcts.MCTSAgent(num_playouts=40)
+        agent.select_move(game_state)
+        assert agent._visits[0] == 40
+        assert sum(agent._visits[child] for child in agent._children[0]) == 40
+
+    def test_reuses_subtree(self, game_state):
+        agent = mcts.MCTSAgent(num_playouts=200)
+        move = agent.select_move(game_state)
+        chosen = next(child for child in agent._children[0] if agent._moves[child] is move)
+        reply_node = max(agent._children[chosen], key=lambda child: agent._visits[child])
+        reply_visits = agent._visits[reply_node]
+
+        game_state = game_state.apply_move(move).apply_move(agent._moves[reply_node])
+        agent.select_move(game_state)
+
+        assert agent.reused_nodes > 0
+        assert agent._visits[0] == reply_visits + 200
+
+    def test_time_budget(self, game_state):
+        agent = mcts.MCTSAgent(time_budget=0.05)
+        agent.select_move(game_state)
+
+        assert agent.playouts >= 1
+        assert agent.seconds >= 0.05
+
+    def test_passes_when_game_is_over(self, game_state):
+        game_state = game_state.apply_move(goboard.Move.pass_turn()).apply_move(goboard.Move.pass_turn())
+
+        assert mcts.MCTSAgent(num_playouts=5).select_move(game_state).is_pass
+
+    def test_draws_count_half(self, game_state):
+        # playouts end at once, and a single black stone on the empty 4x4 board scores 16 points, as much as the komi
+        agent = mcts.MCTSAgent(num_playouts=10, komi=16, max_playout_moves=0)
+        agent.select_move(game_state)
+
+        children = [child for child in agent._children[0] if agent._moves[child].is_play]
+        assert children
+        assert all(agent._visits[child] == 1 and agent._wins[child] == 0.5 for child in children)
@@ -38,9 +38,9 @@ class TestNaiveAgent:
 
         return game_state  # Player.BLACK's turn, Point(2, 1), Point(2, 2) remaining
 
-    @pytest.fixture(scope="function")
-    def agent(self) -> naive.NaiveAgent:
-        return naive.NaiveAgent()
+    @pytest.fixture(scope="function", params=[True, False], ids=["sample", "exhaustive"])
+    def agent(self, request) -> naive.NaiveAgent:
+        return naive.NaiveAgent(sample=request.param)
 
     def test_agent_handles_no_available_moves(self, agent: naive.NaiveAgent, game_state_no_moves: goboard.GameState):
         move = agent.select_move(game_state_no_moves)
@@ -0,0 +1,125 @@
+import numpy as np
+import pytest
+from dlgo import archive, goboard, goboard_fast, sgf
+from dlgo.agent.naive import NaiveAgent
+from dlgo.goboard import Move
+from dlgo.gotypes import Player, Point
+
+
+def play_random_game(board_size, max_moves=60):
+    game_state = goboard_fast.GameState.new_game(board_size)
+    agent = NaiveAgent()
+    while not game_state.is_over() and max_moves > 0:
+        game_state = game_state.apply_move(agent.select_move(game_state))
+        max_moves -= 1
+    return game_state
+
+
+def game_length(game_state):
+    length = 0
+    while game_state.previous_state is not None:
+        game_state = game_state.previous_state
+        length += 1
+    return length
+
+
+def move_keys(moves):
+    return [(move.point, move.is_pass, move.is_resign) for move in moves]
+
+
+class TestArchive:
+    @pytest.mark.parametrize('board_size, itemsize', [(9, 1), (15, 1), (19, 2)])
+    def test_game_state_round_trip(self, tmp_path, board_size, itemsize):
+        game_state = play_random_game(board_size)
+        path = tmp_path / 'games.dla'
+        with archive.ArchiveWriter(path) as writer:
+            writer.add_game_state(game_state, komi=6.5, winner=Player.WHITE)
+            writer.add_game([Move.play(Point(1, 1)), Move.pass_turn(), Move.resign_turn()], board_size)
+
+        with archive.GameArchive(path) as games:
+            assert len(games) == 2
+            codes = games.moves(0)
+            assert codes.dtype.itemsize == itemsize
+            assert len(codes) == game_length(game_state)
+
+            game = games.game(0)
+            assert game.board_size == board_size
+            assert game.komi == 6.5
+            assert game.winner == Player.WHITE
+            replayed = games.replay(0, goboard_fast.GameState)
+            assert replayed.board.zobrist_hash() == game_state.board.zobrist_hash()
+            assert replayed.next_player == game_state.next_player
+
+            pass_code, resign_code = games.special_codes(1)
+            assert games.moves(1).tolist() == [0, pass_code, resign_code]
+            assert move_keys(games.game(1).moves) == \
+                [(Point(1, 1), False, False), (None, True, False), (None, False, True)]
+            assert games.game(1).winner is None
+
+    def test_moves_are_views_of_the_file(self, tmp_path):
+        path = tmp_path / 'games.dla'
+        with archive.ArchiveWriter(path) as writer:
+            for row in range(1, 4):
+                writer.add_game([Move.play(Point(row, col)) for col in range(1, 6)], 9)
+
+        games = archive.GameArchive(path)
+        arrays = list(games.iter_moves())
+        assert [array.tolist() for array in arrays] == [[0, 1, 2, 3, 4], [9, 10, 11, 12, 13], [18, 19, 20, 21, 22]]
+        assert all(not array.flags.owndata and not array.flags.writeable for array in arrays)
+        assert np.concatenate(arrays).sum() == sum(range(5)) * 3 + 5 * 27
+        games.close()
+        # the arrays outlive the archive
+        assert arrays[2].tolist() == [18, 19, 20, 21, 22]
+
+    def test_close_while_iterating(self, tmp_path):
+        path = tmp_path / 'games.dla'
+        with archive.ArchiveWriter(path) as writer:
+            writer.add_game([Move.play(Point(1, 1)), Move.play(Point(2, 2))], 9)
+            writer.add_game([Move.pass_turn()], 9)
+
+        num_moves = 0
+        with archive.GameArchive(path) as games:
+            for moves in games.iter_moves():
+                num_moves += len(moves)
+        assert num_moves == 3
+        games.close()
+
+    def test_rejects_setup_passes(self, tmp_path):
+        with archive.ArchiveWriter(tmp_path / 'games.dla') as writer:
+            with pytest.raises(ValueError):
+                writer.add_game([], 9, setup={Player.BLACK: [None], Player.WHITE: []})
+            with pytest.raises(ValueError):
+                writer.add_game([Move.play(Point(10, 1))], 9)
+            assert len(writer) == 0
+
+    def test_sgf_conversion_keeps_setup_and_turns(self, tmp_path):
+        sgf_path = tmp_path / 'games.sgf'
+        sgf_path.write_text(
+            '(;GM[1]SZ[9]KM[0.5]RE[B+3.5]AB[cc][gg];W[ee];W[dd];B[tt]'
+            '(;B[aa])(;B[bb]))\n'
+            '(;SZ[5]RE[W+R];B[aa];W[])\n'
+        )
+        path = tmp_path / 'games.dla'
+
+        assert archive.convert_sgf(sgf_path, path) == 2
+        with archive.GameArchive(path) as games:
+            first = games.game(0)
+            assert first.winner == Player.BLACK
+            assert first.first_player == Player.WHITE
+            assert first.setup == {Player.BLACK: [Point(7, 3), Point(3, 7)], Player.WHITE: []}
+            # white's second move in a row is stored after a pass by black
+            assert move_keys(first.moves)[:3] == [(Point(5, 5), False, False), (None, True, False),
+                                                  (Point(6, 4), False, False)]
+
+            sgf_game = next(sgf.read_games(sgf_path))
+            *_, expected = sgf.replay(sgf_game, goboard.GameState)
+            assert games.replay(0).board.zobrist_hash() == expected.board.zobrist_hash()
+
+            assert games.game(1).winner == Player.WHITE
+            assert games.game(1).board_size == 5
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / 'games.sgf'
+        path.write_bytes(b'(;GM[1]SZ[9])'.ljust(archive.HEADER_SIZE))
+        with pytest.raises(ValueError):
+            archive.GameArchive(path)
@@ -0,0 +1,121 @@
+import numpy as np
+import pytest
+from dlgo.gotypes import Point, Player
+from dlgo import goboard
+from dlgo.batch import BatchBoard, PASS
+
+
+class TestBatchBoard:
+    @pytest.fixture
+    def rng(self) -> np.random.Generator:
+        return np.random.default_rng(1234)
+
+    def test_new_board_is_empty(self):
+        batch = BatchBoard(3, 5, 7)
+
+        assert batch.stones.shape == (3, 5, 7)
+        assert not batch.stones.any()
+        assert batch.legal_mask().all()
+        assert batch.next_player == Player.BLACK
+
+    def test_capture(self):
+        batch = BatchBoard(2, 3, 3)
+        # only the first game plays the capture, the second game passes throughout
+        for move in (Point(1, 2), Point(1, 1), Point(2, 1)):
+            batch.play(np.array([(move.row - 1) * 3 + (move.col - 1), PASS]))
+
+        assert batch.stones[0, 0, 0] == 0
+        assert not batch.stones[1].any()
+        assert batch.done[1]
+        assert not batch.legal_mask()[1].any()
+
+    def test_simple_ko(self):
+        batch = BatchBoard(1, 3, 4)
+        moves = [Point(1, 2), Point(1, 3), Point(2, 1), Point(2, 4), Point(3, 2), Point(3, 3), Point(2, 3), Point(2, 2)]
+        for move in moves:
+            batch.play(np.array([(move.row - 1) * 4 + (move.col - 1)]))
+
+        # white just captured at (2, 3) with a single stone, black can not take back immediately
+        assert batch.stones[0, 1, 2] == 0
+        assert batch.ko[0] == 1 * 4 + 2
+        assert not batch.legal_mask()[0, 1, 2]
+        with pytest.raises(ValueError):
+            batch.play(np.array([1 * 4 + 2]))
+
+        # the ko is lifted as soon as black plays elsewhere
+        batch.play(np.array([2 * 4 + 0]))
+        assert batch.ko[0] == -1
+
+    def test_random_games_match_goboard(self, rng):
+        batch = BatchBoard(16, 5, 5)
+        boards = [goboard.Board(5, 5) for _ in range(batch.num_games)]
+
+        while not batch.done.all():
+            player = batch.next_player
+            legal = batch.legal_mask()
+            for game, board in enumerate(boards):
+                if batch.done[game]:
+                    continue
+                expected = board.legal_points(player)
+                if batch.ko[game] >= 0:
+                    expected = expected - {batch.point(int(batch.ko[game]))}
+                actual = {batch.point(int(index)) for index in np.flatnonzero(legal[game])}
+                assert actual == expected
+
+            moves = batch.random_moves(rng)
+            for game, board in enumerate(boards):
+                if moves[game] != PASS and not batch.done[game]:
+                    board.place_stone(player, batch.point(int(moves[game])))
+            batch.play(moves)
+
+            for game, board in enumerate(boards):
+                batch_board = batch.to_board(game)
+                for index in range(batch.num_points):
+                    point = batch.point(index)
+                    assert batch_board.get_player(point) == board.get_player(point)
+
+    def test_play_random_finishes_games(self, rng):
+        batch = BatchBoard(50, 9, 9)
+        steps = batch.play_random(rng)
+
+        assert steps == batch.num_steps
+        assert batch.done.all()
+
+    def test_repeated_position_ends_game(self):
+        batch = BatchBoard(2, 3, 3)
+        # black sends two stones at (2, 1) and (3, 1), and retaking at (2, 1) returns to the position after the fourth
+        # move. The second game passes throughout.
+        moves = [Point(2, 1), Point(2, 2), Point(1, 2), Point(3, 2), Point(3, 1), Point(1, 1)]
+        for move in moves:
+            batch.play(np.array([(move.row - 1) * 3 + (move.col - 1), PASS]))
+        assert not batch.repeated.any()
+        assert batch.legal_mask()[0, 1, 0]
+
+        batch.play(np.array([1 * 3 + 0, PASS]))
+        assert batch.repeated[0]
+        assert batch.done[0]
+        assert not batch.repeated[1]
+
+    def test_repetition_check_stays_linear(self, rng):
+        # every stone played costs one lookup in its game's set of earlier positions, however long the game has run,
+        # and every position is stored once
+        class CountingSet(set):
+            lookups = 0
+
+            def __contains__(self, item) -> bool:
+                CountingSet.lookups += 1
+                return super().__contains__(item)
+
+        batch = BatchBoard(20, 9, 9)
+        batch._positions = [CountingSet(positions) for positions in batch._positions]
+        num_played = 0
+        for _ in range(500):
+            if batch.done.all():
+                break
+            moves = batch.random_moves(rng)
+            num_played += int(((moves != PASS) & ~batch.done).sum())
+            batch.play(moves)
+
+        assert num_played > 20 * 81
+        assert CountingSet.lookups == num_played
+        assert sum(len(positions) for positions in batch._positions) == 20 + num_played - batch.repeated.sum()
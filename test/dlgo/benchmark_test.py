@@ -0,0 +1,55 @@
+import json
+import random
+from dlgo import benchmark
+
+
+class TestBenchmark:
+    def test_record_game_is_seeded(self):
+        state = random.getstate()
+        moves = benchmark.record_game(5, seed=3)
+
+        assert [(move.point, move.is_pass) for move in moves] == \
+            [(move.point, move.is_pass) for move in benchmark.record_game(5, seed=3)]
+        # the global random state is left alone
+        assert random.getstate() == state
+
+    def test_run_suite(self, tmp_path):
+        run = benchmark.run_suite(['goboard', 'goboard_fast'], board_sizes=(5,), repeat=1, suites=['engines'])
+
+        assert set(run['results']) == {'goboard/5x5', 'goboard_fast/5x5'}
+        for metrics in run['results'].values():
+            assert set(metrics) == {
+                'place_stone_per_sec', 'apply_move_us', 'is_valid_move_per_sec', 'random_game_ms', 'peak_memory_kb'
+            }
+            assert all(value > 0 for value in metrics.values())
+
+        path = str(tmp_path / 'run.json')
+        benchmark.dump(run, path)
+        assert benchmark.load(path) == json.loads(json.dumps(run))
+
+    def test_sgf_suite(self):
+        run = benchmark.run_suite(board_sizes=(5,), repeat=1, suites=['sgf'])
+
+        assert set(run['results']) == {'sgf/5x5'}
+        assert run['results']['sgf/5x5']['parse_games_per_sec'] > 0
+
+    def test_encoder_suite(self):
+        run = benchmark.run_suite(board_sizes=(5,), repeat=1, suites=['encoders'])
+
+        assert set(run['results']) == {'planes/5x5'}
+        assert run['results']['planes/5x5']['encodings_per_sec'] > 0
+
+    def test_compare_flags_regressions_by_direction(self):
+        baseline = {'results': {'goboard/9x9': {'place_stone_per_sec': 1000.0, 'apply_move_us': 10.0}}}
+        run = {'results': {
+            'goboard/9x9': {'place_stone_per_sec': 850.0, 'apply_move_us': 10.5},
+            'bitboard/9x9': {'place_stone_per_sec': 1.0},
+        }}
+
+        regressions = benchmark.compare(run, baseline, tolerance=0.1)
+        assert [(regression.benchmark, regression.metric) for regression in regressions] == \
+            [('goboard/9x9', 'place_stone_per_sec')]
+        assert benchmark.compare(run, baseline, tolerance=0.2) == []
+
+        slower = {'results': {'goboard/9x9': {'place_stone_per_sec': 2000.0, 'apply_move_us': 20.0}}}
+        assert [regression.metric for regression in benchmark.compare(slower, baseline)] == ['apply_move_us']
@@ -0,0 +1,42 @@
+import pytest
+from dlgo.gotypes import Point, Player
+from dlgo import bitboard, goboard
+from test.dlgo import goboard_test
+
+
+class TestBitBoard(goboard_test.TestBoard):
+    @pytest.fixture(scope="class")
+    def board_class(self) -> type:
+        return bitboard.BitBoard
+
+    @pytest.mark.skip(reason='BitBoard recomputes the legal points of the whole board at once, see its legal_points')
+    def test_legal_points_check_does_not_grow_with_string_size(self, board_class):
+        pass
+
+    def test_rows_do_not_wrap(self):
+        # the last column of one row must not be treated as a neighbor of the first column of the next row
+        board = bitboard.BitBoard(3, 3)
+        board.place_stone(Player.BLACK, Point(1, 3))
+
+        assert Point(2, 1) not in board.get_go_string(Point(1, 3)).liberties
+        assert board.get_go_string(Point(1, 3)).num_liberties == 2
+
+    def test_copy_shares_tables(self):
+        board = bitboard.BitBoard(9, 9)
+        board.place_stone(Player.BLACK, Point(5, 5))
+        board_copy = board.copy()
+
+        assert board_copy._codes is board._codes
+        assert board_copy.zobrist_hash() == board.zobrist_hash()
+
+
+class TestGameState(goboard_test.TestGameState):
+    @pytest.fixture(scope="class")
+    def game_state_class(self) -> type:
+        return bitboard.GameState
+
+    def test_apply_move_keeps_implementation(self, game_state):
+        game_state = game_state.apply_move(goboard.Move.play(Point(1, 1)))
+
+        assert isinstance(game_state, bitboard.GameState)
+        assert isinstance(game_state.board, bitboard.BitBoard)
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from dlgo import goboard, goboard_fast, bitboard
+from dlgo.encoders import planes
+from dlgo.encoders.base import get_encoder_by_name
+from dlgo.goboard import Move
+from dlgo.gotypes import Point
+
+
+def play(game_state, *moves):
+    for move in moves:
+        game_state = game_state.apply_move(Move.pass_turn() if move is None else Move.play(move))
+    return game_state
+
+
+class TestFeaturePlaneEncoder:
+    @pytest.fixture(scope="function")
+    def encoder(self):
+        return get_encoder_by_name('planes', 5)
+
+    def test_lookup_by_name(self, encoder):
+        assert isinstance(encoder, planes.FeaturePlaneEncoder)
+        assert encoder.name() == 'planes'
+        assert encoder.shape() == (14, 5, 5)
+        assert encoder.num_points() == 25
+        assert all(encoder.decode_point_index(encoder.encode_point(Point(row, col))) == Point(row, col)
+                   for row in range(1, 6) for col in range(1, 6))
+
+    @pytest.mark.parametrize('game_state_class', [goboard.GameState, goboard_fast.GameState, bitboard.GameState])
+    def test_planes(self, encoder, game_state_class):
+        # black (1, 1) and (1, 2), white (2, 1) and (3, 3), then a black pass: white to move
+        game_state = play(game_state_class.new_game(5), Point(1, 1), Point(2, 1), Point(1, 2), Point(3, 3), None)
+        encoded = encoder.encode(game_state)
+
+        assert encoded.dtype == np.float32
+        assert set(np.unique(encoded)) <= {0, 1}
+        own, opponent = encoded[planes.OWN_STONES], encoded[planes.OPPONENT_STONES]
+        assert list(zip(*np.nonzero(own))) == [(1, 0), (2, 2)]
+        assert list(zip(*np.nonzero(opponent))) == [(0, 0), (0, 1)]
+        # white (2, 1) has two liberties, (3, 3) four, and black's pair at the top two
+        assert encoded[planes.OWN_LIBERTIES + 1, 1, 0] == 1
+        assert encoded[planes.OWN_LIBERTIES + 2, 2, 2] == 1
+        assert encoded[planes.OPPONENT_LIBERTIES + 1].sum() == 2
+        assert encoded[planes.OPPONENT_LIBERTIES].sum() == encoded[planes.OPPONENT_LIBERTIES + 2].sum() == 0
+        assert not encoded[planes.BLACK_TO_MOVE].any()
+        assert not encoded[planes.KO].any()
+
+        # the last move was a pass, then white (3, 3), black (1, 2) and white (2, 1)
+        history = encoded[planes.HISTORY:]
+        assert not history[0].any()
+        assert [tuple(np.argwhere(plane)[0]) for plane in history[1:]] == [(2, 2), (0, 1), (1, 0)]
+
+    def test_ko_point(self, encoder):
+        # black captures white (2, 2) at (2, 3); white may not retake at (2, 2)
+        game_state = play(
+            goboard.GameState.new_game(5),
+            Point(2, 1), Point(2, 2), Point(1, 2), Point(1, 3), Point(3, 2), Point(3, 3), None, Point(2, 4),
+            Point(2, 3),
+        )
+        assert game_state.ko_point == Point(2, 2)
+
+        encoded = encoder.encode(game_state)
+        assert list(zip(*np.nonzero(encoded[planes.KO]))) == [(1, 1)]
+        # the captured white stone is gone
+        assert encoded[planes.OWN_STONES, 1, 1] == 0
+
+    def test_encode_batch_fills_in_place(self, encoder):
+        game_states = [goboard.GameState.new_game(5)]
+        for point in [Point(3, 3), Point(2, 2), Point(4, 4)]:
+            game_states.append(play(game_states[-1], point))
+        batch = np.full((6,) + encoder.shape(), 7, dtype=np.uint8)
+
+        assert encoder.encode_batch(game_states, batch) is batch
+        for position, game_state in enumerate(game_states):
+            assert np.array_equal(batch[position], encoder.encode(game_state))
+        # entries after the last position are left alone
+        assert (batch[4:] == 7).all()
+
+        with pytest.raises(ValueError):
+            encoder.encode_batch(game_states, np.empty((2,) + encoder.shape()))
+
+    def test_encode_into_checks_out(self, encoder):
+        game_state = goboard.GameState.new_game(5)
+        with pytest.raises(ValueError):
+            encoder.encode_into(game_state, np.empty((13, 5, 5)))
+        with pytest.raises(ValueError):
+            encoder.encode_into(game_state, np.empty((14, 5, 10))[:, :, ::2])
@@ -0,0 +1,57 @@
+import pytest
+from dlgo.gotypes import Point, Player
+from dlgo import goboard, goboard_fast, zobrist
+from test.dlgo import goboard_test
+
+
+class TestBoard(goboard_test.TestBoard):
+    @pytest.fixture(scope="class")
+    def board_class(self) -> type:
+        return goboard_fast.Board
+
+    def test_captured_stones_become_liberties(self):
+        board = goboard_fast.Board(3, 3)
+        board.place_stone(Player.WHITE, Point(1, 1))
+        board.place_stone(Player.BLACK, Point(1, 2))
+        board.place_stone(Player.BLACK, Point(2, 1))
+
+        assert board.get_player(Point(1, 1)) is None
+        assert board.get_go_string(Point(1, 2)).num_liberties == 3
+        assert board.zobrist_hash() == zobrist.EMPTY_BOARD ^ \
+            zobrist.hash_code(Point(1, 2), Player.BLACK) ^ zobrist.hash_code(Point(2, 1), Player.BLACK)
+
+    def test_atari_does_not_walk_the_string(self):
+        # the last liberty of a string that goes into atari is found from its liberty sum, not by walking its stones
+        board = goboard_fast.Board(19, 19)
+        for col in range(1, 19):
+            board.place_stone(Player.BLACK, Point(1, col))
+        for col in range(1, 18):
+            board.place_stone(Player.WHITE, Point(2, col))
+        board.legal_points(Player.BLACK)
+
+        walked = []
+        stones = board._stones
+
+        def counting_stones(root: int) -> list[int]:
+            walked.append(root)
+            return stones(root)
+
+        board._stones = counting_stones
+        board.place_stone(Player.WHITE, Point(2, 18))
+
+        assert walked == []
+        assert board.get_go_string(Point(1, 1)).liberties == {Point(1, 19)}
+        assert Point(1, 19) in board.legal_points(Player.WHITE)
+        assert Point(1, 19) in board.legal_points(Player.BLACK)
+
+
+class TestGameState(goboard_test.TestGameState):
+    @pytest.fixture(scope="class")
+    def game_state_class(self) -> type:
+        return goboard_fast.GameState
+
+    def test_apply_move_keeps_implementation(self, game_state):
+        game_state = game_state.apply_move(goboard.Move.play(Point(1, 1)))
+
+        assert isinstance(game_state, goboard_fast.GameState)
+        assert isinstance(game_state.board, goboard_fast.Board)
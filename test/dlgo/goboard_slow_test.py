@@ -194,6 +194,18 @@ class TestBoard:
         board.place_stone(Player.BLACK, Point(2, 3))
         assert not board.is_point_occupied(Point(2, 2))
 
+    def test_colors(self):
+        board = Board(num_rows=2, num_cols=3)
+        board.place_stone(Player.BLACK, Point(1, 1))
+        board.place_stone(Player.WHITE, Point(2, 3))
+
+        assert board.colors() == bytes([
+            3, 3, 3, 3, 3,
+            3, 1, 0, 0, 3,
+            3, 0, 0, 2, 3,
+            3, 3, 3, 3, 3,
+        ])
+
 
 # TODO
 class TestGameState:
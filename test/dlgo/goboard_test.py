@@ -1,3 +1,4 @@
+import random
 import pytest
 from test.helpers import is_equal_unordered
 from dlgo.gotypes import Point, Player
@@ -106,9 +107,14 @@ class TestGoString:
 
 # TODO: should probably split up into unit tests and integration tests
 class TestBoard:
+    # board implementations other than dlgo.goboard.Board can reuse these tests by overriding this fixture
     @pytest.fixture(scope="class")
-    def board(self) -> Board:
-        return Board(
+    def board_class(self) -> type:
+        return Board
+
+    @pytest.fixture(scope="class")
+    def board(self, board_class) -> Board:
+        return board_class(
             num_rows=4,
             num_cols=4
         )
@@ -122,8 +128,8 @@ class TestBoard:
         return Point(2, 3)
 
     @pytest.fixture(scope="class")
-    def partially_captured_string_board(self) -> Board:
-        board = Board(num_rows=4, num_cols=4)
+    def partially_captured_string_board(self, board_class) -> Board:
+        board = board_class(num_rows=4, num_cols=4)
         # Place white in the middle
         board.place_stone(player=Player.WHITE, point=Point(2, 2))
 
@@ -171,38 +177,235 @@ class TestBoard:
         black_string = board.get_go_string(capture_point)
         assert point in black_string.liberties
 
+    @pytest.mark.parametrize("num_rows,num_cols", [(21, 21), (25, 25), (9, 13)])
+    def test_large_and_non_square_boards(self, board_class, num_rows, num_cols):
+        board = board_class(num_rows=num_rows, num_cols=num_cols)
+        corner = Point(num_rows, num_cols)
+        board.place_stone(Player.BLACK, corner)
+        board.place_stone(Player.WHITE, Point(num_rows - 1, num_cols))
+        board.place_stone(Player.WHITE, Point(num_rows, num_cols - 1))
+
+        assert not board.is_point_occupied(corner)
+        assert board.zobrist_hash() == EMPTY_BOARD ^ \
+            hash_code(Point(num_rows - 1, num_cols), Player.WHITE) ^ hash_code(Point(num_rows, num_cols - 1), Player.WHITE)
+
+    def test_point_at(self, board_class):
+        board = board_class(num_rows=4, num_cols=4)
+
+        assert board.point_at(Point(3, 2).index) is Point(3, 2)
+        with pytest.raises(AssertionError):
+            board.point_at(Point(5, 1).index)
+
+    def test_copy_is_independent(self, board_class, point, capture_point):
+        board = board_class(num_rows=4, num_cols=4)
+        board.place_stone(Player.WHITE, point)
+
+        board_copy = board.copy()
+        board_copy.place_stone(Player.BLACK, capture_point)
+
+        assert board_copy.get_go_string(point) == GoString(Player.WHITE, [point], [
+            Point(1, 2), Point(3, 2), Point(2, 1)])
+        assert board.get_go_string(point).liberties == set(point.neighbors())
+        assert not board.is_point_occupied(capture_point)
+        assert board.zobrist_hash() != board_copy.zobrist_hash()
+
+    def test_undo_matches_fresh_replay(self, board_class):
+        # plays random stones in place, taking back a few now and then, and compares the board after every step with a
+        # board that has the remaining stones placed from scratch
+        rng = random.Random(99)
+        board = board_class(num_rows=6, num_cols=6)
+        points = [Point(row, col) for row in range(1, 7) for col in range(1, 7)]
+        placed: list[tuple[Player, Point]] = []
+        player = Player.BLACK
+
+        for _ in range(300):
+            legal_points = board.legal_points(player)
+            if placed and (not legal_points or rng.random() < 0.3):
+                for _ in range(rng.randint(1, min(4, len(placed)))):
+                    board.undo()
+                    player, _ = placed.pop()
+            else:
+                point = rng.choice(sorted(legal_points))
+                board.play_in_place(player, point)
+                placed.append((player, point))
+                player = player.other
+
+            fresh = board_class(num_rows=6, num_cols=6)
+            for stone_player, point in placed:
+                fresh.place_stone(stone_player, point)
+            assert board.num_undoable == len(placed)
+            assert board.zobrist_hash() == fresh.zobrist_hash()
+            assert set(board.empty_points()) == set(fresh.empty_points())
+            for legal_player in Player:
+                assert board.legal_points(legal_player) == fresh.legal_points(legal_player)
+            for point in points:
+                assert board.get_go_string(point) == fresh.get_go_string(point)
+
+    def test_undo_restores_captures(self, board_class, point, capture_point):
+        # the class-scoped fixture board gets captured by an earlier test, so the same position is built here
+        board = board_class(num_rows=4, num_cols=4)
+        board.place_stone(Player.WHITE, point)
+        for black_point in [Point(2, 1), Point(1, 2), Point(3, 2)]:
+            board.place_stone(Player.BLACK, black_point)
+        empty_points = list(board.empty_points())
+        zobrist_hash = board.zobrist_hash()
+
+        board.play_in_place(Player.BLACK, capture_point)
+        assert not board.is_point_occupied(point)
+        board.undo()
+
+        assert board.get_go_string(point) == GoString(Player.WHITE, [point], [capture_point])
+        assert not board.is_point_occupied(capture_point)
+        assert board.zobrist_hash() == zobrist_hash
+        assert is_equal_unordered(board.empty_points(), empty_points)
+
+    def test_undo_needs_a_move(self, board_class, point):
+        board = board_class(num_rows=4, num_cols=4)
+        with pytest.raises(ValueError):
+            board.undo()
+
+        board.play_in_place(Player.BLACK, point)
+        # a copy starts a history of its own
+        board_copy = board.copy()
+        assert board_copy.num_undoable == 0
+        with pytest.raises(ValueError):
+            board_copy.undo()
+
+        board.undo()
+        assert board.num_undoable == 0
+        with pytest.raises(ValueError):
+            board.undo()
+
+    def test_legal_points_match_scan(self, board_class):
+        # plays random stones on a few boards and their copies, taking some back, and compares the legal points with a
+        # scan of every empty point. Copies keep playing after the original has moved on, and the other way round.
+        rng = random.Random(7)
+        points = [Point(row, col) for row in range(1, 6) for col in range(1, 6)]
+        boards = [board_class(num_rows=5, num_cols=5)]
+
+        for _ in range(400):
+            board = rng.choice(boards)
+            if rng.random() < 0.1 and len(boards) < 8:
+                boards.append(board.copy())
+                continue
+            if board.num_undoable and rng.random() < 0.2:
+                board.undo()
+            else:
+                player = rng.choice(list(Player))
+                legal_points = board.legal_points(player)
+                if legal_points:
+                    board.play_in_place(player, rng.choice(sorted(legal_points)))
+
+            board = rng.choice(boards)
+            for player in Player:
+                assert board.legal_points(player) == {
+                    point for point in points
+                    if not board.is_point_occupied(point) and not board.is_self_capture(player, point)
+                }
+
+    def test_num_liberties(self, board_class):
+        board = board_class(num_rows=4, num_cols=4)
+        board.place_stone(Player.BLACK, Point(1, 1))
+        board.place_stone(Player.BLACK, Point(1, 2))
+        board.place_stone(Player.WHITE, Point(2, 1))
+
+        assert board.num_liberties(Point(1, 1)) == board.num_liberties(Point(1, 2)) == 2
+        assert board.num_liberties(Point(2, 1)) == 2
+        assert board.num_liberties(Point(3, 3)) == 0
+
+        board.place_stone(Player.WHITE, Point(1, 3))
+        board.place_stone(Player.WHITE, Point(2, 2))
+        assert board.get_player(Point(1, 1)) is None
+        assert board.num_liberties(Point(2, 1)) == 5
+
+    def test_colors_match_get_player(self, board_class):
+        # colors() is the padded board of gotypes.color_table, kept in step with the stones across copies and undo
+        rng = random.Random(3)
+        num_rows, num_cols = 5, 4
+        stride = num_cols + 2
+        boards = [board_class(num_rows=num_rows, num_cols=num_cols)]
+
+        for _ in range(200):
+            board = rng.choice(boards)
+            if rng.random() < 0.1 and len(boards) < 4:
+                boards.append(board.copy())
+            elif board.num_undoable and rng.random() < 0.2:
+                board.undo()
+            else:
+                player = rng.choice(list(Player))
+                legal_points = board.legal_points(player)
+                if legal_points:
+                    board.play_in_place(player, rng.choice(sorted(legal_points)))
+
+            board = rng.choice(boards)
+            colors = board.colors()
+            assert len(colors) == (num_rows + 2) * stride
+            for row in range(num_rows + 2):
+                for col in range(stride):
+                    point = Point(row, col)
+                    if board.is_on_grid(point):
+                        player = board.get_player(point)
+                        assert colors[row * stride + col] == (0 if player is None else player.value)
+                    else:
+                        assert colors[row * stride + col] == 3
+
+    def test_legal_points_check_does_not_grow_with_string_size(self, board_class):
+        # a move next to a long string that stays out of atari only re-checks the points around it, so that moves do
+        # not get slower as strings grow (see benchmark.py for timings)
+        board = board_class(num_rows=19, num_cols=19)
+        for col in range(1, 20):
+            board.place_stone(Player.BLACK, Point(10, col))
+        board.legal_points(Player.BLACK)
+
+        checked = set()
+        is_self_capture = board.is_self_capture
+
+        def counting_is_self_capture(player: Player, point: Point) -> bool:
+            checked.add(point)
+            return is_self_capture(player, point)
+
+        board.is_self_capture = counting_is_self_capture
+        board.place_stone(Player.WHITE, Point(11, 5))
+        board.legal_points(Player.BLACK)
+        assert len(checked) <= 5
+
 
 # TODO
 class TestGameState:
+    # GameState implementations other than dlgo.goboard.GameState can reuse these tests by overriding this fixture
+    @pytest.fixture(scope="class")
+    def game_state_class(self) -> type:
+        return GameState
+
     @pytest.fixture(scope="function")
-    def game_state(self) -> GameState:
+    def game_state(self, game_state_class) -> GameState:
         # returns new GameState with 4x4 board
 
-        return GameState.new_game(board_size=4)
+        return game_state_class.new_game(board_size=4)
 
     @pytest.fixture(scope="function")
-    def game_state_resign(self) -> GameState:
+    def game_state_resign(self, game_state_class) -> GameState:
         # returns a new GameState, last move is a resignation
 
-        game_state = GameState.new_game(board_size=4)
+        game_state = game_state_class.new_game(board_size=4)
         return game_state.apply_move(Move.resign_turn())
 
     @pytest.fixture(scope="function")
-    def game_state_pass(self) -> GameState:
+    def game_state_pass(self, game_state_class) -> GameState:
         # returns a new GameState, last move is a pass
 
-        game_state = GameState.new_game(board_size=4)
+        game_state = game_state_class.new_game(board_size=4)
         return game_state.apply_move(Move.pass_turn())
 
     @pytest.fixture(scope="function")
-    def game_state_play(self) -> GameState:
+    def game_state_play(self, game_state_class) -> GameState:
         # returns a new GameState, last move is a play: Point(1, 1)
 
-        game_state = GameState.new_game(board_size=4)
+        game_state = game_state_class.new_game(board_size=4)
         return game_state.apply_move(Move.play(Point(1, 1)))
 
     @pytest.fixture(scope="function")
-    def game_state_self_capture(self) -> GameState:
+    def game_state_self_capture(self, game_state_class) -> GameState:
         # returns a game_state s.t. placing a stone at point(2, 1) will violate self-capture rule
         """
         Final board position: 
@@ -215,8 +418,8 @@ class TestGameState:
         | 4
         """
 
-        game_state = GameState.new_game(board_size=4)
-        return GameState.apply_sequence(
+        game_state = game_state_class.new_game(board_size=4)
+        return game_state_class.apply_sequence(
             init_state=game_state,
             moves=[
                 Move.play(Point(2, 2)),
@@ -233,7 +436,7 @@ class TestGameState:
         )
 
     @pytest.fixture(scope="function")
-    def game_state_ko(self) -> GameState:
+    def game_state_ko(self, game_state_class) -> GameState:
         # an example of situational super-ko taken from the book.
         # returns a GameState s.t. playing Point(x, x) violates situational super-ko
         """
@@ -257,9 +460,9 @@ class TestGameState:
 
         Thus, if black plays Point(3, 2), it should violate ko by bringing the board back to a previous position
         """
-        game_state = GameState.new_game(board_size=5)
+        game_state = game_state_class.new_game(board_size=5)
 
-        return GameState.apply_sequence(
+        return game_state_class.apply_sequence(
             init_state=game_state,
             moves=[
                 Move.play(Point(1, 2)),
@@ -311,5 +514,96 @@ class TestGameState:
         assert not game_state_self_capture.is_valid_move(
             Move.play(Point(2, 1)))
 
+    def test_can_capture_on_point_without_liberties(self, game_state_class):
+        """
+        - - - - -
+        |   A B C
+        | 1 . x o
+        | 2 x o
+        | 3 o
+
+        White playing Point(1, 1) has no empty neighbors, but captures both black stones.
+        """
+        game_state = game_state_class.apply_sequence(
+            init_state=game_state_class.new_game(board_size=3),
+            moves=[
+                Move.play(Point(1, 2)),
+                Move.play(Point(1, 3)),
+                Move.play(Point(2, 1)),
+                Move.play(Point(2, 2)),
+                Move.pass_turn(),
+                Move.play(Point(3, 1)),
+                Move.pass_turn(),
+            ]
+        )
+        move = Move.play(Point(1, 1))
+
+        assert game_state.is_valid_move(move)
+        expected_hash = game_state.board.hash_after_move(Player.WHITE, Point(1, 1))
+        assert game_state.apply_move(move).board.zobrist_hash() == expected_hash
+
+    def test_situation_hash_includes_side_to_move(self, game_state_play):
+        passed = game_state_play.apply_move(Move.pass_turn())
+
+        assert passed.board.zobrist_hash() == game_state_play.board.zobrist_hash()
+        assert passed.situation_hash() != game_state_play.situation_hash()
+        assert passed.situation_hash() == passed.board.zobrist_hash()
+
+    def test_situation_hash_of_transpositions(self, game_state):
+        first = GameState.apply_sequence(game_state, [Move.play(Point(1, 1)), Move.play(Point(4, 4)),
+                                                      Move.play(Point(2, 2))])
+        second = GameState.apply_sequence(game_state, [Move.play(Point(2, 2)), Move.play(Point(4, 4)),
+                                                       Move.play(Point(1, 1))])
+
+        assert first.situation_hash() == second.situation_hash()
+
+    def test_situation_hash_passes(self, game_state_pass):
+        assert game_state_pass.num_passes == 1
+        assert game_state_pass.situation_hash(include_passes=True) != game_state_pass.situation_hash()
+
+    def test_ko_point(self, game_state_ko, game_state_play):
+        assert game_state_ko.ko_point == Point(3, 2)
+        assert game_state_ko.situation_hash(include_ko=True) != game_state_ko.situation_hash()
+        assert game_state_play.ko_point is None
+        assert game_state_play.situation_hash(include_ko=True) == game_state_play.situation_hash()
+
     def test_cannot_violate_ko(self, game_state_ko):
         assert not game_state_ko.is_valid_move(Move.play(Point(3, 2)))
+
+    def test_legal_moves_match_is_valid_move(self, game_state_class):
+        # plays a random game, checking the incrementally maintained legal moves against a scan of every point
+        rng = random.Random(42)
+        game_state = game_state_class.new_game(board_size=5)
+        points = [Point(row, col) for row in range(1, 6) for col in range(1, 6)]
+
+        for _ in range(80):
+            legal_points = {move.point for move in game_state.legal_moves() if move.is_play}
+            assert legal_points == {point for point in points if game_state.is_valid_move(Move.play(point))}
+            if not legal_points:
+                break
+            game_state = game_state.apply_move(Move.play(rng.choice(sorted(legal_points))))
+
+    def test_random_game_matches_goboard(self, game_state_class):
+        # plays the same random game on this implementation and on dlgo.goboard, checking every point after every move
+        rng = random.Random(1234)
+        reference = GameState.new_game(board_size=7)
+        game_state = game_state_class.new_game(board_size=7)
+        points = [Point(row, col) for row in range(1, 8) for col in range(1, 8)]
+
+        for _ in range(120):
+            candidates = [point for point in points if reference.is_valid_move(Move.play(point))]
+            if not candidates:
+                break
+            move = Move.play(rng.choice(candidates))
+            reference = reference.apply_move(move)
+            game_state = game_state.apply_move(move)
+
+            assert game_state.board.zobrist_hash() == reference.board.zobrist_hash()
+            empty_points = game_state.board.empty_points()
+            assert len(empty_points) == len(set(empty_points))
+            assert set(empty_points) == {point for point in points if reference.board.get_player(point) is None}
+            for point in points:
+                assert game_state.board.get_player(point) == reference.board.get_player(point)
+                expected = reference.board.get_go_string(point)
+                if expected is not None:
+                    assert game_state.board.get_go_string(point) == expected
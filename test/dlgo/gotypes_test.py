@@ -1,5 +1,8 @@
+import copy
+import pickle
 import pytest
-from dlgo.gotypes import Player, Point
+from dlgo.gotypes import Player, Point, MAX_BOARD_SIZE, EmptyPoints, neighbor_table, corner_table, \
+    neighborhood_table
 from test.helpers import is_equal_unordered
 
 
@@ -64,3 +67,92 @@ class TestPoint:
         ]
 
         assert is_equal_unordered(expected_output, test_point.corners())
+
+    def test_points_are_interned(self, test_row, test_col):
+        point = Point(test_row, test_col)
+
+        assert point is Point(test_row, test_col)
+        assert point is copy.deepcopy(point)
+        assert point is pickle.loads(pickle.dumps(point))
+        assert point.neighbors()[0] is Point(test_row - 1, test_col)
+
+    def test_index_round_trip(self):
+        for row in range(1, MAX_BOARD_SIZE + 1):
+            for col in range(1, MAX_BOARD_SIZE + 1):
+                point = Point(row, col)
+                assert 0 <= point.index < MAX_BOARD_SIZE * MAX_BOARD_SIZE
+                assert Point.from_index(point.index) is point
+
+
+class TestTables:
+    def test_neighbor_table_is_on_grid_only(self):
+        table = neighbor_table(3, 4)
+
+        assert len(table) == 12
+        assert is_equal_unordered(table[Point(1, 1)], [Point(2, 1), Point(1, 2)])
+        assert is_equal_unordered(table[Point(2, 2)], Point(2, 2).neighbors())
+        assert is_equal_unordered(table[Point(3, 4)], [Point(2, 4), Point(3, 3)])
+
+    def test_corner_table_is_on_grid_only(self):
+        table = corner_table(3, 4)
+
+        assert table[Point(1, 1)] == (Point(2, 2),)
+        assert is_equal_unordered(table[Point(2, 2)], Point(2, 2).corners())
+        assert is_equal_unordered(table[Point(1, 4)], [Point(2, 3)])
+
+    def test_neighborhood_table_marks_off_grid_points(self):
+        table = neighborhood_table(3, 4)
+
+        # north, east, south, west, north-east, south-east, south-west, north-west
+        assert table[Point(1, 1)] == (Point(2, 1), Point(1, 2), None, None, Point(2, 2), None, None, None)
+        assert None not in table[Point(2, 2)]
+        assert is_equal_unordered(table[Point(2, 2)], Point(2, 2).neighbors() + Point(2, 2).corners())
+
+    def test_tables_are_shared_per_size(self):
+        assert neighbor_table(9, 9) is neighbor_table(9, 9)
+        assert corner_table(9, 9) is not corner_table(9, 13)
+
+
+class TestEmptyPoints:
+    def test_starts_with_every_point(self):
+        empty_points = EmptyPoints(3, 4)
+
+        assert len(empty_points) == 12
+        assert is_equal_unordered(empty_points.points, [Point(row, col) for row in range(1, 4) for col in range(1, 5)])
+
+    def test_remove_and_add(self):
+        empty_points = EmptyPoints(3, 3)
+        empty_points.remove(Point(1, 1))
+        empty_points.remove(Point(3, 3))
+        empty_points.remove(Point(2, 2))
+
+        assert len(empty_points) == 6
+        assert Point(2, 2) not in empty_points
+        assert Point(1, 2) in empty_points
+
+        empty_points.add(Point(2, 2))
+        assert Point(2, 2) in empty_points
+        assert is_equal_unordered(empty_points.points, [Point(row, col) for row in range(1, 4) for col in range(1, 4)
+                                                        if Point(row, col) not in (Point(1, 1), Point(3, 3))])
+
+    def test_restore_undoes_remove_exactly(self):
+        empty_points = EmptyPoints(3, 3)
+        original = list(empty_points.points)
+        removed = []
+        for point in [Point(1, 1), Point(3, 3), Point(2, 2), Point(1, 3)]:
+            removed.append((point, empty_points.position(point)))
+            empty_points.remove(point)
+
+        for point, position in reversed(removed):
+            empty_points.restore(point, position)
+            assert point in empty_points
+        assert empty_points.points == original
+        assert all(empty_points.position(point) == position for position, point in enumerate(original))
+
+    def test_copy_is_independent(self):
+        empty_points = EmptyPoints(2, 2)
+        empty_points_copy = copy.deepcopy(empty_points)
+        empty_points_copy.remove(Point(1, 2))
+
+        assert Point(1, 2) in empty_points
+        assert len(empty_points) == 4
@@ -0,0 +1,75 @@
+import pytest
+from dlgo import goboard, goboard_fast, instrument, selfplay
+from dlgo.agent.naive import NaiveAgent
+from dlgo.gotypes import Point
+
+
+class TestInstrument:
+    @pytest.fixture(scope="function")
+    def counters(self):
+        instrument.reset()
+        with instrument.enabled():
+            yield
+        instrument.reset()
+
+    def test_disabled_leaves_methods_alone(self):
+        place_stone = goboard.Board.place_stone
+        violates_ko = goboard.GameState.violates_ko
+
+        with instrument.enabled():
+            assert instrument.is_enabled()
+            assert goboard.Board.place_stone is not place_stone
+            # inherited methods are only wrapped once, on the class that defines them
+            assert 'violates_ko' not in goboard_fast.GameState.__dict__
+
+        assert not instrument.is_enabled()
+        assert goboard.Board.place_stone is place_stone
+        assert goboard.GameState.violates_ko is violates_ko
+
+    @pytest.mark.parametrize('game_state_class', [goboard.GameState, goboard_fast.GameState])
+    def test_counts_captures_and_merges(self, counters, game_state_class):
+        game_state = game_state_class.new_game(board_size=3)
+        # black builds a string of two at the top, white captures it at (1, 3) and (2, 2)
+        for point in [Point(1, 1), Point(2, 1), Point(1, 2), Point(2, 2), Point(3, 3), Point(1, 3)]:
+            game_state = game_state.apply_move(goboard.Move.play(point))
+
+        snapshot = instrument.snapshot()
+        module = game_state_class.__module__.rpartition('.')[2]
+        assert snapshot['timers']['goboard.GameState.apply_move']['calls'] == 6
+        assert snapshot['timers'][f'{module}.Board.place_stone']['calls'] == 6
+        assert snapshot['captures'] == 1
+        assert snapshot['captured_stones'] == 2
+        assert snapshot['capture_sizes'] == {2: 1}
+        # (1, 2) joins (1, 1), (2, 2) joins (2, 1)
+        assert snapshot['merged_strings'] == 2
+
+        instrument.reset()
+        assert instrument.snapshot()['timers'] == {}
+        assert instrument.snapshot()['captures'] == 0
+
+    def test_agents_are_timed(self, counters):
+        game_state = goboard.GameState.new_game(board_size=5)
+        NaiveAgent().select_move(game_state)
+
+        assert instrument.snapshot()['timers']['naive.NaiveAgent.select_move']['calls'] == 1
+
+    def test_merge(self):
+        first = {'timers': {'a': {'calls': 1, 'seconds': 0.5}}, 'capture_sizes': {1: 2},
+                 'captures': 2, 'captured_stones': 2, 'merged_strings': 1}
+        second = {'timers': {'a': {'calls': 2, 'seconds': 0.25}, 'b': {'calls': 1, 'seconds': 1.0}},
+                  'capture_sizes': {1: 1, 3: 1}, 'captures': 2, 'captured_stones': 4, 'merged_strings': 0}
+
+        assert instrument.merge([first, second]) == {
+            'timers': {'a': {'calls': 3, 'seconds': 0.75}, 'b': {'calls': 1, 'seconds': 1.0}},
+            'capture_sizes': {1: 3, 3: 1},
+            'captures': 4,
+            'captured_stones': 6,
+            'merged_strings': 1,
+        }
+
+    def test_selfplay_records_counters_per_game(self):
+        record = selfplay.play_game(0, 'naive', 'naive', board_size=5, seed=1, instrumented=True)
+
+        assert not instrument.is_enabled()
+        assert record.counters['timers']['naive.NaiveAgent.select_move']['calls'] == record.num_moves
+        assert selfplay.play_game(0, 'naive', 'naive', board_size=5, seed=1).counters is None
@@ -0,0 +1,130 @@
+import random
+import pytest
+from dlgo import goboard, patterns
+from dlgo.agent.naive import NaiveAgent
+from dlgo.gotypes import Point, Player
+
+
+def fresh_pattern(board, point):
+    # the pattern of point, read off the board from scratch with get_player and get_go_string
+    diagram = []
+    for d_row in (1, 0, -1):
+        row = ''
+        for d_col in (-1, 0, 1):
+            neighbor = Point(point.row + d_row, point.col + d_col)
+            if (d_row, d_col) == (0, 0):
+                row += '*'
+            elif not board.is_on_grid(neighbor):
+                row += '#'
+            elif board.get_player(neighbor) is None:
+                row += '.'
+            else:
+                char = 'X' if board.get_player(neighbor) == Player.BLACK else 'O'
+                in_atari = abs(d_row) + abs(d_col) == 1 and board.get_go_string(neighbor).num_liberties == 1
+                row += char.lower() if in_atari else char
+        diagram.append(row)
+    return patterns.pattern_from_diagram('\n'.join(diagram))
+
+
+class TestPatterns:
+    def test_diagram(self):
+        pattern = patterns.pattern_from_diagram('''
+            Xo.
+            .*.
+            ###
+        ''')
+        # north is a white stone in atari, north-west a black stone, the south row is off the board
+        assert pattern == (
+            (2 << 0) | (3 << 4) | (1 << 14) | (3 << 10) | (3 << 12) | (1 << patterns.ATARI_SHIFT)
+        )
+        assert patterns.pattern_from_diagram('... .*. ...') == patterns.EMPTY
+
+        with pytest.raises(ValueError):
+            patterns.pattern_from_diagram('x.. .*. ...')
+        with pytest.raises(ValueError):
+            patterns.pattern_from_diagram('.. .*. ...')
+
+    def test_symmetries(self):
+        corner = patterns.pattern_from_diagram('### #*X #..')
+        assert len(patterns.symmetries(corner)) == 8
+        assert patterns.pattern_from_diagram('### X*# ..#') in patterns.symmetries(corner)
+        # symmetric along the diagonal
+        assert len(patterns.symmetries(patterns.pattern_from_diagram('### #*. #.X'))) == 4
+        assert patterns.symmetries(patterns.pattern_from_diagram('X.X .*. X.X')) == \
+            {patterns.pattern_from_diagram('X.X .*. X.X')}
+
+        assert patterns.swap_colors(patterns.pattern_from_diagram('Xo. .*. ###')) == \
+            patterns.pattern_from_diagram('Ox. .*. ###')
+
+    def test_board_keeps_patterns_up_to_date(self):
+        random.seed(7)
+        agent = NaiveAgent()
+        game_state = goboard.GameState.new_game(7)
+        while not game_state.is_over():
+            game_state = game_state.apply_move(agent.select_move(game_state))
+            board = game_state.board
+            # look at a few points every move, so that stale and fresh patterns are mixed
+            for point in random.sample(board.empty_points(), min(5, len(board.empty_points()))):
+                assert board.pattern(point) == fresh_pattern(board, point)
+
+        for point in game_state.board.empty_points():
+            assert game_state.board.pattern(point) == fresh_pattern(game_state.board, point)
+
+    def test_undo_marks_patterns_stale(self):
+        board = goboard.Board(5, 5)
+        for player, point in [(Player.WHITE, Point(3, 3)), (Player.BLACK, Point(3, 2)), (Player.BLACK, Point(4, 3)),
+                              (Player.BLACK, Point(3, 4))]:
+            board.place_stone(player, point)
+        before = {point: board.pattern(point) for point in board.empty_points()}
+
+        board.play_in_place(Player.BLACK, Point(2, 3))
+        assert board.pattern(Point(3, 3)) == patterns.pattern_from_diagram('.X. X*X .X.')
+        board.undo()
+
+        assert {point: board.pattern(point) for point in board.empty_points()} == before
+
+    def test_copies_are_independent(self):
+        board = goboard.Board(5, 5)
+        assert board.pattern(Point(3, 3)) == patterns.EMPTY
+        copy = board.copy()
+        copy.place_stone(Player.BLACK, Point(4, 3))
+
+        assert board.pattern(Point(3, 3)) == patterns.EMPTY
+        assert copy.pattern(Point(3, 3)) == patterns.pattern_from_diagram('.X. .*. ...')
+
+    def test_patterns_are_built_on_demand_and_shared(self):
+        board = goboard.Board(5, 5)
+        board.place_stone(Player.BLACK, Point(4, 3))
+        assert board.copy()._patterns is None
+
+        assert board.pattern(Point(3, 3)) == patterns.pattern_from_diagram('.X. .*. ...')
+        copy = board.copy()
+        assert copy._patterns is board._patterns
+        # the first write copies the list, and the original keeps its patterns
+        copy.place_stone(Player.WHITE, Point(3, 4))
+        assert copy._patterns is not board._patterns
+        assert copy.pattern(Point(3, 3)) == patterns.pattern_from_diagram('.X. .*O ...')
+        assert board.pattern(Point(3, 3)) == patterns.pattern_from_diagram('.X. .*. ...')
+
+    def test_table(self):
+        table = patterns.PatternTable(default=1.0)
+        # capturing a stone in atari is good, filling in an eye in the corner is not
+        table.add('XoX .*. O..', 10.0)
+        table.add(patterns.pattern_from_diagram('### #*X #X.'), 0.0)
+        assert len(table) == 8 + 4
+
+        board = goboard.Board(5, 5)
+        for player, point in [(Player.WHITE, Point(3, 3)), (Player.BLACK, Point(3, 2)), (Player.BLACK, Point(4, 3)),
+                              (Player.BLACK, Point(3, 4)), (Player.WHITE, Point(1, 2)), (Player.WHITE, Point(2, 1))]:
+            board.place_stone(player, point)
+
+        # black captures at (2, 3), which is a different pattern for white
+        assert table.weight(board, Point(2, 3), Player.BLACK) == 10.0
+        assert table.weight(board, Point(2, 3), Player.WHITE) == 1.0
+        # (1, 1) is white's eye
+        assert table.weight(board, Point(1, 1), Player.WHITE) == 0.0
+        assert table.weight(board, Point(1, 1), Player.BLACK) == 1.0
+        assert table.weights(board, [Point(2, 3), Point(1, 1)], Player.WHITE) == [1.0, 0.0]
+
+        assert table.choose(board, [Point(2, 3), Point(1, 1)], Player.WHITE) == Point(2, 3)
+        assert table.choose(board, [Point(1, 1)], Player.WHITE) is None
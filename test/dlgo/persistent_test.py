@@ -0,0 +1,73 @@
+import random
+import pytest
+from dlgo.persistent import PersistentSet
+
+
+class CollidingKey:
+    # every instance has the same hash, to exercise full-hash collisions
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+    def __hash__(self) -> int:
+        return 42
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, CollidingKey) and self.value == other.value
+
+
+class TestPersistentSet:
+    @pytest.fixture(scope="function")
+    def items(self) -> list[int]:
+        rng = random.Random(7)
+        return [rng.getrandbits(64) for _ in range(2000)]
+
+    def test_empty(self):
+        empty = PersistentSet()
+
+        assert len(empty) == 0
+        assert 1 not in empty
+        assert list(empty) == []
+
+    def test_with_item_matches_set(self, items):
+        persistent = PersistentSet()
+        for item in items:
+            persistent = persistent.with_item(item)
+
+        assert len(persistent) == len(set(items))
+        assert set(persistent) == set(items)
+        for item in items:
+            assert item in persistent
+        assert -1 not in persistent
+
+    def test_old_versions_are_unchanged(self, items):
+        versions = [PersistentSet()]
+        for item in items[:200]:
+            versions.append(versions[-1].with_item(item))
+
+        for size, version in enumerate(versions):
+            assert len(version) == size
+            assert set(version) == set(items[:size])
+
+    def test_adding_existing_item_returns_same_set(self):
+        persistent = PersistentSet().with_item((1, 2))
+
+        assert persistent.with_item((1, 2)) is persistent
+
+    def test_branches_share_history(self):
+        parent = PersistentSet().with_item('a')
+        left = parent.with_item('b')
+        right = parent.with_item('c')
+
+        assert 'b' in left and 'b' not in right
+        assert 'c' in right and 'c' not in left
+        assert 'a' in left and 'a' in right
+
+    def test_full_hash_collisions(self):
+        persistent = PersistentSet()
+        for value in range(5):
+            persistent = persistent.with_item(CollidingKey(value))
+
+        assert len(persistent) == 5
+        assert CollidingKey(3) in persistent
+        assert CollidingKey(7) not in persistent
+        assert persistent.with_item(CollidingKey(3)) is persistent
@@ -0,0 +1,58 @@
+import pytest
+from dlgo import goboard, goboard_fast, bitboard, scoring
+from dlgo.goboard import Move
+from dlgo.gotypes import Point, Player
+
+
+def play(game_state, points):
+    for point in points:
+        game_state = game_state.apply_move(Move.play(point))
+    return game_state
+
+
+class TestScoring:
+    @pytest.mark.parametrize('game_state_class', [goboard.GameState, goboard_fast.GameState, bitboard.GameState])
+    def test_counts_stones_and_territory(self, game_state_class):
+        game_state = play(game_state_class.new_game(3),
+                          [Point(1, 2), Point(3, 2), Point(2, 2), Point(3, 1), Point(2, 1), Point(3, 3)])
+        # black: 3 stones and (1, 1), white: 3 stones. (1, 3) and (2, 3) touch both colors
+        result = scoring.compute_game_result(game_state, komi=0.5)
+
+        assert (result.b, result.w) == (4, 3)
+        assert result.winner == Player.BLACK
+        assert result.winning_margin == 0.5
+        assert str(result) == 'B+0.5'
+        assert scoring.compute_game_result(game_state, komi=3.5).winner == Player.WHITE
+
+    def test_large_regions(self):
+        # a black wall on column 3 and a white wall on column 5 of a 7x7 board split it into three regions
+        board = goboard.Board(7, 7)
+        for row in range(1, 8):
+            board.place_stone(Player.BLACK, Point(row, 3))
+            board.place_stone(Player.WHITE, Point(row, 5))
+        game_state = goboard.GameState(board, Player.BLACK, None, None)
+
+        black_territory, white_territory = scoring.territory(board)
+        assert black_territory.sum() == 14 and black_territory[:, :2].all()
+        assert white_territory.sum() == 14 and white_territory[:, 5:].all()
+        # column 4 touches both walls
+        assert not black_territory[:, 3].any() and not white_territory[:, 3].any()
+
+        result = scoring.compute_game_result(game_state, komi=7.5)
+        assert (result.b, result.w) == (21, 21)
+        assert str(result) == 'W+7.5'
+
+    def test_draw(self):
+        # with an integer komi the points can be equal, and then nobody wins
+        result = scoring.GameResult(b=12, w=7, komi=5)
+
+        assert result.winner is None
+        assert result.winning_margin == 0
+        assert str(result) == '0'
+        assert scoring.GameResult(b=12, w=7, komi=4.5).winner == Player.BLACK
+
+    def test_empty_board_is_neutral(self):
+        result = scoring.compute_game_result(goboard.GameState.new_game(9), komi=0.5)
+
+        assert (result.b, result.w) == (0, 0)
+        assert result.winner == Player.WHITE
@@ -0,0 +1,72 @@
+import pytest
+from dlgo import selfplay
+from dlgo.agent.mcts import MCTSAgent
+from dlgo.agent.naive import NaiveAgent
+from dlgo.gotypes import Player
+
+
+class TestSelfPlay:
+    def test_make_agent(self):
+        assert isinstance(selfplay.make_agent('naive'), NaiveAgent)
+
+        agent = selfplay.make_agent('mcts:num_playouts=20, exploration=0.5,reuse_tree=False')
+        assert isinstance(agent, MCTSAgent)
+        assert agent.num_playouts == 20
+        assert agent.exploration == 0.5
+        assert agent.reuse_tree is False
+
+        with pytest.raises(ValueError):
+            selfplay.make_agent('gnugo')
+
+    def test_seeded_games_repeat(self):
+        record = selfplay.play_game(3, 'naive', 'naive', board_size=5, seed=10)
+
+        assert record.game == 3
+        assert record.winner is not None
+        assert record._replace(seconds=0) == selfplay.play_game(3, 'naive', 'naive', board_size=5, seed=10)._replace(
+            seconds=0)
+
+    def test_recorded_moves(self):
+        record = selfplay.play_game(0, 'naive', 'naive', board_size=5, seed=4, record_moves=True)
+
+        assert len(record.moves) == record.num_moves
+        assert selfplay.sgf_result(record) == ('B+' if record.winner == Player.BLACK else 'W+') + f'{record.margin:g}'
+        assert selfplay.sgf_result(record._replace(resigned=True)) in ('B+R', 'W+R')
+        assert selfplay.play_game(0, 'naive', 'naive', board_size=5, seed=4).moves is None
+
+    def test_max_moves_leaves_game_unfinished(self):
+        record = selfplay.play_game(0, 'naive', 'naive', board_size=9, max_moves=10)
+
+        assert record.num_moves == 10
+        assert record.winner is None
+        assert selfplay.sgf_result(record) == '?'
+
+    def test_draw(self):
+        record = selfplay.GameRecord(0, None, 30, 2, False, 0.0, margin=0)
+        stats = selfplay.SelfPlayStats()
+        stats.add(record)
+
+        assert selfplay.sgf_result(record) == '0'
+        assert stats.summary()['draws'] == 1
+        assert stats.summary()['unfinished'] == 0
+
+    @pytest.mark.parametrize('workers', [0, 2])
+    def test_play_games(self, workers):
+        stats = selfplay.SelfPlayStats()
+        records = list(selfplay.play_games(4, 'naive', 'naive', workers=workers, board_size=5, seed=1))
+        for record in records:
+            stats.add(record)
+
+        assert sorted(record.game for record in records) == [0, 1, 2, 3]
+        summary = stats.summary()
+        assert summary['games'] == 4
+        assert summary['black_wins'] + summary['white_wins'] + summary['draws'] + summary['unfinished'] == 4
+        assert summary['moves'] == sum(record.num_moves for record in records)
+        assert summary['average_length'] == summary['moves'] / 4
+
+    def test_seeded_runs_match_across_workers(self):
+        in_process = sorted(selfplay.play_games(3, 'naive', 'naive', workers=0, board_size=5, seed=2))
+        pooled = sorted(selfplay.play_games(3, 'naive', 'naive', workers=2, board_size=5, seed=2))
+
+        assert [record._replace(seconds=0) for record in in_process] == \
+            [record._replace(seconds=0) for record in pooled]
@@ -0,0 +1,112 @@
+import io
+import pytest
+from dlgo import goboard, goboard_fast, sgf
+from dlgo.goboard import Move
+from dlgo.gotypes import Point, Player
+
+
+class TestCoordinates:
+    def test_columns_follow_utils_cols(self):
+        # column letters are utils.COLS in lower case, rows are counted from the top
+        assert sgf.sgf_to_point('aa', 19) == Point(19, 1)
+        assert sgf.sgf_to_point('sa', 19) == Point(19, 19)
+        assert sgf.sgf_to_point('is', 19) == Point(1, 9)
+        assert sgf.point_to_sgf(Point(1, 9), 19) == 'is'
+
+    def test_passes(self):
+        assert sgf.sgf_to_point('', 9) is None
+        assert sgf.sgf_to_point('tt', 19) is None
+        assert sgf.sgf_to_point('tt', 21) == Point(2, 20)
+        assert sgf.point_to_sgf(None, 9) == ''
+
+    def test_round_trip_on_large_boards(self):
+        for point in [Point(1, 1), Point(25, 25), Point(3, 21)]:
+            assert sgf.sgf_to_point(sgf.point_to_sgf(point, 25), 25) == point
+
+    def test_off_board(self):
+        with pytest.raises(ValueError):
+            sgf.sgf_to_point('jj', 9)
+
+
+class TestReadGames:
+    GAMES = (
+        '(;GM[1]FF[4]SZ[9]KM[6.5]RE[W+R]PB[Some \\] one]C[a comment\\\n with (parens) and ;]'
+        ';B[ee];W[ce]'
+        '(;B[gc];W[];B[cg])'
+        '(;B[cc]))\n'
+        'junk between games\n'
+        '(;SZ[9]AB[cc][gg]HA[2];W[ee];W[ef])'
+    )
+
+    def test_main_line_and_properties(self):
+        first, second = sgf.read_games(io.StringIO(self.GAMES))
+
+        assert first.board_size == 9
+        assert first.komi == 6.5
+        assert first.result == 'W+R'
+        assert first.properties['PB'] == ['Some ] one']
+        assert first.properties['C'] == ['a comment with (parens) and ;']
+        assert [(player, move.point) for player, move in first.moves] == [
+            (Player.BLACK, Point(5, 5)), (Player.WHITE, Point(5, 3)), (Player.BLACK, Point(7, 7)),
+            (Player.WHITE, None), (Player.BLACK, Point(3, 3)),
+        ]
+        assert first.moves[3][1].is_pass
+
+        assert second.setup == {Player.BLACK: [Point(7, 3), Point(3, 7)], Player.WHITE: []}
+        assert second.komi == 0.0
+
+    @pytest.mark.parametrize('chunk_size', [1, 3, 17, 1 << 16])
+    def test_chunk_boundaries(self, chunk_size):
+        games = list(sgf.read_games(io.StringIO(self.GAMES), chunk_size=chunk_size))
+
+        assert [len(game.moves) for game in games] == [5, 2]
+        assert games[0].properties['PB'] == ['Some ] one']
+
+    def test_truncated_file(self):
+        with pytest.raises(ValueError):
+            list(sgf.read_games(io.StringIO('(;SZ[9];B[ee];W[c')))
+
+    def test_replay(self):
+        _, handicap_game = sgf.read_games(io.StringIO(self.GAMES))
+        states = list(sgf.replay(handicap_game, goboard_fast.GameState))
+
+        assert len(states) == 3
+        assert states[0].next_player == Player.WHITE
+        assert states[0].board.get_player(Point(7, 3)) == Player.BLACK
+        # white plays twice in a row
+        assert states[-1].board.get_player(Point(5, 5)) == Player.WHITE
+        assert states[-1].board.get_player(Point(4, 5)) == Player.WHITE
+
+
+class TestWriter:
+    def test_round_trip(self, tmp_path):
+        moves = [Move.play(Point(3, 3)), Move.play(Point(7, 7)), Move.pass_turn(), Move.play(Point(1, 9)),
+                 Move.resign_turn()]
+        path = tmp_path / 'games.sgf'
+
+        with sgf.SGFWriter(path) as writer:
+            writer.write_game(moves, 9, komi=5.5, result='B+R', black='a]b')
+        # a second writer appends to the same file
+        with sgf.SGFWriter(path) as writer:
+            writer.write_game([(Player.WHITE, Move.play(Point(5, 5)))], 9, setup={Player.BLACK: [Point(3, 3)]})
+
+        first, second = sgf.read_games(path)
+        assert first.komi == 5.5
+        assert first.result == 'B+R'
+        assert first.properties['PB'] == ['a]b']
+        assert [move.point for _, move in first.moves] == [Point(3, 3), Point(7, 7), None, Point(1, 9)]
+        assert [player for player, _ in first.moves] == [Player.BLACK, Player.WHITE, Player.BLACK, Player.WHITE]
+        assert second.setup[Player.BLACK] == [Point(3, 3)]
+        assert second.moves[0][0] == Player.WHITE
+
+    def test_replays_like_the_original_game(self):
+        game_state = goboard.GameState.new_game(7)
+        moves = []
+        for point in [Point(1, 2), Point(1, 1), Point(2, 1), Point(4, 4), Point(6, 6)]:
+            moves.append(Move.play(point))
+            game_state = game_state.apply_move(moves[-1])
+
+        game, = sgf.read_games(io.StringIO(sgf.format_game(moves, 7)))
+        final_state = list(sgf.replay(game))[-1]
+        assert final_state.board.zobrist_hash() == game_state.board.zobrist_hash()
+        assert final_state.situation_hash() == game_state.situation_hash()
@@ -0,0 +1,86 @@
+import pytest
+from dlgo import goboard, tactics
+from dlgo.gotypes import Point, Player
+
+
+def make_board(black, white, board_size=9):
+    board = goboard.Board(board_size, board_size)
+    for row, col in black:
+        board.place_stone(Player.BLACK, Point(row, col))
+    for row, col in white:
+        board.place_stone(Player.WHITE, Point(row, col))
+    return board
+
+
+# a white stone at (5, 5) with liberties at (4, 5) and (5, 6). An atari at either one starts a ladder, towards the
+# lower left or the upper right corner.
+LADDER = [(6, 5), (5, 4), (4, 6)]
+
+
+class TestTactics:
+    @pytest.fixture(scope="function")
+    def reader(self):
+        return tactics.TacticsReader()
+
+    def test_ladder_on_empty_board(self, reader):
+        board = make_board(LADDER, [(5, 5)])
+        grid = {point: board.get_go_string(point) for point in board.empty_points()}
+        zobrist_hash = board.zobrist_hash()
+        empty_points = list(board.empty_points())
+
+        assert reader.is_ladder(board, Point(5, 5))
+        # the board is left exactly as it was
+        assert board.zobrist_hash() == zobrist_hash
+        assert board.empty_points() == empty_points
+        assert all(board.get_go_string(point) is string for point, string in grid.items())
+        assert board.num_undoable == 0
+
+    def test_ladder_breakers(self, reader):
+        # a white stone on the path of one ladder leaves the other one
+        assert reader.is_ladder(make_board(LADDER, [(5, 5), (3, 3)]), Point(5, 5))
+        assert not reader.is_ladder(make_board(LADDER, [(5, 5), (3, 3), (7, 7)]), Point(5, 5))
+
+    def test_escape(self, reader):
+        # black has played the atari at (4, 5), the ladder runs to the upper right
+        assert not reader.can_escape(make_board(LADDER + [(4, 5)], [(5, 5)]), Point(5, 5))
+        assert reader.can_escape(make_board(LADDER + [(4, 5)], [(5, 5), (7, 7)]), Point(5, 5))
+
+    def test_escape_by_capture(self, reader):
+        # white (3, 3) is in atari and extending at (3, 4) leaves a single liberty, but black (4, 3) is in atari too
+        black = [(4, 3), (3, 2), (2, 3), (3, 5), (2, 4)]
+        assert reader.can_escape(make_board(black, [(3, 3), (5, 3), (4, 2)], board_size=7), Point(3, 3))
+        assert not reader.can_escape(make_board(black, [(3, 3), (5, 3)], board_size=7), Point(3, 3))
+
+    def test_long_ladder_is_read_out(self, reader):
+        board = make_board([(10, 10), (9, 9), (8, 11), (8, 10)], [(9, 10)], board_size=19)
+        assert not reader.can_escape(board, Point(9, 10))
+        assert reader.can_escape(make_board([(10, 10), (9, 9), (8, 11), (8, 10)], [(9, 10), (16, 16)], 19),
+                                 Point(9, 10))
+
+    def test_cut_off_results_do_not_depend_on_query_order(self):
+        # the long ladder takes 34 moves to read out, so reading it from the start is cut off. Positions a few moves
+        # down the ladder are within reach, and must get the answer a fresh reader gives them.
+        board = make_board([(10, 10), (9, 9), (8, 11), (8, 10)], [(9, 10)], board_size=19)
+        shallow = tactics.TacticsReader(max_depth=30)
+        assert shallow.can_escape(board, Point(9, 10))
+
+        for _ in range(6):
+            assert shallow.can_escape(board, Point(9, 10)) == \
+                tactics.TacticsReader(max_depth=30).can_escape(board, Point(9, 10))
+            # white extends, black ataris on the side that keeps the ladder going
+            (liberty,) = board.get_go_string(Point(9, 10)).liberties
+            board.play_in_place(Player.WHITE, liberty)
+            for atari in sorted(board.get_go_string(Point(9, 10)).liberties):
+                board.play_in_place(Player.BLACK, atari)
+                if not tactics.TacticsReader().can_escape(board, Point(9, 10)):
+                    break
+                board.undo()
+        assert not shallow.can_escape(board, Point(9, 10))
+
+    def test_queries_must_match_liberties(self, reader):
+        board = make_board(LADDER, [(5, 5)])
+        with pytest.raises(ValueError):
+            reader.can_escape(board, Point(5, 5))
+        with pytest.raises(ValueError):
+            reader.is_ladder(board, Point(1, 1))
+        assert tactics.is_ladder(board, Point(5, 5))
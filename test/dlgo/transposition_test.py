@@ -0,0 +1,101 @@
+import pytest
+from dlgo.gotypes import Point
+from dlgo.goboard import GameState, Move
+from dlgo.transposition import TranspositionTable, ENTRY_BYTES, BUCKET_SIZE, EXACT, LOWER_BOUND, MAX_DEPTH
+
+
+class TestTranspositionTable:
+    @pytest.fixture(scope="function")
+    def table(self) -> TranspositionTable:
+        # 4 buckets of 2 slots
+        return TranspositionTable(size_bytes=8 * ENTRY_BYTES)
+
+    def test_capacity_fits_budget(self):
+        table = TranspositionTable(size_bytes=1000 * ENTRY_BYTES)
+
+        assert table.capacity * ENTRY_BYTES <= 1000 * ENTRY_BYTES
+        assert table.capacity % BUCKET_SIZE == 0
+
+    def test_store_and_probe(self, table):
+        table.store(12345, 0.5, depth=3, flag=LOWER_BOUND, move=Move.play(Point(4, 4)))
+        entry = table.probe(12345)
+
+        assert entry.value == 0.5
+        assert entry.depth == 3
+        assert entry.flag == LOWER_BOUND
+        assert entry.move.point == Point(4, 4)
+        assert table.probe(54321) is None
+        assert table.hits == 1
+        assert table.misses == 1
+
+    def test_pass_and_no_move(self, table):
+        table.store(1, 1.0, depth=0, move=Move.pass_turn())
+        table.store(2, 1.0, depth=0)
+
+        assert table.probe(1).move.is_pass
+        assert table.probe(2).move is None
+
+    def test_rejects_negative_depth(self, table):
+        with pytest.raises(ValueError):
+            table.store(3, 1.0, depth=-1)
+        # depths are stored as 16 bit integers
+        with pytest.raises(ValueError):
+            table.store(3, 1.0, depth=MAX_DEPTH + 1)
+
+        assert 3 not in table
+        assert len(table) == 0
+
+    def test_keeps_deeper_result_for_same_key(self, table):
+        table.store(7, 1.0, depth=5)
+        table.store(7, 2.0, depth=2)
+
+        assert table.probe(7).value == 1.0
+        assert len(table) == 1
+
+    def test_replaces_shallowest_entry_in_full_bucket(self, table):
+        # keys 0, 4 and 8 all map to bucket 0
+        table.store(0, 0.0, depth=1)
+        table.store(4, 0.0, depth=6)
+        table.store(8, 0.0, depth=3)
+
+        assert 0 not in table
+        assert 4 in table and 8 in table
+        assert table.evictions == 1
+
+    def test_replaces_stale_entries_first(self, table):
+        table.store(0, 0.0, depth=9)
+        table.new_search()
+        table.store(4, 0.0, depth=1)
+        table.store(8, 0.0, depth=1)
+
+        assert 0 not in table
+        assert 4 in table and 8 in table
+
+    def test_stale_entries_stay_stale_when_the_age_wraps(self, table):
+        table.store(0, 0.0, depth=9)
+        # ages are 16 bit, so the age comes back around to that of key 0
+        for _ in range(1 << 16):
+            table.new_search()
+        table.store(4, 0.0, depth=1)
+        table.store(8, 0.0, depth=1)
+
+        assert 0 not in table
+        assert 4 in table and 8 in table
+
+        table.store(MAX_DEPTH, 0.0, depth=MAX_DEPTH)
+        assert table.probe(MAX_DEPTH).depth == MAX_DEPTH
+
+    def test_situation_hash_keys(self, table):
+        game_state = GameState.new_game(9).apply_move(Move.play(Point(3, 3)))
+        table.store(game_state.situation_hash(), 0.25, depth=1, flag=EXACT)
+
+        passed = game_state.apply_move(Move.pass_turn())
+        assert table.probe(game_state.situation_hash()).value == 0.25
+        assert table.probe(passed.situation_hash()) is None
+
+    def test_clear(self, table):
+        table.store(3, 0.0, depth=1)
+        table.clear()
+
+        assert len(table) == 0
+        assert table.stats()['stores'] == 0
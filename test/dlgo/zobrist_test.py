@@ -0,0 +1,45 @@
+import subprocess
+import sys
+import pytest
+from dlgo.gotypes import Player, Point, MAX_BOARD_SIZE
+from dlgo import zobrist
+
+
+class TestZobrist:
+    @pytest.fixture(scope="function")
+    def all_points(self) -> list[Point]:
+        return [Point(row, col) for row in range(1, MAX_BOARD_SIZE + 1) for col in range(1, MAX_BOARD_SIZE + 1)]
+
+    def test_codes_are_unique(self, all_points):
+        codes = {zobrist.hash_code(point, player) for point in all_points for player in (Player.BLACK, Player.WHITE)}
+
+        assert len(codes) == 2 * len(all_points)
+        assert all(0 < code < 2 ** 63 for code in codes)
+
+    def test_table_matches_hash_code(self):
+        table = zobrist.hash_table(9, 13)
+
+        for row in range(1, 10):
+            for col in range(1, 14):
+                for player in (Player.BLACK, Player.WHITE):
+                    assert table[player][Point(row, col).index] == zobrist.hash_code(Point(row, col), player)
+
+    def test_codes_do_not_depend_on_board_size(self):
+        small = zobrist.hash_table(9, 9)
+        large = zobrist.hash_table(19, 19)
+
+        assert small[Player.WHITE][Point(9, 9).index] == large[Player.WHITE][Point(9, 9).index]
+
+    def test_table_is_cached_per_size(self):
+        assert zobrist.hash_table(19, 19) is zobrist.hash_table(19, 19)
+
+    def test_board_too_large(self):
+        with pytest.raises(ValueError):
+            zobrist.hash_table(MAX_BOARD_SIZE + 1, MAX_BOARD_SIZE + 1)
+
+    def test_codes_are_stable_across_processes(self):
+        script = 'from dlgo import zobrist, gotypes; ' \
+                 'print(zobrist.hash_code(gotypes.Point(4, 16), gotypes.Player.WHITE))'
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True).stdout
+
+        assert int(output) == zobrist.hash_code(Point(4, 16), Player.WHITE)